@@ -1,29 +1,93 @@
 """council-api: Multi-model LLM council across OpenRouter + native providers."""
 
-from council_api.checkpoint import CouncilCheckpointer
-from council_api.client import (
-    PROVIDERS,
-    LLMClient,
-    LLMResponseFormatError,
-    LLMServiceError,
-)
-from council_api.council import CouncilService
-from council_api.models import (
-    CouncilAssessment,
-    CouncilMeta,
-    CouncilPeerReview,
-    CouncilResult,
-)
-
-__all__ = [
-    "CouncilCheckpointer",
-    "LLMClient",
-    "LLMResponseFormatError",
-    "LLMServiceError",
-    "PROVIDERS",
-    "CouncilService",
-    "CouncilAssessment",
-    "CouncilMeta",
-    "CouncilPeerReview",
-    "CouncilResult",
-]
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from council_api.cache import (
+        MemoryResponseCache,
+        ResponseCache,
+        SQLiteResponseCache,
+    )
+    from council_api.checkpoint import (
+        CheckpointStore,
+        CouncilCheckpointer,
+        FileCheckpointStore,
+        MemoryCheckpointStore,
+        SQLiteCheckpointStore,
+    )
+    from council_api.client import (
+        PROVIDERS,
+        LLMClient,
+        LLMResponseFormatError,
+        LLMServiceError,
+    )
+    from council_api.consensus import ConsensusPolicy
+    from council_api.council import CouncilService
+    from council_api.hedging import HedgingPolicy, LatencyTracker
+    from council_api.limits import CallLimiter
+    from council_api.models import (
+        CallRecord,
+        CouncilAssessment,
+        CouncilBatchResult,
+        CouncilJob,
+        CouncilMeta,
+        CouncilPeerReview,
+        CouncilResult,
+    )
+    from council_api.prompts import PromptOptions
+    from council_api.ranking import RankingPolicy
+    from council_api.ratelimit import ProviderRateLimiter, RetryPolicy
+    from council_api.routing import ModelPerformanceStore, RoutingPolicy
+
+# Public name -> defining module. Resolved on first access (PEP 562) so that
+# ``import council_api`` and the CLI do not pay for openai/httpx/pydantic
+# until something that needs them is used.
+_EXPORTS = {
+    "MemoryResponseCache": "council_api.cache",
+    "ResponseCache": "council_api.cache",
+    "SQLiteResponseCache": "council_api.cache",
+    "CallLimiter": "council_api.limits",
+    "CallRecord": "council_api.models",
+    "CheckpointStore": "council_api.checkpoint",
+    "ConsensusPolicy": "council_api.consensus",
+    "CouncilCheckpointer": "council_api.checkpoint",
+    "FileCheckpointStore": "council_api.checkpoint",
+    "MemoryCheckpointStore": "council_api.checkpoint",
+    "SQLiteCheckpointStore": "council_api.checkpoint",
+    "LLMClient": "council_api.client",
+    "LLMResponseFormatError": "council_api.client",
+    "LLMServiceError": "council_api.client",
+    "PROVIDERS": "council_api.client",
+    "CouncilService": "council_api.council",
+    "HedgingPolicy": "council_api.hedging",
+    "LatencyTracker": "council_api.hedging",
+    "CouncilAssessment": "council_api.models",
+    "CouncilBatchResult": "council_api.models",
+    "CouncilJob": "council_api.models",
+    "CouncilMeta": "council_api.models",
+    "CouncilPeerReview": "council_api.models",
+    "CouncilResult": "council_api.models",
+    "PromptOptions": "council_api.prompts",
+    "RankingPolicy": "council_api.ranking",
+    "ProviderRateLimiter": "council_api.ratelimit",
+    "RetryPolicy": "council_api.ratelimit",
+    "ModelPerformanceStore": "council_api.routing",
+    "RoutingPolicy": "council_api.routing",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'council_api' has no attribute '{name}'")
+    import importlib
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
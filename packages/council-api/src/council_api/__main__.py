@@ -14,13 +14,35 @@ Usage:
         --system-prompt-file system.txt \\
         --user-message-file user.txt
 
+    # Run many councils from a JSONL file (one job per line)
+    council-api batch --input jobs.jsonl --output results.jsonl \\
+        --max-in-flight 16 --provider-limit openrouter=12 --model-limit openai/gpt-5=4
+
+    # Keep a warm council daemon for many small jobs
+    council-api serve --port 8765 --max-councils 8
+    curl -s localhost:8765/jobs?wait=1 -d '{"user_msg": "Review: ..."}'
+
+    # Re-aggregate archived peer reviews with another ranking method
+    council-api rerank --input results.jsonl --method bradley_terry --exclude-self --bootstrap 1000
+
+    # Benchmark orchestration offline against a fake provider
+    council-api bench --sizes 3,5,7 --widths 1,16 --councils 64 --error-rate 0.05
+    council-api bench --imports                 # check CLI startup budgets
+    council-api bench --json-parse              # JSON extraction micro-benchmark
+
     # Manage models
     council-api models                          # show available + defaults
-    council-api models --pricing                # include OpenRouter pricing
+    council-api models --pricing                # include OpenRouter pricing (cached)
+    council-api models --pricing --refresh      # revalidate the pricing cache first
     council-api models --set-defaults "m1,m2"   # set default council models
     council-api models --set-chairman "m1"      # set default chairman
     council-api models --reset                  # revert to built-in defaults
 
+With --cache, responses are cached in ~/.cache/council-api/responses.sqlite,
+so re-running a council with identical Stage 1/2 requests replays the earlier
+outputs instead of calling the models. Use --refresh-cache to call the models
+and overwrite entries.
+
 Environment:
     OPENROUTER_API_KEY  Required for council runs and pricing lookups.
 """
@@ -28,12 +50,10 @@ Environment:
 from __future__ import annotations
 
 import argparse
-import asyncio
 import json
 import os
 import sys
 
-from council_api.client import LLMClient
 from council_api.config import (
     AVAILABLE_MODELS,
     USER_CONFIG_PATH,
@@ -46,10 +66,163 @@ from council_api.config import (
 )
 
 
+# --- Response cache ---
+
+
+def _make_cache(args: argparse.Namespace):
+    """Build the response cache and mode from CLI flags (None if bypassed).
+
+    Caching is opt-in: a cached council replays earlier sampled outputs.
+    """
+    if args.no_cache or not (args.cache or args.refresh_cache):
+        return None, "bypass"
+    from council_api.cache import DEFAULT_CACHE_PATH, SQLiteResponseCache
+
+    cache = SQLiteResponseCache(args.cache_path or DEFAULT_CACHE_PATH, ttl=args.cache_ttl)
+    return cache, "refresh" if args.refresh_cache else "use"
+
+
+def _report_cache(cache) -> None:
+    if cache is None:
+        return
+    stats = cache.stats
+    if stats.hits:
+        print(
+            f"Cache: {stats.hits} response(s) replayed from earlier runs, "
+            f"{stats.misses} fetched ({cache.path}); "
+            "use --refresh-cache for fresh outputs",
+            file=sys.stderr,
+        )
+    elif stats.misses:
+        print(
+            f"Cache: {stats.misses} response(s) fetched and stored ({cache.path})",
+            file=sys.stderr,
+        )
+    cache.close()
+
+
+def _report_pool() -> None:
+    from council_api.pool import pool_stats
+
+    for origin, stats in pool_stats().items():
+        if stats.requests:
+            print(
+                f"HTTP {origin}: {stats.requests} request(s) over "
+                f"{stats.connections_opened} connection(s) ({stats.reuse_rate:.0%} reused)",
+                file=sys.stderr,
+            )
+
+
+# --- Cost accounting ---
+
+
+async def _load_prices(args: argparse.Namespace) -> dict[str, tuple[float, float]] | None:
+    if not args.costs:
+        return None
+    from council_api.config import fetch_price_table
+
+    prices = await fetch_price_table()
+    if not prices:
+        print("Warning: could not fetch OpenRouter pricing; costs unavailable.", file=sys.stderr)
+    return prices
+
+
+def _report_costs(results: list) -> None:
+    """Print per-model token, retry and cost totals to stderr."""
+    rows: dict[str, dict] = {}
+    for result in results:
+        for call in result.meta.calls:
+            row = rows.setdefault(call.model, {
+                "calls": 0, "prompt": 0, "completion": 0, "retries": 0,
+                "wall_ms": 0, "queue_ms": 0, "cost": None,
+            })
+            row["calls"] += 1
+            row["prompt"] += call.prompt_tokens
+            row["completion"] += call.completion_tokens
+            row["retries"] += call.retries + call.empty_retries + call.json_repairs
+            row["wall_ms"] += call.wall_ms
+            row["queue_ms"] += call.queue_ms
+            if call.cost_usd is not None:
+                row["cost"] = (row["cost"] or 0.0) + call.cost_usd
+    if not rows:
+        return
+    print(
+        f"{'model':45s} {'calls':>5s} {'in tok':>8s} {'out tok':>8s} "
+        f"{'retries':>7s} {'wall s':>7s} {'queue s':>7s} {'cost':>9s}",
+        file=sys.stderr,
+    )
+    total = 0.0
+    for model, row in sorted(rows.items(), key=lambda kv: -(kv[1]["cost"] or 0.0)):
+        cost = "N/A" if row["cost"] is None else f"${row['cost']:.4f}"
+        total += row["cost"] or 0.0
+        print(
+            f"{model:45s} {row['calls']:5d} {row['prompt']:8d} {row['completion']:8d} "
+            f"{row['retries']:7d} {row['wall_ms'] / 1000:7.1f} {row['queue_ms'] / 1000:7.1f} "
+            f"{cost:>9s}",
+            file=sys.stderr,
+        )
+    print(f"Estimated total cost: ${total:.4f}", file=sys.stderr)
+
+
+# --- Prompt size ---
+
+
+def _prompt_options(args: argparse.Namespace):
+    from council_api.prompts import PromptOptions
+
+    fields = None
+    if args.assessment_fields:
+        fields = tuple(f.strip() for f in args.assessment_fields.split(",") if f.strip())
+    return PromptOptions(
+        compact=args.compact_prompts,
+        fields=fields,
+        max_chars=args.max_assessment_chars,
+        cache_prefix=args.cache_prefix,
+    )
+
+
+def _routing_policy(args: argparse.Namespace):
+    if not args.route:
+        return None
+    from council_api.routing import RoutingPolicy
+
+    if args.quality_target is None:
+        return RoutingPolicy()
+    return RoutingPolicy(quality_target=args.quality_target)
+
+
+def _ranking_policy(args: argparse.Namespace):
+    from council_api.ranking import RankingPolicy
+
+    return RankingPolicy(
+        method=args.ranking_method,
+        exclude_self=args.exclude_self,
+        bootstrap=args.bootstrap,
+    )
+
+
+# --- Rate limits ---
+
+
+def _apply_rate_limits(args: argparse.Namespace) -> None:
+    """Install per-provider request/token budgets from CLI flags."""
+    from council_api.limits import parse_limit_specs
+    from council_api.ratelimit import configure_rate_limit
+
+    rpm = parse_limit_specs(args.rpm)
+    tpm = parse_limit_specs(args.tpm)
+    for provider in set(rpm) | set(tpm):
+        configure_rate_limit(
+            provider,
+            requests_per_minute=rpm.get(provider),
+            tokens_per_minute=tpm.get(provider),
+        )
+
+
 # --- Models subcommand ---
 
 
-async def _models_command(args: argparse.Namespace) -> None:
+def _models_command(args: argparse.Namespace) -> None:
     if args.reset:
         reset_council_defaults()
         print("Reset to built-in defaults.")
@@ -80,9 +253,25 @@ async def _models_command(args: argparse.Namespace) -> None:
     is_custom = USER_CONFIG_PATH.exists()
 
     if args.pricing:
+        import asyncio
+
         from council_api.config import fetch_model_pricing
+        from council_api.registry import get_model_registry
+
+        registry = get_model_registry()
 
-        models = await fetch_model_pricing()
+        async def _pricing() -> list[dict]:
+            if args.refresh:
+                await registry.refresh(force=True)
+            return await fetch_model_pricing()
+
+        models = asyncio.run(_pricing())
+        if registry.has_snapshot and registry.stale:
+            print(
+                f"Note: pricing from a snapshot {registry.age / 3600:.1f} h old "
+                "(OpenRouter unreachable).",
+                file=sys.stderr,
+            )
     else:
         models = [m.copy() for m in AVAILABLE_MODELS]
 
@@ -147,18 +336,64 @@ async def _run_command(args: argparse.Namespace) -> None:
     models = [m.strip() for m in args.models.split(",")]
     chairman = args.chairman
 
+    from council_api.client import LLMClient
     from council_api.council import CouncilService
 
-    llm = LLMClient(api_key=api_key, max_tokens=args.max_tokens)
-    council = CouncilService(llm)
+    try:
+        _apply_rate_limits(args)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    cache, cache_mode = _make_cache(args)
+    llm = LLMClient(
+        api_key=api_key, max_tokens=args.max_tokens,
+        cache=cache, cache_mode=cache_mode,
+    )
+    hedging = None
+    if args.hedge:
+        from council_api.hedging import HedgingPolicy
+
+        hedging = HedgingPolicy()
+    council = CouncilService(
+        llm, hedging=hedging, streaming=args.stream, prices=await _load_prices(args),
+        prompt_options=_prompt_options(args), routing=_routing_policy(args),
+        ranking=_ranking_policy(args),
+    )
 
     try:
-        result = await council.run_council(
-            system_prompt=system_prompt,
-            user_msg=user_msg,
-            council_models=models,
-            chairman_model=chairman,
-        )
+        if args.stream:
+            async for event in council.stream_council(
+                system_prompt=system_prompt,
+                user_msg=user_msg,
+                council_models=models,
+                chairman_model=chairman,
+                consensus=args.consensus,
+                category=args.category,
+                schema=_load_schema(args),
+            ):
+                if event["type"] == "chairman_delta":
+                    print(event["text"], end="", file=sys.stderr, flush=True)
+                elif event["type"] in ("stage1", "stage2"):
+                    print(f"[{event['type']} done in {event['ms']}ms]", file=sys.stderr)
+                elif event["type"] == "consensus":
+                    print(
+                        f"[consensus {event['score']:.3f}: using {event['model']}]",
+                        file=sys.stderr,
+                    )
+                elif event["type"] == "result":
+                    result = event["result"]
+            print(file=sys.stderr)
+        else:
+            result = await council.run_council(
+                system_prompt=system_prompt,
+                user_msg=user_msg,
+                council_models=models,
+                chairman_model=chairman,
+                consensus=args.consensus,
+                category=args.category,
+                schema=_load_schema(args),
+            )
 
         output = result.model_dump()
 
@@ -169,8 +404,319 @@ async def _run_command(args: argparse.Namespace) -> None:
         else:
             print(json.dumps(output, indent=2))
 
+        if args.costs:
+            _report_costs([result])
+
     finally:
+        await council.close()
         await llm.close()
+        _report_cache(cache)
+
+
+# --- Batch subcommand ---
+
+
+async def _batch_command(args: argparse.Namespace) -> None:
+    api_key = os.environ.get("OPENROUTER_API_KEY", "")
+    if not api_key:
+        print("Error: OPENROUTER_API_KEY environment variable not set.", file=sys.stderr)
+        sys.exit(1)
+
+    from council_api.client import LLMClient
+    from council_api.council import CouncilService
+    from council_api.limits import CallLimiter, parse_limit_specs
+    from council_api.models import CouncilJob
+
+    default_models = [m.strip() for m in args.models.split(",")]
+    schema = _load_schema(args)
+    source = sys.stdin if args.input == "-" else open(args.input)
+    jobs: list[CouncilJob] = []
+    with source:
+        for lineno, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            data.setdefault("id", str(lineno))
+            data.setdefault("system_prompt", "You are a helpful expert assistant.")
+            if "user_message" in data:
+                data.setdefault("user_msg", data.pop("user_message"))
+            data.setdefault("council_models", default_models)
+            data.setdefault("chairman_model", args.chairman)
+            if args.consensus is not None:
+                data.setdefault("options", {}).setdefault("consensus", args.consensus)
+            if schema is not None:
+                data.setdefault("options", {}).setdefault("schema", schema)
+            if args.category != "default":
+                data.setdefault("options", {}).setdefault("category", args.category)
+            jobs.append(CouncilJob(**data))
+
+    try:
+        limiter = CallLimiter(
+            args.max_in_flight,
+            per_provider=parse_limit_specs(args.provider_limit),
+            per_model=parse_limit_specs(args.model_limit),
+        )
+        _apply_rate_limits(args)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.max_connections:
+        from council_api.pool import configure_http_pool
+
+        configure_http_pool(
+            max_connections=args.max_connections,
+            max_keepalive_connections=args.max_connections,
+        )
+
+    cache, cache_mode = _make_cache(args)
+    llm = LLMClient(
+        api_key=api_key, max_tokens=args.max_tokens,
+        cache=cache, cache_mode=cache_mode,
+    )
+    council = CouncilService(
+        llm, limiter=limiter, prices=await _load_prices(args),
+        prompt_options=_prompt_options(args), routing=_routing_policy(args),
+        ranking=_ranking_policy(args),
+    )
+
+    store = None
+    if args.checkpoint_db:
+        from council_api.checkpoint import SQLiteCheckpointStore
+
+        store = SQLiteCheckpointStore(args.checkpoint_db)
+
+    try:
+        results = await council.run_council_batch(
+            jobs, max_councils=args.max_councils, sink=args.output,
+            checkpoint_store=store, resume=args.resume,
+        )
+        if not args.output:
+            for item in results:
+                print(item.model_dump_json())
+        failed = sum(1 for r in results if r.error)
+        print(
+            f"Batch finished: {len(results) - failed}/{len(results)} councils succeeded",
+            file=sys.stderr,
+        )
+        if args.costs:
+            _report_costs([r.result for r in results if r.result is not None])
+    finally:
+        await council.close()
+        await llm.close()
+        _report_cache(cache)
+        _report_pool()
+        if store is not None:
+            store.close()
+
+
+# --- Serve subcommand ---
+
+
+async def _serve_command(args: argparse.Namespace) -> None:
+    api_key = os.environ.get("OPENROUTER_API_KEY", "")
+    if not api_key:
+        print("Error: OPENROUTER_API_KEY environment variable not set.", file=sys.stderr)
+        sys.exit(1)
+
+    import asyncio
+    import signal
+
+    from council_api.client import LLMClient
+    from council_api.council import CouncilService
+    from council_api.limits import CallLimiter, parse_limit_specs
+    from council_api.server import CouncilServer
+
+    try:
+        limiter = CallLimiter(
+            args.max_in_flight,
+            per_provider=parse_limit_specs(args.provider_limit),
+            per_model=parse_limit_specs(args.model_limit),
+        )
+        _apply_rate_limits(args)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.max_connections:
+        from council_api.pool import configure_http_pool
+
+        configure_http_pool(
+            max_connections=args.max_connections,
+            max_keepalive_connections=args.max_connections,
+        )
+
+    cache, cache_mode = _make_cache(args)
+    llm = LLMClient(
+        api_key=api_key, max_tokens=args.max_tokens,
+        cache=cache, cache_mode=cache_mode,
+    )
+    hedging = None
+    if args.hedge:
+        from council_api.hedging import HedgingPolicy
+
+        hedging = HedgingPolicy()
+    council = CouncilService(
+        llm, limiter=limiter, hedging=hedging, streaming=args.stream,
+        prices=await _load_prices(args),
+        prompt_options=_prompt_options(args), routing=_routing_policy(args),
+        ranking=_ranking_policy(args),
+    )
+    options: dict = {}
+    if args.consensus is not None:
+        options["consensus"] = args.consensus
+    if (schema := _load_schema(args)) is not None:
+        options["schema"] = schema
+    if args.category != "default":
+        options["category"] = args.category
+    token = args.token or os.environ.get("COUNCIL_SERVER_TOKEN")
+    if not token and not args.socket:
+        import secrets
+
+        # Over TCP any local process can connect; require a token by default
+        token = secrets.token_urlsafe(24)
+        print(
+            f"Council server token (send 'Authorization: Bearer <token>'): {token}",
+            file=sys.stderr,
+        )
+    server = CouncilServer(
+        council,
+        defaults={
+            "council_models": [m.strip() for m in args.models.split(",")],
+            "chairman_model": args.chairman,
+            "options": options,
+        },
+        max_councils=args.max_councils,
+        token=token,
+    )
+
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    registry = None
+    if args.costs:
+        from council_api.registry import get_model_registry
+
+        # Keeps council.prices (the registry's live dict) current
+        registry = get_model_registry()
+        registry.start_background_refresh()
+
+    await server.start(host=args.host, port=args.port, socket_path=args.socket)
+    print(f"Council server listening on {server.address}", file=sys.stderr)
+    try:
+        await stop.wait()
+    finally:
+        print("Shutting down council server", file=sys.stderr)
+        if registry is not None:
+            await registry.stop_background_refresh()
+        await server.close()
+        await council.close()
+        await llm.close()
+        _report_cache(cache)
+        _report_pool()
+
+
+# --- Rerank subcommand ---
+
+
+def _rerank_command(args: argparse.Namespace) -> None:
+    from council_api.models import CouncilResult
+    from council_api.ranking import reaggregate
+
+    results: list[CouncilResult] = []
+    keys: list[str] = []
+    source = sys.stdin if args.input == "-" else open(args.input)
+    with source:
+        for lineno, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            if "job_id" in data:  # batch output line
+                if data.get("result") is None:
+                    continue
+                keys.append(data["job_id"])
+                data = data["result"]
+            else:
+                keys.append(str(lineno))
+            results.append(CouncilResult(**data))
+
+    rankings = reaggregate(results, _ranking_policy(args))
+    sink = open(args.output, "w") if args.output else sys.stdout
+    try:
+        for key, aggregate in zip(keys, rankings):
+            sink.write(json.dumps({"id": key, "aggregate_rankings": aggregate}) + "\n")
+    finally:
+        if args.output:
+            sink.close()
+    print(f"Re-ranked {len(results)} councils ({args.ranking_method})", file=sys.stderr)
+
+
+# --- Bench subcommand ---
+
+
+def _int_list(value: str) -> tuple[int, ...]:
+    return tuple(int(v) for v in value.split(",") if v.strip())
+
+
+def _imports_command(args: argparse.Namespace) -> None:
+    from dataclasses import asdict
+
+    from council_api.bench import check_import_budgets, format_import_report
+
+    results = check_import_budgets()
+    if args.json:
+        print(json.dumps([{**asdict(r), "ok": r.ok} for r in results], indent=2))
+    else:
+        print(format_import_report(results))
+    if not all(r.ok for r in results):
+        sys.exit(1)
+
+
+def _json_parse_command(args: argparse.Namespace) -> None:
+    from dataclasses import asdict
+
+    from council_api.bench import benchmark_json_parse, format_json_parse_report
+
+    results = benchmark_json_parse()
+    if args.json:
+        print(json.dumps([{**asdict(r), "speedup": round(r.speedup, 2)} for r in results], indent=2))
+    else:
+        print(format_json_parse_report(results))
+
+
+async def _bench_command(args: argparse.Namespace) -> None:
+    from council_api.bench import (
+        BenchConfig,
+        format_report,
+        results_as_dicts,
+        run_benchmark,
+    )
+    from council_api.fakeprovider import ModelProfile
+
+    config = BenchConfig(
+        council_sizes=_int_list(args.sizes),
+        batch_widths=_int_list(args.widths),
+        councils=args.councils,
+        profile=ModelProfile(
+            latency_ms=args.latency_ms,
+            latency_sigma=args.latency_sigma,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            empty_rate=args.empty_rate,
+            malformed_rate=args.malformed_rate,
+        ),
+        time_scale=args.time_scale,
+        seed=args.seed,
+        max_in_flight=args.max_in_flight,
+        streaming=args.stream,
+    )
+    results = await run_benchmark(config)
+    if args.json:
+        print(json.dumps(results_as_dicts(results), indent=2))
+    else:
+        print(format_report(results))
 
 
 def main() -> None:
@@ -185,7 +731,11 @@ def main() -> None:
     )
     models_parser.add_argument(
         "--pricing", action="store_true",
-        help="Fetch and display OpenRouter pricing.",
+        help="Display OpenRouter pricing (cached; revalidated once a day).",
+    )
+    models_parser.add_argument(
+        "--refresh", action="store_true",
+        help="With --pricing, revalidate the cached OpenRouter catalogue now.",
     )
     models_parser.add_argument(
         "--set-defaults", type=str, metavar="MODELS",
@@ -200,6 +750,211 @@ def main() -> None:
         help="Remove user config and revert to built-in defaults.",
     )
 
+    # --- batch subcommand ---
+    batch_parser = subparsers.add_parser(
+        "batch", help="Run many councils from a JSONL file of prompts.",
+    )
+    batch_parser.add_argument(
+        "--input", "-i", type=str, default="-",
+        help="JSONL file with one job per line ('-' for stdin). Keys: id, "
+        "system_prompt, user_msg, council_models, chairman_model, options.",
+    )
+    batch_parser.add_argument(
+        "--output", "-o", type=str, default=None,
+        help="JSONL file to stream results to as each council finishes "
+        "(default: print to stdout at the end).",
+    )
+    batch_parser.add_argument(
+        "--max-councils", type=int, default=8,
+        help="Maximum councils in progress at once.",
+    )
+    batch_parser.add_argument(
+        "--max-in-flight", type=int, default=None,
+        help="Global cap on concurrent LLM calls.",
+    )
+    batch_parser.add_argument(
+        "--provider-limit", action="append", metavar="PROVIDER=N",
+        help="Per-provider cap on concurrent calls (repeatable).",
+    )
+    batch_parser.add_argument(
+        "--model-limit", action="append", metavar="MODEL=N",
+        help="Per-model cap on concurrent calls (repeatable).",
+    )
+    batch_parser.add_argument(
+        "--models", type=str,
+        default=",".join(get_council_defaults()),
+        help="Default council models for jobs that do not set council_models.",
+    )
+    batch_parser.add_argument(
+        "--chairman", type=str,
+        default=get_chairman_default(),
+        help="Default chairman for jobs that do not set chairman_model.",
+    )
+    batch_parser.add_argument(
+        "--max-tokens", type=int, default=4096,
+        help="Max tokens per LLM response.",
+    )
+    _add_cache_args(batch_parser)
+    _add_rate_limit_args(batch_parser)
+    batch_parser.add_argument(
+        "--max-connections", type=int, default=None,
+        help="Connection cap per provider endpoint in the shared HTTP pool.",
+    )
+    batch_parser.add_argument(
+        "--checkpoint-db", type=str, default=None, metavar="PATH",
+        help="Checkpoint every council in this SQLite file (run ID = job id).",
+    )
+    batch_parser.add_argument(
+        "--resume", action="store_true",
+        help="With --checkpoint-db, resume each job from its checkpoint.",
+    )
+    _add_costs_arg(batch_parser)
+    _add_prompt_args(batch_parser)
+    _add_consensus_arg(batch_parser)
+    _add_schema_arg(batch_parser)
+    _add_routing_args(batch_parser)
+    _add_ranking_args(batch_parser)
+
+    # --- serve subcommand ---
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run a local council daemon with an HTTP/JSON job API.",
+    )
+    serve_parser.add_argument(
+        "--host", type=str, default="127.0.0.1", help="Address to bind (default: localhost).",
+    )
+    serve_parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on.")
+    serve_parser.add_argument(
+        "--socket", type=str, default=None, metavar="PATH",
+        help="Listen on this Unix socket instead of TCP.",
+    )
+    serve_parser.add_argument(
+        "--token", type=str, default=None,
+        help="Require 'Authorization: Bearer TOKEN' (default: $COUNCIL_SERVER_TOKEN; "
+             "over TCP a random token is generated and printed if neither is set).",
+    )
+    serve_parser.add_argument(
+        "--max-councils", type=int, default=8,
+        help="Maximum councils in progress at once; later jobs queue.",
+    )
+    serve_parser.add_argument(
+        "--max-in-flight", type=int, default=None,
+        help="Global cap on concurrent LLM calls.",
+    )
+    serve_parser.add_argument(
+        "--provider-limit", action="append", metavar="PROVIDER=N",
+        help="Per-provider cap on concurrent calls (repeatable).",
+    )
+    serve_parser.add_argument(
+        "--model-limit", action="append", metavar="MODEL=N",
+        help="Per-model cap on concurrent calls (repeatable).",
+    )
+    serve_parser.add_argument(
+        "--models", type=str,
+        default=",".join(get_council_defaults()),
+        help="Default council models for jobs that do not set council_models.",
+    )
+    serve_parser.add_argument(
+        "--chairman", type=str,
+        default=get_chairman_default(),
+        help="Default chairman for jobs that do not set chairman_model.",
+    )
+    serve_parser.add_argument(
+        "--max-tokens", type=int, default=4096,
+        help="Max tokens per LLM response.",
+    )
+    serve_parser.add_argument(
+        "--max-connections", type=int, default=None,
+        help="Connection cap per provider endpoint in the shared HTTP pool.",
+    )
+    serve_parser.add_argument(
+        "--stream", action="store_true", help="Use streaming responses.",
+    )
+    serve_parser.add_argument(
+        "--hedge", action="store_true",
+        help="Fire a duplicate Stage 1/2 request when a model exceeds its recorded p95 latency.",
+    )
+    _add_cache_args(serve_parser)
+    _add_rate_limit_args(serve_parser)
+    _add_costs_arg(serve_parser)
+    _add_prompt_args(serve_parser)
+    _add_consensus_arg(serve_parser)
+    _add_schema_arg(serve_parser)
+    _add_routing_args(serve_parser)
+    _add_ranking_args(serve_parser)
+
+    # --- rerank subcommand ---
+    rerank_parser = subparsers.add_parser(
+        "rerank", help="Re-aggregate the peer reviews of saved council results.",
+    )
+    rerank_parser.add_argument(
+        "--input", type=str, required=True,
+        help="JSONL of council results or batch output ('-' for stdin).",
+    )
+    rerank_parser.add_argument(
+        "--output", type=str, default=None,
+        help="Write one {id, aggregate_rankings} line per council here (default: stdout).",
+    )
+    _add_ranking_args(rerank_parser)
+
+    # --- bench subcommand ---
+    bench_parser = subparsers.add_parser(
+        "bench", help="Benchmark council orchestration against a local fake provider.",
+    )
+    bench_parser.add_argument(
+        "--sizes", type=str, default="3,5",
+        help="Comma-separated council sizes to benchmark.",
+    )
+    bench_parser.add_argument(
+        "--widths", type=str, default="1,8,32",
+        help="Comma-separated batch widths (councils in progress at once).",
+    )
+    bench_parser.add_argument(
+        "--councils", type=int, default=32,
+        help="Councils per (size, width) cell.",
+    )
+    bench_parser.add_argument(
+        "--latency-ms", type=float, default=500.0,
+        help="Median simulated call latency.",
+    )
+    bench_parser.add_argument(
+        "--latency-sigma", type=float, default=0.3,
+        help="Log-normal latency spread (0 = constant).",
+    )
+    bench_parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 500 probability.")
+    bench_parser.add_argument(
+        "--rate-limit-rate", type=float, default=0.0,
+        help="Probability that a request starts a 429 burst.",
+    )
+    bench_parser.add_argument(
+        "--empty-rate", type=float, default=0.0, help="Empty-completion probability.",
+    )
+    bench_parser.add_argument(
+        "--malformed-rate", type=float, default=0.0, help="Malformed-JSON probability.",
+    )
+    bench_parser.add_argument(
+        "--time-scale", type=float, default=0.01,
+        help="Multiplier applied to simulated latencies (default: 100x faster).",
+    )
+    bench_parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    bench_parser.add_argument(
+        "--max-in-flight", type=int, default=None,
+        help="Global cap on concurrent LLM calls.",
+    )
+    bench_parser.add_argument(
+        "--stream", action="store_true", help="Use streaming responses.",
+    )
+    bench_parser.add_argument(
+        "--json", action="store_true", help="Print results as JSON.",
+    )
+    bench_parser.add_argument(
+        "--imports", action="store_true",
+        help="Check CLI import-time budgets instead (exit 1 if one is exceeded).",
+    )
+    bench_parser.add_argument(
+        "--json-parse", action="store_true",
+        help="Benchmark JSON extraction on a synthetic malformed-response corpus instead.",
+    )
+
     # --- run subcommand (also the default) ---
     run_parser = subparsers.add_parser(
         "run", help="Run a council deliberation.",
@@ -212,7 +967,27 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.command == "models":
-        asyncio.run(_models_command(args))
+        _models_command(args)
+        return
+    if args.command == "rerank":
+        _rerank_command(args)
+        return
+    if args.command == "bench" and args.imports:
+        _imports_command(args)
+        return
+    if args.command == "bench" and args.json_parse:
+        _json_parse_command(args)
+        return
+
+    # Everything below talks to providers (or the fake one) on an event loop
+    import asyncio
+
+    if args.command == "batch":
+        asyncio.run(_batch_command(args))
+    elif args.command == "bench":
+        asyncio.run(_bench_command(args))
+    elif args.command == "serve":
+        asyncio.run(_serve_command(args))
     else:
         asyncio.run(_run_command(args))
 
@@ -253,6 +1028,152 @@ def _add_run_args(parser: argparse.ArgumentParser) -> None:
         "--output", "-o", type=str, default=None,
         help="Write JSON result to file instead of stdout.",
     )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Stream responses; print chairman output to stderr as it arrives.",
+    )
+    parser.add_argument(
+        "--hedge", action="store_true",
+        help="Fire a duplicate Stage 1/2 request when a model exceeds its recorded p95 latency.",
+    )
+    _add_cache_args(parser)
+    _add_rate_limit_args(parser)
+    _add_costs_arg(parser)
+    _add_prompt_args(parser)
+    _add_consensus_arg(parser)
+    _add_schema_arg(parser)
+    _add_routing_args(parser)
+    _add_ranking_args(parser)
+
+
+def _add_consensus_arg(parser: argparse.ArgumentParser) -> None:
+    """Add the --consensus flag to a parser."""
+    parser.add_argument(
+        "--consensus", type=float, default=None, metavar="THRESHOLD",
+        help="Skip peer review and synthesis when Stage 1 assessments agree at least "
+        "this well (0-1; 1.0 = identical after whitespace/case folding).",
+    )
+
+
+def _add_schema_arg(parser: argparse.ArgumentParser) -> None:
+    """Add the --schema flag to a parser."""
+    parser.add_argument(
+        "--schema", default=None, metavar="FILE",
+        help="JSON Schema file that assessments and the synthesis must match "
+        "(enforced natively by providers that support structured output).",
+    )
+
+
+def _load_schema(args: argparse.Namespace) -> dict | None:
+    if not args.schema:
+        return None
+    with open(args.schema) as f:
+        return json.load(f)
+
+
+# Mirrors council_api.ranking.METHODS; not imported so that building the
+# parser stays cheap.
+_RANKING_METHODS = ("mean", "borda", "kemeny", "bradley_terry")
+
+
+def _add_ranking_args(parser: argparse.ArgumentParser) -> None:
+    """Add the Stage 2 ranking-aggregation arguments to a parser."""
+    parser.add_argument(
+        "--ranking-method", "--method", choices=_RANKING_METHODS, default="mean",
+        help="How peer-review rankings are aggregated (default: mean position).",
+    )
+    parser.add_argument(
+        "--exclude-self", action="store_true",
+        help="Ignore each reviewer's ranking of its own assessment.",
+    )
+    parser.add_argument(
+        "--bootstrap", type=int, default=0, metavar="N",
+        help="Resample reviewers N times for rank confidence intervals.",
+    )
+
+
+def _add_routing_args(parser: argparse.ArgumentParser) -> None:
+    """Add the adaptive-routing arguments to a parser."""
+    parser.add_argument(
+        "--route", action="store_true",
+        help="Query a sub-council chosen from recorded model performance first; "
+        "escalate to all models when it disagrees.",
+    )
+    parser.add_argument(
+        "--quality-target", type=float, default=None, metavar="Q",
+        help="Expected best-assessment quality (0-1) the sub-council must reach.",
+    )
+    parser.add_argument(
+        "--category", type=str, default="default",
+        help="Prompt category for the performance history and routing.",
+    )
+
+
+def _add_prompt_args(parser: argparse.ArgumentParser) -> None:
+    """Add the Stage 2/3 prompt-size arguments to a parser."""
+    parser.add_argument(
+        "--compact-prompts", action="store_true",
+        help="Embed assessments in Stage 2/3 prompts as minified JSON.",
+    )
+    parser.add_argument(
+        "--assessment-fields", type=str, default=None, metavar="FIELDS",
+        help="Comma-separated top-level assessment fields to include in Stage 2/3 prompts.",
+    )
+    parser.add_argument(
+        "--max-assessment-chars", type=int, default=None, metavar="N",
+        help="Shorten long string values so each embedded assessment fits in N characters.",
+    )
+    parser.add_argument(
+        "--cache-prefix", action="store_true",
+        help="Mark the shared Stage 2 context for provider prompt caching (Anthropic/Gemini).",
+    )
+
+
+def _add_costs_arg(parser: argparse.ArgumentParser) -> None:
+    """Add the --costs flag to a parser."""
+    parser.add_argument(
+        "--costs", action="store_true",
+        help="Fetch OpenRouter pricing and print per-model token/cost totals to stderr.",
+    )
+
+
+def _add_rate_limit_args(parser: argparse.ArgumentParser) -> None:
+    """Add the per-provider rate-limit arguments to a parser."""
+    parser.add_argument(
+        "--rpm", action="append", metavar="PROVIDER=N",
+        help="Requests-per-minute budget for a provider (repeatable).",
+    )
+    parser.add_argument(
+        "--tpm", action="append", metavar="PROVIDER=N",
+        help="Tokens-per-minute budget for a provider (repeatable).",
+    )
+
+
+def _add_cache_args(parser: argparse.ArgumentParser) -> None:
+    """Add the response-cache arguments to a parser."""
+    parser.add_argument(
+        "--cache", action="store_true",
+        help="Serve identical requests from the response cache instead of "
+        "calling the models again (off by default).",
+    )
+    parser.add_argument(
+        "--cache-path", type=str, default=None,
+        help="SQLite file for cached LLM responses "
+        "(default: ~/.cache/council-api/responses.sqlite).",
+    )
+    parser.add_argument(
+        "--cache-ttl", type=float, default=None, metavar="SECONDS",
+        help="Treat cached responses older than this as misses.",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Bypass the response cache entirely (the default; overrides --cache).",
+    )
+    parser.add_argument(
+        "--refresh-cache", action="store_true",
+        help="Call the models and store their responses, ignoring cached ones "
+        "(implies --cache).",
+    )
 
 
 if __name__ == "__main__":
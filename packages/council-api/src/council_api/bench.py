@@ -0,0 +1,390 @@
+"""Offline benchmark of council orchestration against the fake provider.
+
+Runs batches of councils through a real ``LLMClient`` + ``CouncilService``
+whose HTTP traffic is served by ``FakeProviderTransport``, across a grid of
+council sizes and batch widths, and reports throughput, council latency
+percentiles and per-stage orchestration overhead (stage wall time minus
+the slowest call in that stage).
+
+Simulated latencies are multiplied by ``time_scale``; reported times are
+measured wall-clock times in that scaled world. Overhead is real CPU and
+scheduling time, so a small ``time_scale`` makes it stand out.
+
+    python -m council_api bench --sizes 3,5 --widths 1,16 --councils 64
+
+``check_import_budgets`` guards CLI startup instead: it imports the
+lightweight entry points in fresh interpreters under ``-X importtime`` and
+fails if one exceeds its budget or pulls in a network dependency.
+
+    python -m council_api bench --imports
+
+``benchmark_json_parse`` compares single-pass JSON extraction with the
+previous candidate-list approach on a synthetic corpus of malformed
+responses.
+
+    python -m council_api bench --json-parse
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+
+import httpx
+
+from council_api.client import LLMClient
+from council_api.council import CouncilService
+from council_api.fakeprovider import FakeProviderTransport, ModelProfile
+from council_api.jsonparse import extract_json_object, json_backend
+from council_api.limits import CallLimiter
+from council_api.models import CouncilJob, CouncilResult
+from council_api.ratelimit import RetryPolicy
+
+STAGES = ("stage1", "stage2", "stage3")
+
+# Cumulative import time budgets (ms, median of fresh interpreters) for
+# modules that must stay cheap: the package itself and the CLI entry point.
+IMPORT_BUDGETS_MS = {
+    "council_api": 25.0,
+    "council_api.config": 50.0,
+    "council_api.__main__": 150.0,
+}
+# Must not be imported by the modules above
+HEAVY_MODULES = ("openai", "httpx", "pydantic", "numpy")
+
+
+@dataclass
+class BenchConfig:
+    """Benchmark grid and simulated provider behaviour."""
+
+    council_sizes: tuple[int, ...] = (3, 5)
+    batch_widths: tuple[int, ...] = (1, 8, 32)
+    councils: int = 32
+    profile: ModelProfile = field(default_factory=ModelProfile)
+    time_scale: float = 0.01
+    seed: int = 0
+    max_in_flight: int | None = None
+    streaming: bool = False
+
+
+@dataclass
+class BenchResult:
+    """Measurements for one (council size, batch width) cell."""
+
+    council_size: int
+    batch_width: int
+    councils: int
+    failures: int
+    wall_s: float
+    councils_per_s: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    overhead_ms: dict[str, float]
+    requests: int
+    status_counts: dict[int, int]
+    peak_in_flight: int
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+def _stage_overhead(result: CouncilResult) -> dict[str, float]:
+    """Stage wall time minus its slowest completed call, per stage."""
+    meta = result.meta
+    stage_ms = {"stage1": meta.stage1_ms, "stage2": meta.stage2_ms, "stage3": meta.stage3_ms}
+    overhead = {}
+    for stage in STAGES:
+        calls = [c.wall_ms for c in meta.calls if c.stage == stage and c.status == "ok"]
+        if calls:
+            overhead[stage] = max(0.0, stage_ms[stage] - max(calls))
+    return overhead
+
+
+async def run_cell(config: BenchConfig, council_size: int, batch_width: int) -> BenchResult:
+    """Run ``config.councils`` councils of ``council_size`` models, ``batch_width`` at a time."""
+    transport = FakeProviderTransport(
+        default=config.profile, seed=config.seed, time_scale=config.time_scale,
+    )
+    http_client = httpx.AsyncClient(transport=transport)
+    llm = LLMClient(
+        api_key="fake",
+        http_client=http_client,
+        retry_policy=RetryPolicy(
+            base_delay=1.0 * config.time_scale, max_delay=60.0 * config.time_scale,
+        ),
+    )
+    limiter = CallLimiter(config.max_in_flight)
+    council = CouncilService(llm, limiter=limiter, streaming=config.streaming)
+    models = [f"fake/model-{i}" for i in range(council_size)]
+    jobs = [
+        CouncilJob(
+            id=str(i),
+            system_prompt="You are a careful reviewer. Return JSON {summary, score}.",
+            user_msg=f"Benchmark question #{i}",
+            council_models=models,
+            chairman_model=models[0],
+        )
+        for i in range(config.councils)
+    ]
+
+    t0 = perf_counter()
+    try:
+        results = await council.run_council_batch(jobs, max_councils=batch_width)
+    finally:
+        await llm.close()
+    wall = perf_counter() - t0
+
+    done = [r.result for r in results if r.result is not None]
+    totals = [float(r.meta.total_ms) for r in done]
+    overheads: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    for result in done:
+        for stage, ms in _stage_overhead(result).items():
+            overheads[stage].append(ms)
+
+    return BenchResult(
+        council_size=council_size,
+        batch_width=batch_width,
+        councils=len(jobs),
+        failures=len(results) - len(done),
+        wall_s=round(wall, 3),
+        councils_per_s=round(len(done) / wall, 2) if wall else 0.0,
+        p50_ms=_percentile(totals, 0.50),
+        p95_ms=_percentile(totals, 0.95),
+        p99_ms=_percentile(totals, 0.99),
+        overhead_ms={
+            stage: round(sum(v) / len(v), 2) for stage, v in overheads.items() if v
+        },
+        requests=transport.requests,
+        status_counts=dict(transport.status_counts),
+        peak_in_flight=limiter.peak_in_flight,
+    )
+
+
+async def run_benchmark(config: BenchConfig) -> list[BenchResult]:
+    """Run every cell of the grid sequentially."""
+    results = []
+    for size in config.council_sizes:
+        for width in config.batch_widths:
+            results.append(await run_cell(config, size, width))
+    return results
+
+
+def format_report(results: list[BenchResult]) -> str:
+    """Render results as a fixed-width table."""
+    header = (
+        f"{'size':>4s} {'width':>5s} {'ok':>5s} {'fail':>4s} {'c/s':>8s} "
+        f"{'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} "
+        f"{'ovh s1':>7s} {'ovh s2':>7s} {'ovh s3':>7s} {'reqs':>6s} {'peak':>5s}"
+    )
+    lines = [header]
+    for r in results:
+        ovh = [r.overhead_ms.get(stage, 0.0) for stage in STAGES]
+        lines.append(
+            f"{r.council_size:4d} {r.batch_width:5d} {r.councils - r.failures:5d} "
+            f"{r.failures:4d} {r.councils_per_s:8.2f} "
+            f"{r.p50_ms:8.0f} {r.p95_ms:8.0f} {r.p99_ms:8.0f} "
+            f"{ovh[0]:7.2f} {ovh[1]:7.2f} {ovh[2]:7.2f} {r.requests:6d} {r.peak_in_flight:5d}"
+        )
+    return "\n".join(lines)
+
+
+def results_as_dicts(results: list[BenchResult]) -> list[dict]:
+    return [asdict(r) for r in results]
+
+
+@dataclass
+class ImportResult:
+    """Import cost of one module in a fresh interpreter."""
+
+    module: str
+    cumulative_ms: float
+    budget_ms: float | None
+    heavy: list[str]
+
+    @property
+    def ok(self) -> bool:
+        within = self.budget_ms is None or self.cumulative_ms <= self.budget_ms
+        return within and not self.heavy
+
+
+def measure_import(module: str, *, runs: int = 5, budget_ms: float | None = None) -> ImportResult:
+    """Median cumulative ``-X importtime`` cost of ``module`` over ``runs`` interpreters."""
+    probe = (
+        f"import {module}, sys; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    timings = []
+    heavy: list[str] = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", probe],
+            capture_output=True, text=True, check=True,
+        )
+        for line in proc.stderr.splitlines():
+            # "import time: <self us> | <cumulative us> | <indented name>"
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                timings.append(int(parts[1]) / 1000)
+        heavy = [m for m in proc.stdout.strip().split(",") if m]
+    return ImportResult(
+        module=module,
+        cumulative_ms=round(statistics.median(timings), 1) if timings else 0.0,
+        budget_ms=budget_ms,
+        heavy=heavy,
+    )
+
+
+def check_import_budgets(
+    budgets: dict[str, float] | None = None, *, runs: int = 5,
+) -> list[ImportResult]:
+    """Measure every module in ``budgets`` (default ``IMPORT_BUDGETS_MS``)."""
+    budgets = IMPORT_BUDGETS_MS if budgets is None else budgets
+    return [
+        measure_import(module, runs=runs, budget_ms=budget)
+        for module, budget in budgets.items()
+    ]
+
+
+def format_import_report(results: list[ImportResult]) -> str:
+    lines = [f"{'module':24s} {'import ms':>9s} {'budget':>7s}  status"]
+    for r in results:
+        budget = f"{r.budget_ms:7.0f}" if r.budget_ms is not None else f"{'-':>7s}"
+        status = "ok" if r.ok else "FAIL"
+        if r.heavy:
+            status += f" (imports {', '.join(r.heavy)})"
+        lines.append(f"{r.module:24s} {r.cumulative_ms:9.1f} {budget}  {status}")
+    return "\n".join(lines)
+
+
+# --- JSON extraction micro-benchmark ---
+
+
+@dataclass
+class JsonParseResult:
+    """Extraction time for one corpus case, legacy vs single-pass."""
+
+    case: str
+    size_kb: float
+    legacy_us: float
+    single_pass_us: float
+    legacy_found: bool
+    single_pass_found: bool
+
+    @property
+    def speedup(self) -> float:
+        return self.legacy_us / self.single_pass_us if self.single_pass_us else 0.0
+
+
+def _legacy_extract_json(text: str) -> dict | None:
+    """The extraction ``LLMClient`` used before ``jsonparse`` (for comparison)."""
+    stripped = text.strip()
+    candidates = [stripped] if stripped else []
+    for block in re.findall(r"```(?:json)?\s*(.*?)```", stripped, flags=re.IGNORECASE | re.DOTALL):
+        if block.strip():
+            candidates.append(block.strip())
+    first, last = stripped.find("{"), stripped.rfind("}")
+    if first != -1 and last > first:
+        candidates.append(stripped[first : last + 1].strip())
+    for candidate in dict.fromkeys(candidates):
+        try:
+            parsed = json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, dict):
+            return parsed
+    return None
+
+
+def json_parse_corpus(seed: int = 0) -> dict[str, str]:
+    """Synthetic responses shaped like the malformed outputs models produce.
+
+    Sizes and shapes are generated, not recorded: clean objects, fenced
+    blocks with commentary, long reasoning preambles whose prose contains
+    braces, a trailing second object, braces inside strings, and a
+    truncated response.
+    """
+    rng = random.Random(seed)
+    words = "the model weighs each criterion {x} against the rubric and notes that".split()
+
+    def prose(n_words: int) -> str:
+        return " ".join(rng.choice(words) for _ in range(n_words))
+
+    def assessment(n_items: int) -> dict:
+        return {
+            "score": rng.randint(1, 10),
+            "summary": prose(40),
+            "issues": [{"id": i, "detail": prose(25), "severity": "minor"} for i in range(n_items)],
+        }
+
+    small = json.dumps(assessment(5))
+    large = json.dumps(assessment(1500), indent=2)
+    return {
+        "clean": small,
+        "clean_large": large,
+        "fenced": f"Here is my assessment:\n```json\n{small}\n```\nLet me know if you need more.",
+        "reasoning_preamble": f"{prose(30000)}\n\nFinal answer:\n{small}\n\n{prose(200)}",
+        "fenced_large_commentary": f"```json\n{large}\n```\n{prose(5000)} {{note}}",
+        "two_objects": f"{small}\n\nFor reference, the schema was {{\"score\": 0}}.",
+        "braces_in_strings": json.dumps({"code": "if (a) { b(\"}\"); }" * 200, "score": 3}),
+        "truncated": small[: len(small) // 2],
+    }
+
+
+def _time_us(fn, text: str, repeat: int) -> float:
+    fn(text)  # warm up (lazy decoder import, regex cache)
+    start = perf_counter()
+    for _ in range(repeat):
+        fn(text)
+    return (perf_counter() - start) / repeat * 1e6
+
+
+def benchmark_json_parse(
+    corpus: dict[str, str] | None = None, *, repeat: int = 20,
+) -> list[JsonParseResult]:
+    """Time legacy and single-pass extraction on each case of ``corpus``."""
+    corpus = json_parse_corpus() if corpus is None else corpus
+
+    def single_pass(text: str) -> dict | None:
+        try:
+            return extract_json_object(text)
+        except ValueError:
+            return None
+
+    return [
+        JsonParseResult(
+            case=case,
+            size_kb=round(len(text) / 1024, 1),
+            legacy_us=round(_time_us(_legacy_extract_json, text, repeat), 1),
+            single_pass_us=round(_time_us(single_pass, text, repeat), 1),
+            legacy_found=_legacy_extract_json(text) is not None,
+            single_pass_found=single_pass(text) is not None,
+        )
+        for case, text in corpus.items()
+    ]
+
+
+def format_json_parse_report(results: list[JsonParseResult]) -> str:
+    lines = [
+        f"decoder: {json_backend()}",
+        f"{'case':24s} {'KB':>7s} {'legacy us':>10s} {'1-pass us':>10s} {'speedup':>8s}  found (legacy/1-pass)",
+    ]
+    for r in results:
+        lines.append(
+            f"{r.case:24s} {r.size_kb:7.1f} {r.legacy_us:10.1f} {r.single_pass_us:10.1f} "
+            f"{r.speedup:7.1f}x  {'yes' if r.legacy_found else 'no'}/"
+            f"{'yes' if r.single_pass_found else 'no'}"
+        )
+    return "\n".join(lines)
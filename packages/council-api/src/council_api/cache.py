@@ -0,0 +1,184 @@
+"""Content-addressed response cache for ``LLMClient``.
+
+Completions are keyed on a SHA-256 hash of the normalised request
+(provider, model, messages, max_tokens, reasoning_effort). Re-running or
+resuming a council with byte-identical Stage 1/2 requests is then served
+from the cache without touching the network.
+
+Provides:
+- ``SQLiteResponseCache``: single-file on-disk store with TTL and LRU eviction
+- ``MemoryResponseCache``: in-process store with the same semantics
+- Hit/miss/eviction counters on ``cache.stats``
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "council-api" / "responses.sqlite"
+
+# "use": read + write; "refresh": skip reads, overwrite on success; "bypass": ignore cache
+CACHE_MODES = ("use", "refresh", "bypass")
+
+
+def request_key(**request: object) -> str:
+    """Hash a request into a stable cache key (key order and spacing ignored)."""
+    if request.get("reasoning_effort") == "none":
+        request["reasoning_effort"] = None
+    canonical = json.dumps(
+        request, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """Base class for response caches. Values are raw completion text."""
+
+    def __init__(self, *, ttl: float | None = None, max_entries: int | None = None) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> str | None:
+        raise NotImplementedError("Subclasses must implement get")
+
+    def set(self, key: str, value: str) -> None:
+        raise NotImplementedError("Subclasses must implement set")
+
+    def clear(self) -> None:
+        raise NotImplementedError("Subclasses must implement clear")
+
+    def close(self) -> None:
+        pass
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl is not None and now - created > self.ttl
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU cache (lost when the process exits)."""
+
+    def __init__(self, *, ttl: float | None = None, max_entries: int | None = 10_000) -> None:
+        super().__init__(ttl=ttl, max_entries=max_entries)
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None or self._expired(entry[1], time.time()):
+            self._entries.pop(key, None)
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry[0]
+
+    def set(self, key: str, value: str) -> None:
+        self._entries[key] = (value, time.time())
+        self._entries.move_to_end(key)
+        self.stats.writes += 1
+        while self.max_entries is not None and len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class SQLiteResponseCache(ResponseCache):
+    """On-disk cache in a single SQLite file (WAL mode).
+
+    Entries older than ``ttl`` seconds are treated as misses and deleted.
+    When more than ``max_entries`` rows exist, the least recently accessed
+    ones are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        *,
+        ttl: float | None = None,
+        max_entries: int | None = 10_000,
+    ) -> None:
+        super().__init__(ttl=ttl, max_entries=max_entries)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+            " created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        self._db.commit()
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        row = self._db.execute(
+            "SELECT value, created FROM responses WHERE key = ?", (key,),
+        ).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+        value, created = row
+        if self._expired(created, now):
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+            self.stats.misses += 1
+            return None
+        self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        self._db.commit()
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses (key, value, created, accessed)"
+            " VALUES (?, ?, ?, ?)",
+            (key, value, now, now),
+        )
+        self.stats.writes += 1
+        if self.max_entries is not None:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                self._db.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    " SELECT key FROM responses ORDER BY accessed ASC LIMIT ?)",
+                    (excess,),
+                )
+                self.stats.evictions += excess
+        self._db.commit()
+
+    def clear(self) -> None:
+        self._db.execute("DELETE FROM responses")
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
@@ -7,7 +7,12 @@ Inspired by:
 Provides:
 - Atomic JSON writes (tmp + fsync + rename) for crash safety
 - Stage checkpointing: save after each stage, resume from last completed stage
+- Per-participant log: each Stage 1 assessment / Stage 2 review is recorded
+  as it completes, so a resumed run only re-issues the calls that never finished
 - Pending participant tracking
+- Pluggable ``CheckpointStore`` backends: one JSON file per stage
+  (``FileCheckpointStore``), a single SQLite database
+  (``SQLiteCheckpointStore``) and an in-process dict (``MemoryCheckpointStore``)
 """
 
 from __future__ import annotations
@@ -15,10 +20,14 @@ from __future__ import annotations
 import json
 import logging
 import os
+import secrets
+import sqlite3
 import tempfile
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import IO
 
 logger = logging.getLogger(__name__)
 
@@ -60,102 +69,398 @@ def _read_json(path: Path) -> dict | None:
 
 
 def _make_run_id() -> str:
-    """Generate a timestamped run ID."""
-    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    """Generate a unique, time-ordered run ID."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    return f"{stamp}-{secrets.token_hex(3)}"
+
+
+class CheckpointStore:
+    """Storage backend for stage checkpoints and participant records.
+
+    Stage payloads and participant records are JSON-serialisable dicts.
+    Run IDs sort chronologically, so the latest run is the largest ID.
+    """
+
+    def save_stage(self, run_id: str, stage: int, data: dict) -> None:
+        raise NotImplementedError("Subclasses must implement save_stage")
+
+    def load_stage(self, run_id: str, stage: int) -> dict | None:
+        raise NotImplementedError("Subclasses must implement load_stage")
+
+    def completed_stages(self, run_id: str) -> set[int]:
+        raise NotImplementedError("Subclasses must implement completed_stages")
+
+    def append_participant(self, run_id: str, stage: int, model: str, data: dict) -> None:
+        raise NotImplementedError("Subclasses must implement append_participant")
+
+    def load_participants(self, run_id: str, stage: int) -> dict[str, dict]:
+        raise NotImplementedError("Subclasses must implement load_participants")
+
+    def has_participants(self, run_id: str) -> bool:
+        raise NotImplementedError("Subclasses must implement has_participants")
+
+    def list_runs(self) -> list[str]:
+        """All run IDs with any checkpoint data, oldest first."""
+        raise NotImplementedError("Subclasses must implement list_runs")
+
+    def latest_run(self) -> str | None:
+        runs = self.list_runs()
+        return runs[-1] if runs else None
+
+    def delete_run(self, run_id: str) -> None:
+        raise NotImplementedError("Subclasses must implement delete_run")
+
+    def sync(self, run_id: str | None = None) -> None:
+        """Make buffered participant records durable."""
+
+    def close(self, run_id: str | None = None) -> None:
+        """Release resources held for ``run_id`` (or all runs)."""
+
+
+class FileCheckpointStore(CheckpointStore):
+    """One atomically written JSON file per stage plus a JSONL participant log.
+
+    Participant log writes are flushed immediately (safe against a process
+    crash) and fsynced every ``fsync_every`` records or ``fsync_interval``
+    seconds, and whenever a stage checkpoint is saved.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = DEFAULT_CHECKPOINT_DIR,
+        *,
+        fsync_every: int = 8,
+        fsync_interval: float = 2.0,
+    ) -> None:
+        self.directory = Path(directory)
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._logs: dict[str, IO[str]] = {}
+        self._unsynced: dict[str, int] = {}
+        self._last_sync: dict[str, float] = {}
+
+    def save_stage(self, run_id: str, stage: int, data: dict) -> None:
+        self.sync(run_id)
+        _atomic_write_json(self._stage_path(run_id, stage), data)
+
+    def load_stage(self, run_id: str, stage: int) -> dict | None:
+        return _read_json(self._stage_path(run_id, stage))
+
+    def completed_stages(self, run_id: str) -> set[int]:
+        return {s for s in (1, 2, 3) if self._stage_path(run_id, s).exists()}
+
+    def append_participant(self, run_id: str, stage: int, model: str, data: dict) -> None:
+        log = self._logs.get(run_id)
+        if log is None:
+            path = self._log_path(run_id)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            torn = False
+            if path.exists() and path.stat().st_size:
+                with open(path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    torn = f.read(1) != b"\n"
+            log = self._logs[run_id] = open(path, "a", encoding="utf-8")
+            if torn:
+                log.write("\n")  # keep new records off a crash-torn line
+            self._unsynced[run_id] = 0
+            self._last_sync[run_id] = time.monotonic()
+        record = {"stage": stage, "model": model, "data": data}
+        log.write(json.dumps(record, default=str) + "\n")
+        log.flush()
+        self._unsynced[run_id] += 1
+        if (
+            self._unsynced[run_id] >= self.fsync_every
+            or time.monotonic() - self._last_sync[run_id] >= self.fsync_interval
+        ):
+            self.sync(run_id)
+
+    def load_participants(self, run_id: str, stage: int) -> dict[str, dict]:
+        """Completed participants of ``stage``, keyed by model.
+
+        A torn final line (crash mid-write) is ignored.
+        """
+        path = self._log_path(run_id)
+        if not path.exists():
+            return {}
+        completed: dict[str, dict] = {}
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            logger.warning("Could not read participant log %s: %s", path, exc)
+            return {}
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("Skipping corrupt participant record in %s", path)
+                continue
+            if record.get("stage") == stage:
+                completed[record["model"]] = record["data"]
+        return completed
+
+    def has_participants(self, run_id: str) -> bool:
+        return self._log_path(run_id).exists()
+
+    def list_runs(self) -> list[str]:
+        if not self.directory.exists():
+            return []
+        run_ids = {
+            p.name.replace("-stage1.json", "")
+            for p in self.directory.glob("*-stage1.json")
+        } | {
+            p.name.replace("-participants.jsonl", "")
+            for p in self.directory.glob("*-participants.jsonl")
+        }
+        return sorted(run_ids)
+
+    def delete_run(self, run_id: str) -> None:
+        self.close(run_id)
+        paths = [self._stage_path(run_id, s) for s in (1, 2, 3)]
+        for path in (*paths, self._log_path(run_id)):
+            if path.exists():
+                path.unlink()
+                logger.info("Removed checkpoint: %s", path)
+
+    def sync(self, run_id: str | None = None) -> None:
+        for rid in [run_id] if run_id else list(self._logs):
+            log = self._logs.get(rid)
+            if log is None or not self._unsynced.get(rid):
+                continue
+            os.fsync(log.fileno())
+            self._unsynced[rid] = 0
+            self._last_sync[rid] = time.monotonic()
+
+    def close(self, run_id: str | None = None) -> None:
+        for rid in [run_id] if run_id else list(self._logs):
+            if rid not in self._logs:
+                continue
+            self.sync(rid)
+            self._logs.pop(rid).close()
+
+    def _stage_path(self, run_id: str, stage: int) -> Path:
+        return self.directory / f"{run_id}-stage{stage}.json"
+
+    def _log_path(self, run_id: str) -> Path:
+        return self.directory / f"{run_id}-participants.jsonl"
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """All runs in one SQLite file (WAL mode), indexed by run ID and stage.
+
+    With ``synchronous=NORMAL`` a WAL commit does not fsync, so per-record
+    commits stay cheap; the WAL is synced at checkpoints. Committed records
+    survive a process crash but may be lost on power failure.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS stages ("
+            " run_id TEXT NOT NULL, stage INTEGER NOT NULL, data TEXT NOT NULL,"
+            " updated REAL NOT NULL, PRIMARY KEY (run_id, stage))"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS participants ("
+            " run_id TEXT NOT NULL, stage INTEGER NOT NULL, model TEXT NOT NULL,"
+            " data TEXT NOT NULL, created REAL NOT NULL,"
+            " PRIMARY KEY (run_id, stage, model))"
+        )
+        self._db.commit()
+
+    def save_stage(self, run_id: str, stage: int, data: dict) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO stages (run_id, stage, data, updated) VALUES (?, ?, ?, ?)",
+            (run_id, stage, json.dumps(data, default=str), time.time()),
+        )
+        self._db.commit()
+
+    def load_stage(self, run_id: str, stage: int) -> dict | None:
+        row = self._db.execute(
+            "SELECT data FROM stages WHERE run_id = ? AND stage = ?", (run_id, stage),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def completed_stages(self, run_id: str) -> set[int]:
+        rows = self._db.execute(
+            "SELECT stage FROM stages WHERE run_id = ?", (run_id,),
+        ).fetchall()
+        return {stage for (stage,) in rows}
+
+    def append_participant(self, run_id: str, stage: int, model: str, data: dict) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO participants (run_id, stage, model, data, created)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (run_id, stage, model, json.dumps(data, default=str), time.time()),
+        )
+        self._db.commit()
+
+    def load_participants(self, run_id: str, stage: int) -> dict[str, dict]:
+        rows = self._db.execute(
+            "SELECT model, data FROM participants WHERE run_id = ? AND stage = ?"
+            " ORDER BY created",
+            (run_id, stage),
+        ).fetchall()
+        return {model: json.loads(data) for model, data in rows}
+
+    def has_participants(self, run_id: str) -> bool:
+        row = self._db.execute(
+            "SELECT 1 FROM participants WHERE run_id = ? LIMIT 1", (run_id,),
+        ).fetchone()
+        return row is not None
+
+    def list_runs(self) -> list[str]:
+        rows = self._db.execute(
+            "SELECT run_id FROM stages UNION SELECT run_id FROM participants ORDER BY run_id"
+        ).fetchall()
+        return [run_id for (run_id,) in rows]
+
+    def latest_run(self) -> str | None:
+        row = self._db.execute(
+            "SELECT MAX(run_id) FROM ("
+            " SELECT MAX(run_id) AS run_id FROM stages"
+            " UNION ALL SELECT MAX(run_id) FROM participants)"
+        ).fetchone()
+        return row[0] if row else None
+
+    def delete_run(self, run_id: str) -> None:
+        self._db.execute("DELETE FROM stages WHERE run_id = ?", (run_id,))
+        self._db.execute("DELETE FROM participants WHERE run_id = ?", (run_id,))
+        self._db.commit()
+
+    def close(self, run_id: str | None = None) -> None:
+        if run_id is None:
+            self._db.close()
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """In-process store (lost when the process exits); intended for tests."""
+
+    def __init__(self) -> None:
+        self._stages: dict[str, dict[int, dict]] = {}
+        self._participants: dict[str, dict[int, dict[str, dict]]] = {}
+
+    def save_stage(self, run_id: str, stage: int, data: dict) -> None:
+        self._stages.setdefault(run_id, {})[stage] = json.loads(json.dumps(data, default=str))
+
+    def load_stage(self, run_id: str, stage: int) -> dict | None:
+        return self._stages.get(run_id, {}).get(stage)
+
+    def completed_stages(self, run_id: str) -> set[int]:
+        return set(self._stages.get(run_id, {}))
+
+    def append_participant(self, run_id: str, stage: int, model: str, data: dict) -> None:
+        stages = self._participants.setdefault(run_id, {})
+        stages.setdefault(stage, {})[model] = json.loads(json.dumps(data, default=str))
+
+    def load_participants(self, run_id: str, stage: int) -> dict[str, dict]:
+        return dict(self._participants.get(run_id, {}).get(stage, {}))
+
+    def has_participants(self, run_id: str) -> bool:
+        return bool(self._participants.get(run_id))
+
+    def list_runs(self) -> list[str]:
+        return sorted(set(self._stages) | set(self._participants))
+
+    def delete_run(self, run_id: str) -> None:
+        self._stages.pop(run_id, None)
+        self._participants.pop(run_id, None)
 
 
 @dataclass
 class CouncilCheckpointer:
-    """Manages checkpoint state for a council run."""
+    """Manages checkpoint state for one council run.
+
+    Backed by ``store``; when none is given, a ``FileCheckpointStore`` in
+    ``checkpoint_dir`` (with the given fsync batching) is used.
+    """
 
-    checkpoint_dir: Path
+    checkpoint_dir: Path | None = None
     run_id: str = field(default_factory=_make_run_id)
+    fsync_every: int = 8
+    fsync_interval: float = 2.0
+    store: CheckpointStore | None = None
 
     def __post_init__(self) -> None:
-        self.checkpoint_dir = Path(self.checkpoint_dir)
+        if self.store is None:
+            if self.checkpoint_dir is None:
+                raise ValueError("CouncilCheckpointer needs a checkpoint_dir or a store")
+            self.checkpoint_dir = Path(self.checkpoint_dir)
+            self.store = FileCheckpointStore(
+                self.checkpoint_dir,
+                fsync_every=self.fsync_every,
+                fsync_interval=self.fsync_interval,
+            )
 
     # ---- Save ----
 
-    def save_stage1(self, assessments: list[dict], models: list[str]) -> Path:
+    def save_stage1(self, assessments: list[dict], models: list[str]) -> None:
         """Save Stage 1 assessments to checkpoint."""
-        path = self._stage_path(1)
-        data = {
-            "meta": {
-                "run_id": self.run_id,
-                "stage": 1,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "models": models,
-            },
-            "assessments": assessments,
-        }
-        _atomic_write_json(path, data)
-        logger.info("Checkpoint saved: Stage 1 → %s", path)
-        return path
+        self._save(1, {"models": models}, {"assessments": assessments})
 
     def save_stage2(
         self,
         peer_reviews: list[dict],
         models: list[str],
         aggregate_rankings: list[dict] | None = None,
-    ) -> Path:
+    ) -> None:
         """Save Stage 2 peer reviews to checkpoint."""
-        path = self._stage_path(2)
-        data = {
-            "meta": {
-                "run_id": self.run_id,
-                "stage": 2,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "models": models,
-            },
+        self._save(2, {"models": models}, {
             "peer_reviews": peer_reviews,
             "aggregate_rankings": aggregate_rankings or [],
-        }
-        _atomic_write_json(path, data)
-        logger.info("Checkpoint saved: Stage 2 → %s", path)
-        return path
+        })
 
-    def save_stage3(self, synthesis: dict | str, chairman: str) -> Path:
+    def save_stage3(self, synthesis: dict | str, chairman: str) -> None:
         """Save Stage 3 synthesis to checkpoint."""
-        path = self._stage_path(3)
-        data = {
-            "meta": {
-                "run_id": self.run_id,
-                "stage": 3,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "chairman": chairman,
-            },
-            "synthesis": synthesis,
-        }
-        _atomic_write_json(path, data)
-        logger.info("Checkpoint saved: Stage 3 → %s", path)
-        return path
+        self._save(3, {"chairman": chairman}, {"synthesis": synthesis})
+
+    # ---- Participant log ----
+
+    def append_participant(self, stage: int, model: str, data: dict) -> None:
+        """Record one completed Stage 1 assessment or Stage 2 review."""
+        self.store.append_participant(self.run_id, stage, model, data)
+
+    def load_participants(self, stage: int) -> dict[str, dict]:
+        """Completed participants of ``stage``, keyed by model."""
+        return self.store.load_participants(self.run_id, stage)
+
+    def has_participant_log(self) -> bool:
+        return self.store.has_participants(self.run_id)
+
+    def sync(self) -> None:
+        """Make buffered participant records durable."""
+        self.store.sync(self.run_id)
+
+    def close(self) -> None:
+        """Sync and release this run's resources in the store."""
+        self.store.close(self.run_id)
 
     # ---- Load / Resume ----
 
     def last_completed_stage(self) -> int:
         """Return the highest completed stage (0 if none)."""
-        for stage in (3, 2, 1):
-            if self._stage_path(stage).exists():
-                return stage
-        return 0
+        return max(self.store.completed_stages(self.run_id), default=0)
 
     def load_stage1(self) -> list[dict] | None:
         """Load Stage 1 assessments from checkpoint."""
-        data = _read_json(self._stage_path(1))
+        data = self.store.load_stage(self.run_id, 1)
         if data is None:
             return None
         return data.get("assessments")
 
     def load_stage2(self) -> tuple[list[dict], list[dict]] | None:
         """Load Stage 2 peer reviews + aggregate rankings from checkpoint."""
-        data = _read_json(self._stage_path(2))
+        data = self.store.load_stage(self.run_id, 2)
         if data is None:
             return None
         return data.get("peer_reviews", []), data.get("aggregate_rankings", [])
 
     def load_stage3(self) -> dict | str | None:
         """Load Stage 3 synthesis from checkpoint."""
-        data = _read_json(self._stage_path(3))
+        data = self.store.load_stage(self.run_id, 3)
         if data is None:
             return None
         return data.get("synthesis")
@@ -171,23 +476,28 @@ class CouncilCheckpointer:
     # ---- Discovery ----
 
     def find_latest_run(self) -> str | None:
-        """Find the most recent run_id in the checkpoint directory."""
-        if not self.checkpoint_dir.exists():
-            return None
-        stage1_files = sorted(self.checkpoint_dir.glob("*-stage1.json"), reverse=True)
-        if not stage1_files:
-            return None
-        return stage1_files[0].stem.replace("-stage1", "")
+        """Find the most recent run_id in the store.
+
+        Runs that crashed before finishing Stage 1 are found through their
+        participant records.
+        """
+        return self.store.latest_run()
 
     def clean(self) -> None:
-        """Remove all checkpoint files for this run."""
-        for stage in (1, 2, 3):
-            path = self._stage_path(stage)
-            if path.exists():
-                path.unlink()
-                logger.info("Removed checkpoint: %s", path)
+        """Remove all checkpoint data for this run."""
+        self.store.delete_run(self.run_id)
 
     # ---- Internal ----
 
-    def _stage_path(self, stage: int) -> Path:
-        return self.checkpoint_dir / f"{self.run_id}-stage{stage}.json"
+    def _save(self, stage: int, meta: dict, payload: dict) -> None:
+        data = {
+            "meta": {
+                "run_id": self.run_id,
+                "stage": stage,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                **meta,
+            },
+            **payload,
+        }
+        self.store.save_stage(self.run_id, stage, data)
+        logger.info("Checkpoint saved: Stage %d (run %s)", stage, self.run_id)
@@ -11,17 +11,37 @@ To use a native provider, pass ``provider="anthropic"`` (or similar) or call
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextvars
 import logging
 import os
 import re
-
-import openai
-from openai import AsyncOpenAI
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from council_api.cache import CACHE_MODES, ResponseCache, request_key
+from council_api.jsonparse import JsonObjectScanner, extract_json_object, schema_errors
+from council_api.ratelimit import (
+    RETRYABLE_STATUS_CODES,
+    RetryPolicy,
+    estimate_tokens,
+    get_rate_limiter,
+    retry_after_seconds,
+)
+
+if TYPE_CHECKING:
+    import httpx
+    from pydantic import BaseModel
+
+# openai and httpx are imported where a client is built or an API error is
+# inspected, so importing this module (e.g. for the CLI) stays cheap.
 
 logger = logging.getLogger(__name__)
 
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+OPENAI_DEFAULT_BASE_URL = "https://api.openai.com/v1"
 OPENROUTER_CREDITS_URL = "https://openrouter.ai/credits"
 
 # Provider configs: env_var, base_url (None = OpenAI default), model-prefix-to-strip
@@ -54,6 +74,99 @@ REASONING_EFFORT_RATIO = {
 EMPTY_RESPONSE_MAX_RETRIES = 3
 EMPTY_RESPONSE_TOKEN_MULTIPLIER = 2
 
+# Providers that report token usage on streamed responses via stream_options
+STREAM_USAGE_PROVIDERS = {"openrouter", "openai"}
+
+# Routes that honour explicit cache_control markers on user content parts,
+# keyed by provider with the model-ID prefixes they apply to
+CACHE_CONTROL_ROUTES = {"openrouter": ("anthropic/", "google/")}
+
+# Native structured-output mechanism per provider, as (model-ID prefix, mode)
+# pairs; "" matches every model. "json_schema" sends response_format,
+# "tool" forces a single function call whose arguments are the object.
+STRUCTURED_OUTPUT_ROUTES: dict[str, tuple[tuple[str, str], ...]] = {
+    "openai": (("", "json_schema"),),
+    "gemini": (("", "json_schema"),),
+    "mistral": (("", "json_schema"),),
+    "anthropic": (("", "tool"),),
+    "openrouter": (
+        ("anthropic/", "tool"),
+        ("openai/", "json_schema"),
+        ("google/", "json_schema"),
+        ("mistralai/", "json_schema"),
+    ),
+}
+
+# Status codes with which a provider rejects structured-output parameters
+STRUCTURED_OUTPUT_REJECTED = {400, 422}
+
+# (provider, model) routes that rejected structured output in this process
+_structured_unsupported: set[tuple[str, str]] = set()
+
+
+@dataclass
+class CallStats:
+    """Usage and retry counters accumulated by ``LLMClient`` during ``track_calls``."""
+
+    requests: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    reasoning_tokens: int = 0
+    retries: int = 0            # transient-error retries (429, 5xx, timeouts)
+    empty_retries: int = 0      # EMPTY_RESPONSE_MAX_RETRIES re-attempts
+    json_repairs: int = 0       # chat_json repair round trips
+    structured: bool = False    # answered under provider-native structured output
+    rate_wait_s: float = 0.0    # time queued on the provider rate limiter
+    cached: bool = False        # served from the response cache
+
+    def add_usage(self, usage: object) -> None:
+        self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+        self.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+        details = getattr(usage, "completion_tokens_details", None)
+        self.reasoning_tokens += getattr(details, "reasoning_tokens", 0) or 0
+
+
+_call_stats: contextvars.ContextVar[CallStats | None] = contextvars.ContextVar(
+    "llm_call_stats", default=None,
+)
+
+
+@contextmanager
+def track_calls() -> Iterator[CallStats]:
+    """Collect ``CallStats`` for every LLMClient request made inside the block.
+
+    Tracking follows the current asyncio task context, so concurrent calls
+    in sibling tasks each need their own ``track_calls`` block.
+    """
+    stats = CallStats()
+    token = _call_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _call_stats.reset(token)
+
+
+async def _callback_stream(
+    run: Callable[[Callable[[object], None]], Awaitable[object]],
+) -> AsyncIterator[object]:
+    """Adapt ``run(callback)`` into an async iterator over the callback's items.
+
+    ``run`` is started as a task; items it passes to the callback are yielded
+    as they arrive. Errors from ``run`` propagate when it finishes, and
+    abandoning the iterator cancels the task.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+    task = asyncio.ensure_future(run(queue.put_nowait))
+    task.add_done_callback(lambda _: queue.put_nowait(done))
+    try:
+        while (item := await queue.get()) is not done:
+            yield item
+        task.result()
+    finally:
+        if not task.done():
+            task.cancel()
+
 
 class LLMResponseFormatError(RuntimeError):
     """Raised when an LLM response cannot be parsed into valid JSON."""
@@ -68,14 +181,18 @@ class LLMServiceError(Exception):
         *,
         help_url: str | None = None,
         detail: str | None = None,
+        status: int | None = None,
     ) -> None:
         super().__init__(message)
         self.help_url = help_url
         self.detail = detail
+        self.status = status  # HTTP status of the failed request, if any
 
 
 def _handle_openai_error(exc: Exception, provider: str = "openrouter") -> LLMServiceError:
     """Convert openai SDK exceptions into user-friendly LLMServiceError."""
+    import openai
+
     help_url = OPENROUTER_CREDITS_URL if provider == "openrouter" else None
     provider_display = provider.replace("_", " ").title()
 
@@ -99,16 +216,19 @@ def _handle_openai_error(exc: Exception, provider: str = "openrouter") -> LLMSer
                 f"Insufficient {provider_display} credits. Please top up your account.",
                 help_url=help_url,
                 detail=str(exc),
+                status=status,
             )
         if status == 503:
             return LLMServiceError(
                 "The selected LLM model is temporarily unavailable. Try a different model.",
                 detail=str(exc),
+                status=status,
             )
         return LLMServiceError(
             f"{provider_display} API error (HTTP {status}). Please try again.",
             help_url=help_url,
             detail=str(exc),
+            status=status,
         )
     if isinstance(exc, openai.APIConnectionError):
         return LLMServiceError(
@@ -121,6 +241,17 @@ def _handle_openai_error(exc: Exception, provider: str = "openrouter") -> LLMSer
     )
 
 
+def _is_retryable(exc: Exception) -> bool:
+    """True for transient errors (429, 5xx, timeouts, dropped connections)."""
+    import openai
+
+    if isinstance(exc, (openai.RateLimitError, openai.APIConnectionError)):
+        return True
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+
 def _resolve_provider(
     provider: str | None,
     model: str | None,
@@ -181,6 +312,87 @@ def _apply_reasoning(
     # Mistral: no reasoning token support
 
 
+def _schema_spec(schema: dict | type[BaseModel]) -> tuple[str, dict]:
+    """(name, JSON Schema) for a JSON Schema dict or a pydantic model class."""
+    if isinstance(schema, dict):
+        name, json_schema = schema.get("title") or "response", schema
+    else:
+        name, json_schema = schema.__name__, schema.model_json_schema()
+    return re.sub(r"[^A-Za-z0-9_-]", "_", str(name))[:64], json_schema
+
+
+def _strict_schema(schema: object) -> bool:
+    """True if ``schema`` fits OpenAI's strict subset (closed objects, every key required)."""
+    if not isinstance(schema, dict):
+        return True
+    properties = schema.get("properties", {})
+    if schema.get("type") == "object" or properties:
+        if schema.get("additionalProperties") is not False:
+            return False
+        if set(schema.get("required", ())) != set(properties):
+            return False
+    children = [
+        *properties.values(),
+        *schema.get("$defs", {}).values(),
+        *schema.get("anyOf", ()),
+        schema.get("items"),
+    ]
+    return all(_strict_schema(child) for child in children)
+
+
+def _structured_params(mode: str, name: str, json_schema: dict) -> dict:
+    """Request parameters that make the provider return an object matching ``json_schema``."""
+    if mode == "json_schema":
+        return {"response_format": {
+            "type": "json_schema",
+            "json_schema": {
+                "name": name,
+                "schema": json_schema,
+                "strict": _strict_schema(json_schema),
+            },
+        }}
+    return {
+        "tools": [{
+            "type": "function",
+            "function": {
+                "name": name,
+                "description": "Return the response object.",
+                "parameters": json_schema,
+            },
+        }],
+        "tool_choice": {"type": "function", "function": {"name": name}},
+    }
+
+
+def _output_text(message: object) -> str:
+    """Text of a message or stream delta: its content, else forced tool-call arguments."""
+    content = getattr(message, "content", None)
+    if content:
+        return content
+    tool_calls = getattr(message, "tool_calls", None)
+    if tool_calls:
+        function = getattr(tool_calls[0], "function", None)
+        return getattr(function, "arguments", None) or ""
+    return ""
+
+
+def _validate_schema(parsed: dict, schema: dict | type[BaseModel]) -> dict:
+    """Check ``parsed`` against ``schema``; pydantic models also coerce values."""
+    if isinstance(schema, dict):
+        problems = schema_errors(parsed, schema)
+        if problems:
+            raise LLMResponseFormatError(
+                f"Response does not match schema: {'; '.join(problems[:3])}"
+            )
+        return parsed
+    try:
+        return schema.model_validate(parsed).model_dump(mode="json")
+    except ValueError as exc:  # pydantic.ValidationError
+        raise LLMResponseFormatError(
+            f"Response does not match {schema.__name__}: {str(exc)[:500]}"
+        ) from None
+
+
 class LLMClient:
     """Generic async LLM client supporting multiple providers.
 
@@ -202,7 +414,20 @@ class LLMClient:
         *,
         provider: str | None = None,
         base_url: str | None = None,
+        cache: ResponseCache | None = None,
+        cache_mode: str = "use",
+        retry_policy: RetryPolicy | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        structured_output: bool = True,
     ) -> None:
+        from openai import AsyncOpenAI
+
+        from council_api.pool import acquire_http_client
+
+        if cache_mode not in CACHE_MODES:
+            raise ValueError(
+                f"Unknown cache_mode '{cache_mode}'. Available: {', '.join(CACHE_MODES)}"
+            )
         # Backward-compat default: if nothing is specified, assume OpenRouter
         if provider is None and base_url is None and api_key is not None:
             provider = "openrouter"
@@ -212,9 +437,17 @@ class LLMClient:
         env_var, default_base_url, prefix = PROVIDERS[resolved_provider]
         effective_base_url = base_url or default_base_url
 
-        client_kwargs: dict = {"api_key": resolved_key}
+        # Retries are scheduled by retry_policy against the shared rate limiter
+        client_kwargs: dict = {"api_key": resolved_key, "max_retries": 0}
         if effective_base_url:
             client_kwargs["base_url"] = effective_base_url
+        # Borrow the process-wide pool for this endpoint unless given a client
+        self._pooled_http = None
+        if http_client is None:
+            http_client = self._pooled_http = acquire_http_client(
+                effective_base_url or OPENAI_DEFAULT_BASE_URL,
+            )
+        client_kwargs["http_client"] = http_client
 
         self.client = AsyncOpenAI(**client_kwargs)
         self.provider = resolved_provider
@@ -222,6 +455,10 @@ class LLMClient:
         self.max_tokens = max_tokens
         self.json_retry_attempts = max(1, json_retry_attempts)
         self._model_prefix = prefix
+        self.cache = cache
+        self.cache_mode = cache_mode
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.structured_output = structured_output
 
     @classmethod
     def from_env(
@@ -267,25 +504,67 @@ class LLMClient:
         max_tokens: int,
         messages: list[dict],
         reasoning_effort: str | None,
+        stream: bool = False,
+        on_delta: Callable[[str], None] | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+        extra_params: dict | None = None,
     ) -> str:
-        """Single completion call with empty-response retry on reasoning-consumed tokens."""
+        """Single completion call with empty-response retry on reasoning-consumed tokens.
+
+        Non-empty responses are stored in (and served from) ``self.cache``
+        according to ``self.cache_mode``.
+
+        With ``stream=True`` the response is read incrementally: each text
+        delta is passed to ``on_delta``, and the stream is closed early as
+        soon as ``stop_when(accumulated_text)`` returns True. A response cut
+        short that way is not cached: it is only a prefix of what the same
+        request returns when read to the end.
+
+        ``extra_params`` (e.g. structured-output parameters) are added to
+        the request and to its cache key. A forced tool call's arguments
+        are returned as the response text.
+        """
+        cache_key = None
+        if self.cache is not None and self.cache_mode != "bypass":
+            cache_key = request_key(
+                provider=self.provider,
+                model=model,
+                max_tokens=max_tokens,
+                messages=messages,
+                reasoning_effort=reasoning_effort,
+                **({"extra_params": extra_params} if extra_params else {}),
+            )
+            if self.cache_mode == "use":
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("Cache hit for %s (%s)", model, cache_key[:12])
+                    if (stats := _call_stats.get()) is not None:
+                        stats.cached = True
+                    if on_delta:
+                        on_delta(cached)
+                    return cached
+
         current_max_tokens = max_tokens
         for _attempt in range(EMPTY_RESPONSE_MAX_RETRIES):
             kwargs: dict = {
                 "model": self._api_model(model),
                 "max_tokens": current_max_tokens,
                 "messages": messages,
+                **(extra_params or {}),
             }
             if reasoning_effort and reasoning_effort != "none":
                 _apply_reasoning(kwargs, self.provider, reasoning_effort, current_max_tokens)
 
-            try:
-                response = await self.client.chat.completions.create(**kwargs)
-            except (openai.APIError, openai.APIConnectionError) as api_exc:
-                raise _handle_openai_error(api_exc, self.provider) from api_exc
-
-            content = (response.choices[0].message.content or "").strip()
+            stopped = False
+            if stream:
+                content, stopped = await self._read_stream(kwargs, on_delta, stop_when)
+                content = content.strip()
+            else:
+                response = await self._create_with_retry(kwargs)
+                content = _output_text(response.choices[0].message).strip()
             if content:
+                if cache_key is not None and not stopped:
+                    self.cache.set(cache_key, content)
                 return content
 
             logger.warning(
@@ -294,6 +573,8 @@ class LLMClient:
                 model, current_max_tokens * EMPTY_RESPONSE_TOKEN_MULTIPLIER,
             )
             current_max_tokens *= EMPTY_RESPONSE_TOKEN_MULTIPLIER
+            if (stats := _call_stats.get()) is not None:
+                stats.empty_retries += 1
 
         logger.warning(
             "Empty response from %s after %d retries (max_tokens=%d)",
@@ -301,6 +582,96 @@ class LLMClient:
         )
         return ""
 
+    async def _create_with_retry(self, kwargs: dict):
+        """Issue one completion request under the provider's shared rate limit.
+
+        Transient errors are retried with ``self.retry_policy``; a 429 also
+        pauses the provider's limiter so that every concurrent caller backs
+        off for the ``Retry-After`` interval instead of failing.
+        """
+        import openai
+
+        limiter = get_rate_limiter(self.provider)
+        estimate = estimate_tokens(kwargs["messages"], kwargs["max_tokens"])
+        policy = self.retry_policy
+        stats = _call_stats.get()
+
+        for attempt in range(policy.max_retries + 1):
+            waited = await limiter.acquire(estimate)
+            if stats is not None:
+                stats.requests += 1
+                stats.rate_wait_s += waited
+            try:
+                response = await self.client.chat.completions.create(**kwargs)
+            except openai.APIError as api_exc:
+                if attempt >= policy.max_retries or not _is_retryable(api_exc):
+                    raise _handle_openai_error(api_exc, self.provider) from api_exc
+                retry_after = retry_after_seconds(api_exc)
+                delay = policy.delay(attempt, retry_after)
+                if isinstance(api_exc, openai.RateLimitError):
+                    limiter.pause(delay)
+                logger.warning(
+                    "%s error from %s (%s); retry %d/%d in %.1fs",
+                    type(api_exc).__name__, kwargs["model"], self.provider,
+                    attempt + 1, policy.max_retries, delay,
+                )
+                if stats is not None:
+                    stats.retries += 1
+                await asyncio.sleep(delay)
+                continue
+
+            usage = getattr(response, "usage", None)
+            if usage is not None:
+                if getattr(usage, "total_tokens", None):
+                    limiter.settle(estimate, usage.total_tokens)
+                if stats is not None:
+                    stats.add_usage(usage)
+            return response
+
+    async def _read_stream(
+        self,
+        kwargs: dict,
+        on_delta: Callable[[str], None] | None,
+        stop_when: Callable[[str], bool] | None,
+    ) -> tuple[str, bool]:
+        """Consume a streamed completion.
+
+        Returns the accumulated text and whether ``stop_when`` closed the
+        stream before the provider finished. SDK errors raised while reading
+        are converted like those of the initial request.
+        """
+        import openai
+
+        stream_kwargs = {**kwargs, "stream": True}
+        if self.provider in STREAM_USAGE_PROVIDERS:
+            stream_kwargs["stream_options"] = {"include_usage": True}
+        stream = await self._create_with_retry(stream_kwargs)
+        stats = _call_stats.get()
+        text = ""
+        stopped = False
+        try:
+            async for chunk in stream:
+                usage = getattr(chunk, "usage", None)
+                if usage is not None and stats is not None:
+                    stats.add_usage(usage)
+                if not chunk.choices:
+                    continue
+                delta = _output_text(chunk.choices[0].delta)
+                if not delta:
+                    continue
+                text += delta
+                if on_delta:
+                    on_delta(delta)
+                if stop_when and stop_when(text):
+                    logger.debug("Stream from %s stopped early", kwargs["model"])
+                    stopped = True
+                    break
+        except openai.APIError as api_exc:
+            raise _handle_openai_error(api_exc, self.provider) from api_exc
+        finally:
+            await stream.close()
+        return text, stopped
+
     async def chat_json(
         self,
         system: str,
@@ -309,6 +680,10 @@ class LLMClient:
         model: str | None = None,
         max_tokens: int | None = None,
         reasoning_effort: str | None = None,
+        stream: bool = False,
+        on_delta: Callable[[str], None] | None = None,
+        shared_prefix: str | None = None,
+        schema: dict | type[BaseModel] | None = None,
     ) -> dict:
         """Send a message and parse a JSON-object response with retries.
 
@@ -319,27 +694,76 @@ class LLMClient:
         reasoning_effort:
             ``"low"``, ``"medium"``, ``"high"``, or ``None`` (default, no
             reasoning). Provider-specific mapping handled automatically.
+        stream:
+            Stream the response and stop as soon as the first complete JSON
+            object has arrived, skipping any trailing commentary.
+        on_delta:
+            With ``stream=True``, called with each text delta as it arrives.
+        shared_prefix:
+            Context that precedes ``user_msg`` and is identical across many
+            calls (see ``_user_content``). Repair attempts omit it.
+        schema:
+            JSON Schema dict or pydantic model class the response must
+            match. Where ``STRUCTURED_OUTPUT_ROUTES`` lists the provider and
+            model, it is enforced natively (``response_format`` json_schema,
+            or a forced tool call); otherwise, or if the provider rejects
+            the parameters, prompting applies as without a schema. The
+            result is validated either way, and a mismatch triggers a
+            repair attempt. A pydantic model's validated (coerced) fields
+            are returned.
         """
         effective_model = model or self.model
         effective_max_tokens = max_tokens or self.max_tokens
         prompt = user_msg + "\n\nRespond ONLY with valid JSON."
+        content = self._user_content(effective_model, prompt, shared_prefix)
         raw_text = ""
         parse_error: Exception | None = None
+        name, json_schema = _schema_spec(schema) if schema is not None else ("", None)
+        mode = (
+            self._structured_mode(effective_model, reasoning_effort)
+            if schema is not None else None
+        )
 
         for attempt in range(1, self.json_retry_attempts + 1):
             messages = [
                 {"role": "system", "content": system},
-                {"role": "user", "content": prompt},
+                {"role": "user", "content": content},
             ]
-            raw_text = await self._complete(
-                model=effective_model,
-                max_tokens=effective_max_tokens,
-                messages=messages,
-                reasoning_effort=reasoning_effort,
-            )
+            request = {
+                "model": effective_model,
+                "max_tokens": effective_max_tokens,
+                "messages": messages,
+                "reasoning_effort": reasoning_effort,
+                "stream": stream,
+                "on_delta": on_delta,
+            }
+            scanner = JsonObjectScanner(json_schema) if stream else None
+            try:
+                raw_text = await self._complete(
+                    **request,
+                    stop_when=scanner,
+                    extra_params=_structured_params(mode, name, json_schema) if mode else None,
+                )
+            except LLMServiceError as exc:
+                if mode is None or exc.status not in STRUCTURED_OUTPUT_REJECTED:
+                    raise
+                logger.warning(
+                    "%s rejected structured output for %s (HTTP %s); using prompting",
+                    self.provider, effective_model, exc.status,
+                )
+                mode = None
+                scanner = JsonObjectScanner(json_schema) if stream else None
+                raw_text = await self._complete(**request, stop_when=scanner)
+                # Only now is the rejection known to be about structured output
+                _structured_unsupported.add((self.provider, effective_model))
 
             try:
-                return self._parse_json_response(raw_text)
+                if scanner is not None and scanner.result is not None:
+                    parsed = scanner.result
+                else:
+                    parsed = self._parse_json_response(raw_text, json_schema)
+                if schema is not None:
+                    parsed = _validate_schema(parsed, schema)
             except LLMResponseFormatError as exc:
                 parse_error = exc
                 logger.warning(
@@ -348,13 +772,20 @@ class LLMClient:
                 )
                 if attempt == self.json_retry_attempts:
                     break
-                prompt = (
+                if (stats := _call_stats.get()) is not None:
+                    stats.json_repairs += 1
+                content = (
                     "Your previous response was not valid JSON.\n"
                     "Return ONLY a valid JSON object matching the schema in the system prompt.\n"
                     "Do not include markdown fences or commentary.\n\n"
-                    "Previous invalid response:\n"
+                    + (f"Problem: {exc}\n\n" if schema is not None else "")
+                    + "Previous invalid response:\n"
                     f"{raw_text[:8000]}"
                 )
+                continue
+            if mode and (stats := _call_stats.get()) is not None:
+                stats.structured = True
+            return parsed
 
         snippet = raw_text[:240].replace("\n", " ")
         raise LLMResponseFormatError(
@@ -362,6 +793,18 @@ class LLMClient:
             f"Last parse error: {parse_error}. Response snippet: {snippet!r}"
         )
 
+    def _structured_mode(self, model: str, reasoning_effort: str | None) -> str | None:
+        """Native structured-output mode for ``model`` on this provider, if any."""
+        if not self.structured_output or (self.provider, model) in _structured_unsupported:
+            return None
+        for prefix, mode in STRUCTURED_OUTPUT_ROUTES.get(self.provider, ()):
+            if model.startswith(prefix):
+                # Anthropic cannot force a tool call while extended thinking is on
+                if mode == "tool" and reasoning_effort and reasoning_effort != "none":
+                    return None
+                return mode
+        return None
+
     async def chat_text(
         self,
         system: str,
@@ -370,72 +813,100 @@ class LLMClient:
         model: str | None = None,
         max_tokens: int | None = None,
         reasoning_effort: str | None = None,
+        stream: bool = False,
+        on_delta: Callable[[str], None] | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+        shared_prefix: str | None = None,
     ) -> str:
-        """Query the LLM and return the raw text response (no JSON parsing)."""
+        """Query the LLM and return the raw text response (no JSON parsing).
+
+        With ``stream=True``, ``on_delta`` receives each text delta and the
+        stream ends early once ``stop_when(accumulated_text)`` is True.
+        ``shared_prefix`` is sent ahead of ``user_msg`` (see ``_user_content``).
+        """
         effective_model = model or self.model
         effective_max_tokens = max_tokens or self.max_tokens
         messages = [
             {"role": "system", "content": system},
-            {"role": "user", "content": user_msg},
+            {"role": "user", "content": self._user_content(
+                effective_model, user_msg, shared_prefix,
+            )},
         ]
         return await self._complete(
             model=effective_model,
             max_tokens=effective_max_tokens,
             messages=messages,
             reasoning_effort=reasoning_effort,
+            stream=stream,
+            on_delta=on_delta,
+            stop_when=stop_when,
         )
 
+    async def stream_text(
+        self,
+        system: str,
+        user_msg: str,
+        *,
+        model: str | None = None,
+        max_tokens: int | None = None,
+        reasoning_effort: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield the text response as deltas arrive."""
+        async for delta in _callback_stream(
+            lambda emit: self.chat_text(
+                system, user_msg,
+                model=model, max_tokens=max_tokens,
+                reasoning_effort=reasoning_effort,
+                stream=True, on_delta=emit,
+            )
+        ):
+            yield delta
+
+    def _user_content(
+        self, model: str, user_msg: str, shared_prefix: str | None,
+    ) -> str | list[dict]:
+        """User message content with ``shared_prefix`` placed first.
+
+        Providers that cache prompt prefixes automatically (e.g. OpenAI) only
+        need the shared text up front. Routes listed in
+        ``CACHE_CONTROL_ROUTES`` also get the prefix as a separate content
+        part carrying an ephemeral ``cache_control`` marker.
+        """
+        if not shared_prefix:
+            return user_msg
+        prefixes = CACHE_CONTROL_ROUTES.get(self.provider)
+        if prefixes and model.startswith(prefixes):
+            return [
+                {
+                    "type": "text",
+                    "text": shared_prefix,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": user_msg},
+            ]
+        return shared_prefix + user_msg
+
     async def close(self) -> None:
-        await self.client.close()
+        """Close the client; a pooled connection is released back to the registry."""
+        if self._pooled_http is not None:
+            from council_api.pool import release_http_client
+
+            pooled, self._pooled_http = self._pooled_http, None
+            await release_http_client(pooled)
+        else:
+            await self.client.close()
 
     # ------------------------------------------------------------------
     # JSON parsing utilities
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _extract_json_candidates(text: str) -> list[str]:
-        stripped = text.strip()
-        candidates: list[str] = []
-
-        if stripped:
-            candidates.append(stripped)
-
-        fenced_blocks = re.findall(
-            r"```(?:json)?\s*(.*?)```", stripped, flags=re.IGNORECASE | re.DOTALL,
-        )
-        for block in fenced_blocks:
-            block = block.strip()
-            if block:
-                candidates.append(block)
-
-        first_brace = stripped.find("{")
-        last_brace = stripped.rfind("}")
-        if first_brace != -1 and last_brace != -1 and last_brace > first_brace:
-            candidates.append(stripped[first_brace : last_brace + 1].strip())
-
-        deduped: list[str] = []
-        seen: set[str] = set()
-        for candidate in candidates:
-            if candidate not in seen:
-                seen.add(candidate)
-                deduped.append(candidate)
-        return deduped
-
-    @classmethod
-    def _parse_json_response(cls, text: str) -> dict:
-        errors: list[str] = []
-        for candidate in cls._extract_json_candidates(text):
-            try:
-                parsed = json.loads(candidate)
-            except json.JSONDecodeError as exc:
-                errors.append(f"{exc.msg} (line {exc.lineno}, col {exc.colno})")
-                continue
-            if isinstance(parsed, dict):
-                return parsed
-            errors.append(f"Expected JSON object, got {type(parsed).__name__}")
-
-        snippet = text[:240].replace("\n", " ")
-        raise LLMResponseFormatError(
-            f"Unable to parse JSON object from response. Snippet: {snippet!r}. "
-            f"Errors: {errors[:2]}"
-        )
+    def _parse_json_response(text: str, schema: dict | None = None) -> dict:
+        try:
+            return extract_json_object(text, schema)
+        except ValueError as exc:
+            snippet = text[:240].replace("\n", " ")
+            raise LLMResponseFormatError(
+                f"Unable to parse JSON object from response. Snippet: {snippet!r}. "
+                f"Errors: {exc}"
+            ) from None
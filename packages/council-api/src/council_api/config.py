@@ -1,4 +1,8 @@
-"""Model registry and council defaults."""
+"""Model registry and council defaults.
+
+Live pricing comes from the cached OpenRouter catalogue in
+``council_api.registry``.
+"""
 
 from __future__ import annotations
 
@@ -6,8 +10,6 @@ import json
 import logging
 from pathlib import Path
 
-import httpx
-
 logger = logging.getLogger(__name__)
 
 ALLOWED_PROVIDERS = {"anthropic", "openai", "google"}
@@ -103,10 +105,13 @@ COUNCIL_DEFAULT_CHAIRMAN: str = get_chairman_default()
 OPENROUTER_MODELS_URL = "https://openrouter.ai/api/v1/models"
 
 
+_DISPLAY_NAMES: dict[str, str] = {m["id"]: m["name"] for m in AVAILABLE_MODELS}
+
+
 def model_display_name(model_id: str) -> str:
     """Human-readable name for a model ID."""
-    names = {m["id"]: m["name"] for m in AVAILABLE_MODELS}
-    return names.get(model_id, model_id.split("/")[-1])
+    name = _DISPLAY_NAMES.get(model_id)
+    return name if name is not None else model_id.split("/")[-1]
 
 
 def _auto_tier(input_price_per_m: float) -> str:
@@ -140,57 +145,75 @@ def save_models(path: str | Path, models: list[dict[str, str]]) -> None:
 
 
 async def _fetch_openrouter_data() -> list[dict] | None:
-    try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.get(OPENROUTER_MODELS_URL)
-            resp.raise_for_status()
-            return resp.json().get("data", [])
-    except Exception:
-        logger.warning("Could not reach OpenRouter API")
-        return None
+    """OpenRouter catalogue entries from the registry snapshot (revalidated if stale)."""
+    # Deferred: the registry (and httpx) are only needed for pricing
+    from council_api.registry import get_model_registry
 
+    return await get_model_registry().ensure() or None
 
-def _enrich_with_pricing(
-    models: list[dict[str, str]], or_data: list[dict],
-) -> list[dict[str, str]]:
-    price_map: dict[str, dict[str, str]] = {}
-    for entry in or_data:
-        mid = entry.get("id", "")
-        pricing = entry.get("pricing", {})
-        try:
-            inp = float(pricing.get("prompt", "0")) * 1_000_000
-            out = float(pricing.get("completion", "0")) * 1_000_000
-            price_map[mid] = {
-                "input_price": f"${inp:.2f}",
-                "output_price": f"${out:.2f}",
-            }
-        except (ValueError, TypeError):
-            price_map[mid] = {"input_price": "N/A", "output_price": "N/A"}
 
-    enriched = []
-    for m in models:
-        m2 = m.copy()
-        prices = price_map.get(m2["id"], {})
-        m2["input_price"] = prices.get("input_price", "N/A")
-        m2["output_price"] = prices.get("output_price", "N/A")
-        m2["provider"] = m2["id"].split("/")[0]
-        enriched.append(m2)
-    return enriched
+def _price_per_million(entry: dict) -> tuple[float, float]:
+    """(input, output) USD per million tokens from an OpenRouter model entry."""
+    pricing = entry.get("pricing", {})
+    inp = float(pricing.get("prompt", "0")) * 1_000_000
+    out = float(pricing.get("completion", "0")) * 1_000_000
+    return inp, out
 
 
 async def fetch_model_pricing(
     base_models: list[dict[str, str]] | None = None,
 ) -> list[dict[str, str]]:
-    """Fetch pricing from OpenRouter and merge into a model list."""
-    models = [m.copy() for m in (base_models or AVAILABLE_MODELS)]
-    or_data = await _fetch_openrouter_data()
-    if or_data is None:
-        for m in models:
-            m.setdefault("input_price", "N/A")
-            m.setdefault("output_price", "N/A")
-            m.setdefault("provider", m["id"].split("/")[0])
-        return models
-    return _enrich_with_pricing(models, or_data)
+    """Merge OpenRouter pricing from the model registry into a model list."""
+    from council_api.registry import get_model_registry
+
+    registry = get_model_registry()
+    await registry.ensure()
+    models = []
+    for m in base_models or AVAILABLE_MODELS:
+        m2 = m.copy()
+        price = registry.price(m2["id"])
+        m2["input_price"] = f"${price[0]:.2f}" if price else "N/A"
+        m2["output_price"] = f"${price[1]:.2f}" if price else "N/A"
+        m2["provider"] = m2["id"].split("/")[0]
+        models.append(m2)
+    return models
+
+
+async def fetch_price_table() -> dict[str, tuple[float, float]]:
+    """OpenRouter pricing as ``{model_id: (input, output)}`` USD per million tokens.
+
+    Served from the model registry snapshot, revalidated first if stale.
+    The returned dict is updated in place when the registry refreshes.
+    It is empty if OpenRouter has never been reached.
+    """
+    from council_api.registry import get_model_registry
+
+    registry = get_model_registry()
+    await registry.ensure()
+    return registry.prices
+
+
+def cached_price_table() -> dict[str, tuple[float, float]]:
+    """Like ``fetch_price_table`` but from the last snapshot only (no network)."""
+    from council_api.registry import get_model_registry
+
+    return get_model_registry().prices
+
+
+def estimate_cost(
+    prices: dict[str, tuple[float, float]], model_id: str,
+    prompt_tokens: int, completion_tokens: int,
+) -> float | None:
+    """Estimated USD cost of a call, or None if the model has no known price.
+
+    Reasoning tokens are billed as output and are already counted in
+    ``completion_tokens``.
+    """
+    price = prices.get(model_id)
+    if price is None:
+        return None
+    inp, out = price
+    return (prompt_tokens * inp + completion_tokens * out) / 1_000_000
 
 
 async def fetch_all_provider_models() -> list[dict[str, str]]:
@@ -206,10 +229,8 @@ async def fetch_all_provider_models() -> list[dict[str, str]]:
         if provider not in ALLOWED_PROVIDERS:
             continue
 
-        pricing = entry.get("pricing", {})
         try:
-            inp = float(pricing.get("prompt", "0")) * 1_000_000
-            out = float(pricing.get("completion", "0")) * 1_000_000
+            inp, out = _price_per_million(entry)
         except (ValueError, TypeError):
             inp, out = 0.0, 0.0
 
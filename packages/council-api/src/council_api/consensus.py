@@ -0,0 +1,123 @@
+"""Agreement detection over Stage 1 assessments.
+
+When every council member returns (nearly) the same JSON, peer review and
+chairman synthesis add cost without changing the answer. ``find_consensus``
+scores pairwise agreement between ``result_json`` objects; if the weakest
+pair still meets ``ConsensusPolicy.threshold``, ``run_council`` returns the
+most representative assessment directly and skips Stages 2 and 3.
+
+Agreement between two JSON values is a score in [0, 1]:
+- objects: mean score over the union of keys (a missing key scores 0)
+- arrays: mean element-wise score, penalised for differing lengths
+- numbers: 1 if within ``numeric_tolerance`` / ``relative_tolerance``
+- strings: ``text_similarity`` (default: equal after whitespace/case folding)
+- anything else: equality
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from council_api.models import CouncilAssessment
+
+
+def _normalised_equal(a: str, b: str) -> float:
+    return 1.0 if " ".join(a.split()).casefold() == " ".join(b.split()).casefold() else 0.0
+
+
+@dataclass
+class ConsensusPolicy:
+    """When Stage 1 agreement is strong enough to skip Stages 2 and 3.
+
+    Attributes
+    ----------
+    threshold:
+        Minimum pairwise agreement (over all pairs) required for consensus.
+    min_assessments:
+        Never short-circuit with fewer assessments than this.
+    fields:
+        Compare only these top-level fields (``None`` compares all).
+    numeric_tolerance, relative_tolerance:
+        Absolute / relative tolerance for numbers (see ``math.isclose``).
+    text_similarity:
+        ``(a, b) -> score`` for strings; defaults to normalised equality.
+    similarity:
+        ``(result_a, result_b) -> score`` replacing the field-wise
+        comparison entirely (e.g. embedding cosine similarity).
+    """
+
+    threshold: float = 1.0
+    min_assessments: int = 2
+    fields: tuple[str, ...] | None = None
+    numeric_tolerance: float = 0.0
+    relative_tolerance: float = 0.0
+    text_similarity: Callable[[str, str], float] = _normalised_equal
+    similarity: Callable[[dict, dict], float] | None = None
+
+    def compare(self, a: dict, b: dict) -> float:
+        """Agreement between two assessment results, in [0, 1]."""
+        if self.similarity is not None:
+            return self.similarity(a, b)
+        if self.fields is not None:
+            a = {k: a.get(k) for k in self.fields}
+            b = {k: b.get(k) for k in self.fields}
+        return self._value_score(a, b)
+
+    def _value_score(self, a: object, b: object) -> float:
+        if isinstance(a, bool) or isinstance(b, bool):
+            return 1.0 if a == b else 0.0
+        if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+            close = math.isclose(
+                a, b, rel_tol=self.relative_tolerance, abs_tol=self.numeric_tolerance,
+            )
+            return 1.0 if close else 0.0
+        if isinstance(a, str) and isinstance(b, str):
+            return self.text_similarity(a, b)
+        if isinstance(a, dict) and isinstance(b, dict):
+            keys = a.keys() | b.keys()
+            if not keys:
+                return 1.0
+            return sum(
+                self._value_score(a[k], b[k]) if k in a and k in b else 0.0
+                for k in keys
+            ) / len(keys)
+        if isinstance(a, list) and isinstance(b, list):
+            longest = max(len(a), len(b))
+            if not longest:
+                return 1.0
+            return sum(self._value_score(x, y) for x, y in zip(a, b)) / longest
+        return 1.0 if a == b else 0.0
+
+
+@dataclass
+class ConsensusReport:
+    agreed: bool
+    score: float  # weakest pairwise agreement
+    representative: CouncilAssessment | None  # highest mean agreement with the others
+
+
+def find_consensus(
+    assessments: list[CouncilAssessment], policy: ConsensusPolicy,
+) -> ConsensusReport:
+    """Score pairwise agreement and decide whether the council already agrees."""
+    n = len(assessments)
+    if n < max(2, policy.min_assessments):
+        return ConsensusReport(agreed=False, score=0.0, representative=None)
+
+    totals = [0.0] * n
+    weakest = 1.0
+    for i in range(n):
+        for j in range(i + 1, n):
+            score = policy.compare(assessments[i].result_json, assessments[j].result_json)
+            totals[i] += score
+            totals[j] += score
+            weakest = min(weakest, score)
+
+    best = max(range(n), key=lambda i: totals[i])
+    return ConsensusReport(
+        agreed=weakest >= policy.threshold,
+        score=round(weakest, 4),
+        representative=assessments[best],
+    )
@@ -12,32 +12,121 @@ atomic file-based state (inspired by agents-council).
 from __future__ import annotations
 
 import asyncio
-import json
+import contextvars
 import logging
 import re
-from collections import defaultdict
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
 from time import perf_counter
-
-from council_api.checkpoint import CouncilCheckpointer
-from council_api.client import LLMClient
-from council_api.config import AVAILABLE_MODELS, model_display_name
+from typing import TYPE_CHECKING
+
+from council_api.checkpoint import CheckpointStore, CouncilCheckpointer, FileCheckpointStore
+from council_api.client import LLMClient, _callback_stream, _resolve_provider, track_calls
+from council_api.config import AVAILABLE_MODELS, estimate_cost, model_display_name
+from council_api.consensus import ConsensusPolicy, find_consensus
+from council_api.hedging import HedgingPolicy, LatencyTracker
+from council_api.limits import CallLimiter
+from council_api.prompts import PromptOptions, format_assessment
+from council_api.ranking import (
+    RankingPolicy,
+    aggregate_rankings,
+    ballots_from_reviews,
+    parse_ranking_groups,
+)
+from council_api.routing import ModelPerformanceStore, RoutingPolicy
 from council_api.models import (
+    CallRecord,
     CouncilAssessment,
+    CouncilBatchResult,
+    CouncilJob,
     CouncilMeta,
     CouncilPeerReview,
     CouncilResult,
 )
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
 logger = logging.getLogger(__name__)
 
+LATE_POLICIES = ("drop", "followup")
+
+_NUMBERED_LABEL_RE = re.compile(r"\d+\.\s*(Assessment [A-Z])")
+
+
+@dataclass
+class _RunStats:
+    """Per-run telemetry shared by every task spawned inside one run_council."""
+
+    hedges: list[dict] = field(default_factory=list)
+    calls: list[CallRecord] = field(default_factory=list)
+    on_event: Callable[[dict], object] | None = None
+
+    def emit(self, event: dict) -> None:
+        if self.on_event is not None:
+            self.on_event(event)
+
+    def totals(self) -> dict:
+        """Token and cost totals over ``calls`` (CouncilMeta fields)."""
+        costs = [c.cost_usd for c in self.calls if c.cost_usd is not None]
+        return {
+            "calls": self.calls,
+            "prompt_tokens": sum(c.prompt_tokens for c in self.calls),
+            "completion_tokens": sum(c.completion_tokens for c in self.calls),
+            "cost_usd": round(sum(costs), 6) if costs else None,
+        }
+
+
+def _emit(event: dict) -> None:
+    """Send a progress event to the current run's ``on_event`` callback, if any."""
+    stats = _run_stats.get()
+    if stats is not None:
+        stats.emit(event)
+
+
+_run_stats: contextvars.ContextVar[_RunStats | None] = contextvars.ContextVar(
+    "council_run_stats", default=None,
+)
+
 
 class CouncilService:
     """Orchestrates a multi-model council review."""
 
-    def __init__(self, llm: LLMClient, *, max_tokens: int | None = None) -> None:
+    def __init__(
+        self,
+        llm: LLMClient,
+        *,
+        max_tokens: int | None = None,
+        limiter: CallLimiter | None = None,
+        hedging: HedgingPolicy | None = None,
+        latency: LatencyTracker | None = None,
+        streaming: bool = False,
+        prices: dict[str, tuple[float, float]] | None = None,
+        prompt_options: PromptOptions | None = None,
+        routing: RoutingPolicy | None = None,
+        performance: ModelPerformanceStore | None = None,
+        ranking: RankingPolicy | None = None,
+    ) -> None:
         self.llm = llm
+        self.streaming = streaming
+        self.prices = prices if prices is not None else {}
+        self.prompt_options = prompt_options or PromptOptions()
         self._max_tokens = max_tokens
+        self.limiter = limiter or CallLimiter()
+        self.hedging = hedging
+        self.latency = latency or (LatencyTracker() if hedging else None)
+        self.routing = routing
+        self.ranking = ranking or RankingPolicy()
+        self.performance = performance or (ModelPerformanceStore() if routing else None)
+        self._alt_clients: dict[str, LLMClient | None] = {}
+
+    async def close(self) -> None:
+        """Close clients opened for alternate hedge routes (not ``self.llm``)."""
+        for client in self._alt_clients.values():
+            if client is not None:
+                await client.close()
+        self._alt_clients.clear()
 
     async def run_council(
         self,
@@ -52,6 +141,15 @@ class CouncilService:
         stage3_prompt_builder: object | None = None,
         checkpoint_dir: str | Path | None = None,
         resume: bool = False,
+        checkpoint_store: CheckpointStore | None = None,
+        run_id: str | None = None,
+        stage2_quorum: int | None = None,
+        straggler_timeout: float | None = None,
+        late_policy: str = "drop",
+        consensus: ConsensusPolicy | float | None = None,
+        category: str = "default",
+        schema: dict | type[BaseModel] | None = None,
+        on_event: Callable[[dict], object] | None = None,
     ) -> CouncilResult:
         """Run the full 3-stage council process.
 
@@ -80,159 +178,610 @@ class CouncilService:
             Directory for checkpoint files. If provided, each stage's
             results are saved atomically for crash recovery and resumption.
         resume:
-            If True and checkpoint_dir is provided, resume from the last
-            completed stage of the most recent run.
+            If True and checkpointing is enabled, resume from the last
+            completed stage of the most recent run (or of ``run_id``),
+            re-issuing only Stage 1/2 calls missing from its participant log.
+        checkpoint_store:
+            A ``CheckpointStore`` to use instead of files in
+            ``checkpoint_dir`` (e.g. one ``SQLiteCheckpointStore`` shared
+            by a whole batch).
+        run_id:
+            Checkpoint under this run ID instead of a generated one. With
+            ``resume=True``, resume exactly this run.
+        stage2_quorum:
+            Start Stage 2 once this many Stage 1 assessments (including a
+            reused ``existing_result``) have arrived, instead of waiting for
+            every model. ``None`` (default) keeps the full barrier.
+        straggler_timeout:
+            Seconds to keep waiting for the remaining Stage 1 models after
+            the quorum is reached. ``None`` starts Stage 2 immediately.
+        late_policy:
+            What to do with Stage 1 models still running when Stage 2
+            starts. ``"drop"`` cancels them and records them in
+            ``meta.dropped_models``. ``"followup"`` lets them finish while
+            Stage 2 runs, then folds their assessments into a follow-up
+            review pass by the late models (``meta.late_models``).
+        consensus:
+            A ``ConsensusPolicy`` (or just its agreement threshold). If the
+            Stage 1 assessments agree at least that well, Stages 2 and 3
+            are skipped and the most representative assessment becomes the
+            final result (``meta.consensus``). Stragglers are cancelled.
+        category:
+            Prompt category for the model-performance history. With a
+            ``RoutingPolicy`` on the service, Stage 1 first queries the
+            sub-council it selects for this category (``meta.routed_models``)
+            and escalates to the remaining models if their assessments
+            disagree (``meta.escalated``).
+        schema:
+            JSON Schema dict or pydantic model class that Stage 1
+            assessments and the chairman's synthesis must match. It is
+            enforced with provider-native structured output where available
+            (see ``LLMClient.chat_json``).
+        on_event:
+            Optional callback receiving progress events as dicts with a
+            ``"type"`` key: ``"assessment"`` and ``"review"`` (one per
+            model), ``"stage1"``/``"stage2"`` (stage finished),
+            ``"consensus"`` (Stages 2 and 3 skipped) and
+            ``"chairman_delta"`` (Stage 3 text as it streams). Stage 3 is
+            streamed whenever ``on_event`` is set. See ``stream_council``.
         """
+        if late_policy not in LATE_POLICIES:
+            raise ValueError(
+                f"Unknown late_policy '{late_policy}'. Available: {', '.join(LATE_POLICIES)}"
+            )
+        if isinstance(consensus, (int, float)):
+            consensus = ConsensusPolicy(threshold=float(consensus))
         t_total = perf_counter()
-
-        # Set up checkpointing
-        ckpt = None
-        resume_from = 0
-        if checkpoint_dir:
-            checkpoint_path = Path(checkpoint_dir)
-            if resume:
-                probe = CouncilCheckpointer(checkpoint_path)
-                latest_run = probe.find_latest_run()
-                if latest_run:
-                    ckpt = CouncilCheckpointer(checkpoint_path, run_id=latest_run)
+        stats = _RunStats(on_event=on_event)
+        token = _run_stats.set(stats)
+        try:
+            # Set up checkpointing
+            ckpt = None
+            resume_from = 0
+            if checkpoint_dir or checkpoint_store:
+                store = checkpoint_store or FileCheckpointStore(Path(checkpoint_dir))
+                resume_id = run_id
+                if resume and resume_id is None:
+                    resume_id = store.latest_run()
+                if resume and resume_id:
+                    ckpt = CouncilCheckpointer(run_id=resume_id, store=store)
                     resume_from = ckpt.last_completed_stage()
-                    if resume_from > 0:
+                    if resume_from > 0 or ckpt.has_participant_log():
                         logger.info(
-                            "Resuming run %s from stage %d",
-                            latest_run, resume_from + 1,
+                            "Resuming run %s from stage %d", resume_id, resume_from + 1,
                         )
-                    else:
-                        ckpt = CouncilCheckpointer(checkpoint_path)
+                    elif run_id is None:
+                        ckpt = CouncilCheckpointer(store=store)
                 else:
-                    ckpt = CouncilCheckpointer(checkpoint_path)
-            else:
-                ckpt = CouncilCheckpointer(checkpoint_path)
-
-        # Stage 1
-        stage1_ms = 0
-        if resume_from >= 1 and ckpt:
-            saved = ckpt.load_stage1()
+                    ckpt = (
+                        CouncilCheckpointer(run_id=run_id, store=store)
+                        if run_id else CouncilCheckpointer(store=store)
+                    )
+
+            # Stage 1
+            stage1_ms = 0
+            late_tasks: dict[str, asyncio.Task] = {}
+            routed_models: list[str] = []
+            escalated = False
+            saved = ckpt.load_stage1() if resume_from >= 1 and ckpt else None
             if saved:
                 assessments = [CouncilAssessment(**a) for a in saved]
                 logger.info("Stage 1: loaded %d assessments from checkpoint", len(assessments))
             else:
+                completed = {}
+                if ckpt and resume:
+                    completed = {
+                        model: CouncilAssessment(**data)
+                        for model, data in ckpt.load_participants(1).items()
+                    }
+                    if completed:
+                        logger.info(
+                            "Stage 1: recovered %d assessments from participant log, "
+                            "pending: %s",
+                            len(completed),
+                            ckpt.pending_participants(council_models, list(completed)),
+                        )
+                routed = council_models
+                if self.routing and self.performance:
+                    routed = self.routing.select(council_models, self.performance, category)
+                    # Keep models already answered in a resumed run
+                    routed = [m for m in council_models if m in routed or m in completed]
+                    if len(routed) < len(council_models):
+                        routed_models = routed
+                        logger.info(
+                            "Council routing (%s): querying %d/%d models: %s",
+                            category, len(routed), len(council_models), routed,
+                        )
                 t1 = perf_counter()
-                assessments = await self._stage1_collect(
-                    system_prompt, user_msg, council_models,
+                assessments, late_tasks = await self._stage1_collect(
+                    system_prompt, user_msg, routed,
                     existing_result=existing_result,
                     existing_model=existing_model,
+                    quorum=stage2_quorum,
+                    straggler_timeout=straggler_timeout,
+                    completed=completed,
+                    log=ckpt,
+                    schema=schema,
                 )
+                if routed_models and self._should_escalate(assessments):
+                    # The reused assessment is already in, whether or not it was routed
+                    reserve = [
+                        m for m in council_models
+                        if m not in routed and m not in completed
+                        and not (existing_result and m == existing_model)
+                    ]
+                    logger.info("Council routing: sub-council disagrees, escalating to %s", reserve)
+                    _emit({"type": "escalation", "models": reserve})
+                    more, more_late = await self._stage1_collect(
+                        system_prompt, user_msg, reserve,
+                        quorum=stage2_quorum,
+                        straggler_timeout=straggler_timeout,
+                        completed=completed,
+                        log=ckpt,
+                        schema=schema,
+                    )
+                    assessments.extend(more)
+                    late_tasks.update(more_late)
+                    escalated = True
                 stage1_ms = int((perf_counter() - t1) * 1000)
-        else:
-            t1 = perf_counter()
-            assessments = await self._stage1_collect(
-                system_prompt, user_msg, council_models,
-                existing_result=existing_result,
-                existing_model=existing_model,
-            )
-            stage1_ms = int((perf_counter() - t1) * 1000)
-
-        if not assessments:
-            return CouncilResult(
-                final_result={},
-                assessments=[],
-                peer_reviews=[],
-                meta=CouncilMeta(
-                    council_models=council_models,
-                    chairman_model=chairman_model,
-                    stage1_ms=stage1_ms,
-                    total_ms=int((perf_counter() - t_total) * 1000),
-                    reused_model=existing_model,
-                ),
-            )
-
-        for i, a in enumerate(assessments):
-            a.label = f"Assessment {chr(65 + i)}"
-
-        # Checkpoint Stage 1
-        if ckpt and resume_from < 1:
-            ckpt.save_stage1(
-                [a.model_dump() for a in assessments],
-                [a.model for a in assessments],
-            )
-            pending = ckpt.pending_participants(
-                council_models,
-                [a.model for a in assessments],
-            )
-            if pending:
-                logger.warning("Stage 1: pending models: %s", pending)
-
-        # Stage 2
-        stage2_ms = 0
-        label_to_model = {a.label: a.model for a in assessments}
 
-        if resume_from >= 2 and ckpt:
-            saved = ckpt.load_stage2()
+            _emit({"type": "stage1", "models": [a.model for a in assessments], "ms": stage1_ms})
+
+            dropped_models: list[str] = []
+            if late_tasks and (late_policy == "drop" or not assessments):
+                dropped_models = await self._cancel_stragglers(late_tasks)
+                late_tasks = {}
+
+            if not assessments:
+                if ckpt:
+                    ckpt.close()
+                return self._finish_run(category, CouncilResult(
+                    final_result={},
+                    assessments=[],
+                    peer_reviews=[],
+                    meta=CouncilMeta(
+                        council_models=council_models,
+                        chairman_model=chairman_model,
+                        stage1_ms=stage1_ms,
+                        total_ms=int((perf_counter() - t_total) * 1000),
+                        reused_model=existing_model,
+                        dropped_models=dropped_models,
+                        hedges=stats.hedges,
+                        routed_models=routed_models,
+                        escalated=escalated,
+                        **stats.totals(),
+                    ),
+                ))
+
+            for i, a in enumerate(assessments):
+                a.label = f"Assessment {chr(65 + i)}"
+
+            # Checkpoint Stage 1
+            if ckpt and resume_from < 1:
+                ckpt.save_stage1(
+                    [a.model_dump() for a in assessments],
+                    [a.model for a in assessments],
+                )
+                pending = ckpt.pending_participants(
+                    council_models,
+                    [a.model for a in assessments],
+                )
+                if pending:
+                    logger.warning("Stage 1: pending models: %s", pending)
+
+            # Early consensus: skip peer review and synthesis when Stage 1 agrees
+            consensus_score = None
+            if consensus is not None and not (ckpt and ckpt.load_stage2()):
+                report = find_consensus(assessments, consensus)
+                if report.agreed:
+                    if late_tasks:
+                        dropped_models = await self._cancel_stragglers(late_tasks)
+                        late_tasks = {}
+                    winner = report.representative
+                    logger.info(
+                        "Council consensus (agreement %.3f): skipping Stages 2-3, using %s",
+                        report.score, winner.model,
+                    )
+                    _emit({"type": "consensus", "model": winner.model, "score": report.score})
+                    final_result = dict(winner.result_json)
+                    if ckpt:
+                        ckpt.save_stage3(final_result, winner.model)
+                        ckpt.close()
+                    if self.latency:
+                        self.latency.save()
+                    return self._finish_run(category, CouncilResult(
+                        final_result=final_result,
+                        assessments=assessments,
+                        peer_reviews=[],
+                        meta=CouncilMeta(
+                            council_models=council_models,
+                            chairman_model=chairman_model,
+                            stage1_ms=stage1_ms,
+                            total_ms=int((perf_counter() - t_total) * 1000),
+                            reused_model=existing_model,
+                            dropped_models=dropped_models,
+                            hedges=stats.hedges,
+                            routed_models=routed_models,
+                            escalated=escalated,
+                            consensus=True,
+                            consensus_score=report.score,
+                            consensus_model=winner.model,
+                            **stats.totals(),
+                        ),
+                    ))
+                consensus_score = report.score
+                logger.info("Council Stage 1 agreement %.3f below threshold", report.score)
+
+            # Stage 2
+            stage2_ms = 0
+            late_models: list[str] = []
+            saved = ckpt.load_stage2() if resume_from >= 2 and ckpt else None
             if saved:
                 reviews_data, saved_rankings = saved
                 peer_reviews = [CouncilPeerReview(**r) for r in reviews_data]
                 aggregate_rankings = saved_rankings
                 logger.info("Stage 2: loaded %d reviews from checkpoint", len(peer_reviews))
             else:
+                completed_reviews = {}
+                if ckpt and resume:
+                    completed_reviews = {
+                        model: CouncilPeerReview(**data)
+                        for model, data in ckpt.load_participants(2).items()
+                    }
                 t2 = perf_counter()
                 peer_reviews, label_to_model = await self._stage2_peer_review(
                     system_prompt, user_msg, assessments, council_models,
                     custom_system=stage2_system,
+                    completed=completed_reviews,
+                    log=ckpt,
                 )
+
+                # Follow-up pass: stragglers kept running during Stage 2
+                if late_tasks:
+                    late_assessments = await self._collect_stragglers(late_tasks)
+                    if late_assessments:
+                        for i, a in enumerate(late_assessments, start=len(assessments)):
+                            a.label = f"Assessment {chr(65 + i)}"
+                        assessments.extend(late_assessments)
+                        late_models = [a.model for a in late_assessments]
+                        followup_reviews, label_to_model = await self._stage2_peer_review(
+                            system_prompt, user_msg, assessments, late_models,
+                            custom_system=stage2_system,
+                            log=ckpt,
+                        )
+                        peer_reviews.extend(followup_reviews)
+                        if ckpt:
+                            ckpt.save_stage1(
+                                [a.model_dump() for a in assessments],
+                                [a.model for a in assessments],
+                            )
+
                 stage2_ms = int((perf_counter() - t2) * 1000)
                 aggregate_rankings = self._calculate_aggregate_rankings(
                     peer_reviews, label_to_model,
                 )
-        else:
-            t2 = perf_counter()
-            peer_reviews, label_to_model = await self._stage2_peer_review(
-                system_prompt, user_msg, assessments, council_models,
-                custom_system=stage2_system,
-            )
-            stage2_ms = int((perf_counter() - t2) * 1000)
-            aggregate_rankings = self._calculate_aggregate_rankings(
-                peer_reviews, label_to_model,
-            )
 
-        # Checkpoint Stage 2
-        if ckpt and resume_from < 2:
-            ckpt.save_stage2(
-                [r.model_dump() for r in peer_reviews],
-                [r.model for r in peer_reviews],
-                aggregate_rankings=aggregate_rankings,
+            _emit({"type": "stage2", "aggregate_rankings": aggregate_rankings, "ms": stage2_ms})
+
+            # Checkpoint Stage 2
+            if ckpt and resume_from < 2:
+                ckpt.save_stage2(
+                    [r.model_dump() for r in peer_reviews],
+                    [r.model for r in peer_reviews],
+                    aggregate_rankings=aggregate_rankings,
+                )
+
+            # Stage 3
+            t3 = perf_counter()
+            final_result, stage3_fallback = await self._stage3_synthesise(
+                system_prompt, user_msg, assessments, peer_reviews,
+                chairman_model,
+                custom_prompt_builder=stage3_prompt_builder,
+                schema=schema,
             )
+            stage3_ms = int((perf_counter() - t3) * 1000)
+
+            # Checkpoint Stage 3
+            if ckpt:
+                ckpt.save_stage3(final_result, chairman_model)
+                ckpt.close()
+
+            total_ms = int((perf_counter() - t_total) * 1000)
+            if self.latency:
+                self.latency.save()
+
+            return self._finish_run(category, CouncilResult(
+                final_result=final_result,
+                assessments=assessments,
+                peer_reviews=peer_reviews,
+                meta=CouncilMeta(
+                    council_models=council_models,
+                    chairman_model=chairman_model,
+                    stage1_ms=stage1_ms,
+                    stage2_ms=stage2_ms,
+                    stage3_ms=stage3_ms,
+                    total_ms=total_ms,
+                    reused_model=existing_model,
+                    aggregate_rankings=aggregate_rankings,
+                    stage3_fallback=stage3_fallback,
+                    late_models=late_models,
+                    dropped_models=dropped_models,
+                    hedges=stats.hedges,
+                    routed_models=routed_models,
+                    escalated=escalated,
+                    consensus_score=consensus_score,
+                    **stats.totals(),
+                ),
+            ))
+        finally:
+            _run_stats.reset(token)
+
+    def _finish_run(self, category: str, result: CouncilResult) -> CouncilResult:
+        """Fold a finished run into the model-performance history."""
+        if self.performance:
+            self.performance.record(result, category)
+            self.performance.save()
+        return result
+
+    def _should_escalate(self, assessments: list[CouncilAssessment]) -> bool:
+        """Whether a routed sub-council's Stage 1 result needs the full council."""
+        if len(assessments) < self.routing.min_models:
+            return True
+        if not self.routing.escalate_on_disagreement:
+            return False
+        return not find_consensus(assessments, self.routing.agreement).agreed
+
+    async def stream_council(self, *args, **kwargs) -> AsyncIterator[dict]:
+        """Run a council, yielding progress events as they happen.
+
+        Takes the same arguments as ``run_council`` (except ``on_event``).
+        Yields the events described there, including the chairman's output
+        as ``{"type": "chairman_delta", "text": ...}`` chunks, and finally
+        ``{"type": "result", "result": CouncilResult}``.
+        """
+        result: list[CouncilResult] = []
+
+        async def _run(emit: Callable[[dict], None]) -> None:
+            result.append(await self.run_council(*args, on_event=emit, **kwargs))
+
+        async for event in _callback_stream(_run):
+            yield event
+        yield {"type": "result", "result": result[0]}
+
+    async def run_council_batch(
+        self,
+        jobs: Iterable[CouncilJob | dict],
+        *,
+        max_councils: int = 8,
+        sink: str | Path | None = None,
+        checkpoint_store: CheckpointStore | None = None,
+        resume: bool = False,
+    ) -> list[CouncilBatchResult]:
+        """Run many councils on one event loop, sharing this service's limiter.
 
-        # Stage 3
-        t3 = perf_counter()
-        final_result, stage3_fallback = await self._stage3_synthesise(
-            system_prompt, user_msg, assessments, peer_reviews,
-            chairman_model,
-            custom_prompt_builder=stage3_prompt_builder,
+        Parameters
+        ----------
+        jobs:
+            ``CouncilJob`` instances (or dicts with the same fields).
+        max_councils:
+            Maximum number of councils in progress at once. Individual LLM
+            calls are additionally capped by ``self.limiter``.
+        sink:
+            Optional JSONL path. Each ``CouncilBatchResult`` is appended as
+            soon as its council finishes, so partial results survive a crash.
+        checkpoint_store:
+            Checkpoint every council in this store under its job ID as the
+            run ID. With ``resume=True``, each job resumes its own run.
+
+        Returns results in the same order as ``jobs``. A failing council
+        yields a result with ``error`` set rather than aborting the batch.
+        """
+        parsed = [j if isinstance(j, CouncilJob) else CouncilJob(**j) for j in jobs]
+        gate = asyncio.Semaphore(max(1, max_councils))
+
+        async def _run_one(job: CouncilJob) -> CouncilBatchResult:
+            async with gate:
+                try:
+                    options = dict(job.options)
+                    if checkpoint_store is not None:
+                        options.setdefault("checkpoint_store", checkpoint_store)
+                        options.setdefault("run_id", job.id)
+                        options.setdefault("resume", resume)
+                    result = await self.run_council(
+                        job.system_prompt, job.user_msg,
+                        job.council_models, job.chairman_model,
+                        **options,
+                    )
+                    return CouncilBatchResult(job_id=job.id, result=result)
+                except Exception as exc:
+                    logger.exception("Council batch: job %s failed", job.id)
+                    return CouncilBatchResult(job_id=job.id, error=str(exc))
+
+        tasks = [asyncio.create_task(_run_one(job)) for job in parsed]
+        out = open(sink, "w") if sink else None
+        try:
+            for done in asyncio.as_completed(tasks):
+                item = await done
+                if out:
+                    out.write(item.model_dump_json() + "\n")
+                    out.flush()
+        finally:
+            if out:
+                out.close()
+
+        results = [t.result() for t in tasks]
+        logger.info(
+            "Council batch: %d/%d jobs succeeded (peak %d calls in flight)",
+            sum(1 for r in results if r.error is None), len(results),
+            self.limiter.peak_in_flight,
         )
-        stage3_ms = int((perf_counter() - t3) * 1000)
-
-        # Checkpoint Stage 3
-        if ckpt:
-            ckpt.save_stage3(final_result, chairman_model)
-
-        total_ms = int((perf_counter() - t_total) * 1000)
-
-        return CouncilResult(
-            final_result=final_result,
-            assessments=assessments,
-            peer_reviews=peer_reviews,
-            meta=CouncilMeta(
-                council_models=council_models,
-                chairman_model=chairman_model,
-                stage1_ms=stage1_ms,
-                stage2_ms=stage2_ms,
-                stage3_ms=stage3_ms,
-                total_ms=total_ms,
-                reused_model=existing_model,
-                aggregate_rankings=aggregate_rankings,
-                stage3_fallback=stage3_fallback,
-            ),
+        return results
+
+    # ------------------------------------------------------------------
+    # LLM calls (limiter, latency tracking, hedging)
+    # ------------------------------------------------------------------
+
+    async def _call_llm(
+        self, stage: str, method: str, model_id: str, system: str, prompt: str,
+        **kwargs,
+    ):
+        """Make one stage call: ``self.llm.<method>(system, prompt, model=model_id)``.
+
+        Latencies of successful primary requests are recorded in
+        ``self.latency``; stages listed in ``self.hedging.stages`` are hedged
+        against stragglers (except calls that stream deltas to a callback).
+        """
+        if self.hedging and stage in self.hedging.stages and "on_delta" not in kwargs:
+            return await self._hedged(stage, method, model_id, system, prompt, **kwargs)
+        return await self._invoke(
+            self.llm, stage, method, model_id, system, prompt, **kwargs,
+        )
+
+    async def _invoke(
+        self, client: LLMClient, stage: str, method: str, model_id: str,
+        system: str, prompt: str, *, hedge: bool = False, **kwargs,
+    ):
+        """Call ``client`` under the limiter and append a ``CallRecord`` to the run.
+
+        Only primary requests feed ``self.latency``: a hedge that wins caps
+        the observed time near the hedge delay, and a primary cancelled by
+        a winning hedge never completes, so neither pulls the quantile down.
+        """
+        t0 = perf_counter()
+        queue_s = 0.0
+        status = "error"
+        with track_calls() as usage:
+            try:
+                async with self.limiter.slot(client.provider, model_id):
+                    queue_s = perf_counter() - t0
+                    result = await getattr(client, method)(
+                        system, prompt, model=model_id, max_tokens=self._max_tokens, **kwargs,
+                    )
+                status = "ok"
+                if self.latency and not hedge:
+                    self.latency.record(model_id, perf_counter() - t0, stage)
+                return result
+            except asyncio.CancelledError:
+                status = "cancelled"
+                raise
+            finally:
+                self._record_call(
+                    stage, model_id, client.provider, usage,
+                    status=status, hedge=hedge,
+                    wall_s=perf_counter() - t0, queue_s=queue_s,
+                )
+
+    def _record_call(
+        self, stage: str, model_id: str, provider: str, usage, *,
+        status: str, hedge: bool, wall_s: float, queue_s: float,
+    ) -> None:
+        stats = _run_stats.get()
+        if stats is None:
+            return
+        cost = estimate_cost(
+            self.prices, model_id, usage.prompt_tokens, usage.completion_tokens,
+        )
+        stats.calls.append(CallRecord(
+            stage=stage,
+            model=model_id,
+            provider=provider,
+            status=status,
+            hedge=hedge,
+            cached=usage.cached,
+            requests=usage.requests,
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=usage.completion_tokens,
+            reasoning_tokens=usage.reasoning_tokens,
+            retries=usage.retries,
+            empty_retries=usage.empty_retries,
+            json_repairs=usage.json_repairs,
+            structured=usage.structured,
+            wall_ms=int(wall_s * 1000),
+            queue_ms=int((queue_s + usage.rate_wait_s) * 1000),
+            cost_usd=cost,
+        ))
+
+    async def _hedged(
+        self, stage: str, method: str, model_id: str, system: str, prompt: str,
+        **kwargs,
+    ):
+        """Race a duplicate request once the primary exceeds the model's p95."""
+        policy = self.hedging
+        delay = None
+        if self.latency and self.latency.count(model_id, stage) >= policy.min_samples:
+            delay = self.latency.quantile(model_id, policy.quantile, stage)
+        if delay is None:
+            delay = policy.default_delay
+        if delay is None:
+            return await self._invoke(
+                self.llm, stage, method, model_id, system, prompt, **kwargs,
+            )
+        delay = max(delay, policy.min_delay)
+
+        primary = asyncio.create_task(
+            self._invoke(self.llm, stage, method, model_id, system, prompt, **kwargs),
         )
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+
+            client = self._alternate_client(model_id) if policy.alternate_route else None
+            client = client or self.llm
+            hedge = asyncio.create_task(
+                self._invoke(
+                    client, stage, method, model_id, system, prompt, hedge=True, **kwargs,
+                ),
+            )
+            tasks.add(hedge)
+            logger.info(
+                "Council %s: hedging %s via %s after %.1fs",
+                stage, model_id, client.provider, delay,
+            )
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    if task.exception() is None:
+                        stats = _run_stats.get()
+                        if stats is not None:
+                            stats.hedges.append({
+                                "stage": stage,
+                                "model": model_id,
+                                "route": client.provider,
+                                "delay_s": round(delay, 3),
+                                "winner": "hedge" if task is hedge else "primary",
+                            })
+                        return task.result()
+            raise primary.exception()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _alternate_client(self, model_id: str) -> LLMClient | None:
+        """Client for the model's native provider, if it differs from ``self.llm``."""
+        try:
+            provider, _ = _resolve_provider(None, model_id, None)
+        except ValueError:
+            return None
+        if provider == self.llm.provider:
+            return None
+        if provider not in self._alt_clients:
+            self._alt_clients[provider] = LLMClient(
+                model=model_id,
+                max_tokens=self.llm.max_tokens,
+                json_retry_attempts=self.llm.json_retry_attempts,
+                provider=provider,
+                cache=self.llm.cache,
+                cache_mode=self.llm.cache_mode,
+                retry_policy=self.llm.retry_policy,
+            )
+        return self._alt_clients[provider]
 
     # ------------------------------------------------------------------
     # Stage 1
@@ -246,7 +795,21 @@ class CouncilService:
         *,
         existing_result: dict | None = None,
         existing_model: str | None = None,
-    ) -> list[CouncilAssessment]:
+        quorum: int | None = None,
+        straggler_timeout: float | None = None,
+        completed: dict[str, CouncilAssessment] | None = None,
+        log: CouncilCheckpointer | None = None,
+        schema: dict | type[BaseModel] | None = None,
+    ) -> tuple[list[CouncilAssessment], dict[str, asyncio.Task]]:
+        """Collect Stage 1 assessments.
+
+        Returns the assessments that arrived in time (in ``council_models``
+        order) and the still-running tasks of models that missed the
+        quorum/straggler deadline, keyed by model ID. Models in
+        ``completed`` (recovered from a participant log) are not queried
+        again; each new assessment is appended to ``log`` as it arrives.
+        """
+        completed = completed or {}
         assessments: list[CouncilAssessment] = []
 
         if existing_result and existing_model:
@@ -261,36 +824,89 @@ class CouncilService:
             if m != existing_model or existing_result is None
         ]
 
-        if not models_to_query:
-            return assessments
-
         async def _query_one(model_id: str) -> CouncilAssessment | None:
             try:
-                result = await self.llm.chat_json(
-                    system_prompt, user_msg,
-                    model=model_id, max_tokens=self._max_tokens,
+                result = await self._call_llm(
+                    "stage1", "chat_json", model_id, system_prompt, user_msg,
+                    schema=schema,
+                    **({"stream": True} if self.streaming else {}),
                 )
-                return CouncilAssessment(
+                _emit({"type": "assessment", "model": model_id})
+                assessment = CouncilAssessment(
                     model=model_id,
                     model_name=model_display_name(model_id),
                     result_json=result,
                 )
+                if log:
+                    log.append_participant(1, model_id, assessment.model_dump())
+                return assessment
             except Exception:
                 logger.exception("Council Stage 1: model %s failed", model_id)
                 return None
 
-        tasks = [_query_one(m) for m in models_to_query]
-        results = await asyncio.gather(*tasks)
+        tasks = {
+            m: asyncio.create_task(_query_one(m))
+            for m in models_to_query if m not in completed
+        }
+        pending = set(tasks.values())
 
-        for r in results:
-            if r is not None:
-                assessments.append(r)
+        if quorum is None:
+            if pending:
+                await asyncio.wait(pending)
+            pending = set()
+        else:
+            arrived = len(assessments) + len(completed)
+            while pending and arrived < quorum:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED,
+                )
+                arrived += sum(1 for t in done if t.result() is not None)
+            if pending and straggler_timeout:
+                _, pending = await asyncio.wait(pending, timeout=straggler_timeout)
+
+        late_tasks: dict[str, asyncio.Task] = {}
+        for model_id in models_to_query:
+            if model_id in completed:
+                assessments.append(completed[model_id])
+                continue
+            task = tasks[model_id]
+            if task in pending:
+                late_tasks[model_id] = task
+            elif task.result() is not None:
+                assessments.append(task.result())
 
         logger.info(
             "Council Stage 1: %d/%d models responded",
             len(assessments), len(council_models),
         )
-        return assessments
+        if late_tasks:
+            logger.info(
+                "Council Stage 1: quorum reached, still waiting on %s",
+                list(late_tasks),
+            )
+        return assessments, late_tasks
+
+    @staticmethod
+    async def _collect_stragglers(
+        late_tasks: dict[str, asyncio.Task],
+    ) -> list[CouncilAssessment]:
+        """Wait for late Stage 1 tasks and return the ones that succeeded."""
+        results = await asyncio.gather(*late_tasks.values())
+        late = [r for r in results if r is not None]
+        logger.info(
+            "Council Stage 1: %d/%d late models responded",
+            len(late), len(late_tasks),
+        )
+        return late
+
+    @staticmethod
+    async def _cancel_stragglers(late_tasks: dict[str, asyncio.Task]) -> list[str]:
+        """Cancel late Stage 1 tasks and return their model IDs."""
+        for task in late_tasks.values():
+            task.cancel()
+        await asyncio.gather(*late_tasks.values(), return_exceptions=True)
+        logger.warning("Council Stage 1: dropped late models: %s", list(late_tasks))
+        return list(late_tasks)
 
     # ------------------------------------------------------------------
     # Stage 2
@@ -304,24 +920,31 @@ class CouncilService:
         council_models: list[str],
         *,
         custom_system: str | None = None,
+        completed: dict[str, CouncilPeerReview] | None = None,
+        log: CouncilCheckpointer | None = None,
     ) -> tuple[list[CouncilPeerReview], dict[str, str]]:
+        completed = completed or {}
+        options = self.prompt_options
         assessments_text = "\n\n---\n\n".join(
-            f"**{a.label}:**\n```json\n{json.dumps(a.result_json, indent=2)}\n```"
+            f"**{a.label}:**\n```json\n{format_assessment(a.result_json, options)}\n```"
             for a in assessments
         )
 
         label_to_model = {a.label: a.model for a in assessments}
+        labels = set(label_to_model)
 
-        review_prompt = f"""You are reviewing multiple assessments of the same question/task.
+        # Identical for every reviewer, so it goes first (prefix caching)
+        shared_context = f"""You are reviewing multiple assessments of the same question/task.
 
 The original question/context given to all assessors:
-{user_msg[:3000]}
+{user_msg[:options.context_chars]}
 
 Here are the anonymised assessments:
 
 {assessments_text}
 
-Your task:
+"""
+        review_prompt = """Your task:
 1. Evaluate each assessment individually. What does it do well? What does it miss or get wrong?
 2. Identify specific areas of AGREEMENT across assessments.
 3. Identify specific areas of DISAGREEMENT and explain which position you find more convincing and why.
@@ -344,25 +967,44 @@ Now provide your evaluation and ranking:"""
         if not models_to_review:
             models_to_review = council_models
 
+        if options.cache_prefix:
+            prompt_kwargs = {"shared_prefix": shared_context}
+        else:
+            review_prompt = shared_context + review_prompt
+            prompt_kwargs = {}
+
         async def _review_one(model_id: str) -> CouncilPeerReview | None:
             try:
-                text = await self.llm.chat_text(
-                    review_system, review_prompt,
-                    model=model_id, max_tokens=self._max_tokens,
+                stream_kwargs = {}
+                if self.streaming:
+                    stream_kwargs = {
+                        "stream": True,
+                        "stop_when": lambda text: self._ranking_complete(text, labels),
+                    }
+                text = await self._call_llm(
+                    "stage2", "chat_text", model_id, review_system, review_prompt,
+                    **prompt_kwargs, **stream_kwargs,
                 )
-                parsed = self._parse_ranking_from_text(text)
-                return CouncilPeerReview(
+                groups = parse_ranking_groups(text)
+                parsed = [label for group in groups for label in group]
+                _emit({"type": "review", "model": model_id, "ranking": parsed})
+                review = CouncilPeerReview(
                     model=model_id,
                     model_name=model_display_name(model_id),
                     review_text=text,
                     parsed_ranking=parsed,
+                    ranking_groups=groups if len(groups) < len(parsed) else [],
                 )
+                if log:
+                    log.append_participant(2, model_id, review.model_dump())
+                return review
             except Exception:
                 logger.exception("Council Stage 2: model %s failed", model_id)
                 return None
 
-        tasks = [_review_one(m) for m in models_to_review]
-        results = await asyncio.gather(*tasks)
+        to_run = [m for m in models_to_review if m not in completed]
+        fresh = dict(zip(to_run, await asyncio.gather(*(_review_one(m) for m in to_run))))
+        results = [completed.get(m) or fresh[m] for m in models_to_review]
 
         reviews = [r for r in results if r is not None]
         logger.info(
@@ -384,13 +1026,15 @@ Now provide your evaluation and ranking:"""
         chairman_model: str,
         *,
         custom_prompt_builder: object | None = None,
+        schema: dict | type[BaseModel] | None = None,
     ) -> tuple[dict, bool]:
         if custom_prompt_builder and callable(custom_prompt_builder):
             chairman_prompt = custom_prompt_builder(assessments, peer_reviews, user_msg)
         else:
+            options = self.prompt_options
             assessments_text = "\n\n".join(
                 f"**{a.label}** (by {a.model_name}):\n"
-                f"```json\n{json.dumps(a.result_json, indent=2)}\n```"
+                f"```json\n{format_assessment(a.result_json, options)}\n```"
                 for a in assessments
             )
 
@@ -402,7 +1046,7 @@ Now provide your evaluation and ranking:"""
             chairman_prompt = f"""You are the Chairman of an LLM Council. Multiple AI models have independently assessed the same question, and then peer-reviewed each other's assessments.
 
 ORIGINAL CONTEXT:
-{user_msg[:3000]}
+{user_msg[:options.context_chars]}
 
 STAGE 1 -- Individual Assessments:
 {assessments_text}
@@ -421,9 +1065,19 @@ Where the council agrees, reflect that consensus. Where they disagree, use your
 You MUST respond with valid JSON matching the EXACT SAME SCHEMA as the individual assessments above. Respond ONLY with valid JSON."""
 
         try:
-            result = await self.llm.chat_json(
-                system_prompt, chairman_prompt,
-                model=chairman_model, max_tokens=self._max_tokens,
+            stats = _run_stats.get()
+            stream_kwargs = {}
+            if stats is not None and stats.on_event is not None:
+                stream_kwargs = {
+                    "stream": True,
+                    "on_delta": lambda text: _emit({"type": "chairman_delta", "text": text}),
+                }
+            elif self.streaming:
+                stream_kwargs = {"stream": True}
+            result = await self._call_llm(
+                "stage3", "chat_json", chairman_model, system_prompt, chairman_prompt,
+                schema=schema,
+                **stream_kwargs,
             )
             return result, False
         except Exception:
@@ -437,46 +1091,18 @@ You MUST respond with valid JSON matching the EXACT SAME SCHEMA as the individua
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _parse_ranking_from_text(text: str) -> list[str]:
-        if "FINAL RANKING:" in text:
-            parts = text.split("FINAL RANKING:")
-            if len(parts) >= 2:
-                ranking_section = parts[1]
-                numbered = re.findall(
-                    r"\d+\.\s*Assessment [A-Z]", ranking_section,
-                )
-                if numbered:
-                    return [
-                        re.search(r"Assessment [A-Z]", m).group()
-                        for m in numbered
-                    ]
-                matches = re.findall(r"Assessment [A-Z]", ranking_section)
-                return matches
-
-        return re.findall(r"Assessment [A-Z]", text)
+    def _ranking_complete(text: str, labels: set[str]) -> bool:
+        """True once the FINAL RANKING block of a streamed review lists every label."""
+        idx = text.rfind("FINAL RANKING:")
+        if idx == -1:
+            return False
+        return set(_NUMBERED_LABEL_RE.findall(text, idx)) >= labels
 
-    @staticmethod
     def _calculate_aggregate_rankings(
+        self,
         peer_reviews: list[CouncilPeerReview],
         label_to_model: dict[str, str],
     ) -> list[dict]:
-        positions: dict[str, list[int]] = defaultdict(list)
-
-        for review in peer_reviews:
-            for pos, label in enumerate(review.parsed_ranking, start=1):
-                if label in label_to_model:
-                    positions[label].append(pos)
-
-        aggregate = []
-        for label, pos_list in positions.items():
-            avg = sum(pos_list) / len(pos_list)
-            aggregate.append({
-                "label": label,
-                "model": label_to_model.get(label, "unknown"),
-                "model_name": model_display_name(label_to_model.get(label, "")),
-                "average_rank": round(avg, 2),
-                "rankings_count": len(pos_list),
-            })
-
-        aggregate.sort(key=lambda x: x["average_rank"])
-        return aggregate
+        return aggregate_rankings(
+            ballots_from_reviews(peer_reviews), label_to_model, self.ranking,
+        )
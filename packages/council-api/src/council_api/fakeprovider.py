@@ -0,0 +1,252 @@
+"""Deterministic fake OpenAI-compatible provider for offline runs.
+
+``FakeProviderTransport`` is an ``httpx`` transport that answers
+``POST .../chat/completions`` locally, so a real ``LLMClient`` (and the
+whole retry, rate-limit and streaming path behind it) can run without
+network access or API keys:
+
+    transport = FakeProviderTransport({"openai/": ModelProfile(latency_ms=800)})
+    llm = LLMClient(api_key="fake", http_client=httpx.AsyncClient(transport=transport))
+
+Each model gets a ``ModelProfile`` with a latency distribution and rates
+for server errors, 429 bursts, empty responses and malformed JSON. Random
+draws are seeded per request (seed, model, message hash and repeat count),
+so results do not depend on task scheduling.
+
+Replies follow the council protocol: ``chat_json`` requests get a JSON
+object, prompts asking for a ``FINAL RANKING`` get a ranking of every
+``Assessment X`` label they mention, and anything else gets plain text.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+import httpx
+
+_LABEL_RE = re.compile(r"Assessment [A-Z]\b")
+# Markers of LLMClient.chat_json requests (first attempt / repair attempt)
+_JSON_SUFFIX = "Respond ONLY with valid JSON."
+_JSON_REPAIR_PREFIX = "Your previous response was not valid JSON."
+
+
+@dataclass
+class ModelProfile:
+    """Simulated behaviour of one model.
+
+    Attributes
+    ----------
+    latency_ms:
+        Median time to the complete response.
+    latency_sigma:
+        Spread of the log-normal latency distribution (0 = constant).
+    error_rate:
+        Probability of an HTTP 500.
+    rate_limit_rate:
+        Probability that a request starts a 429 burst for this model.
+    rate_limit_burst_ms:
+        Length of a 429 burst; requests during it get 429 with Retry-After.
+    empty_rate:
+        Probability of an empty completion (as if reasoning used all tokens).
+    malformed_rate:
+        Probability that a JSON request gets a reply that is not valid JSON.
+    output_chars:
+        Approximate length of generated text.
+    """
+
+    latency_ms: float = 500.0
+    latency_sigma: float = 0.3
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    rate_limit_burst_ms: float = 2000.0
+    empty_rate: float = 0.0
+    malformed_rate: float = 0.0
+    output_chars: int = 400
+
+
+class FakeProviderTransport(httpx.AsyncBaseTransport):
+    """httpx transport that serves chat completions from ``ModelProfile``s.
+
+    Parameters
+    ----------
+    profiles:
+        Profiles keyed by model ID or model-ID prefix (longest match wins).
+    default:
+        Profile for models matching no key.
+    seed:
+        Base seed for all random draws.
+    time_scale:
+        Multiplier for simulated latencies and Retry-After values, e.g.
+        ``0.01`` to run a benchmark 100x faster than real time.
+    """
+
+    def __init__(
+        self,
+        profiles: dict[str, ModelProfile] | None = None,
+        *,
+        default: ModelProfile | None = None,
+        seed: int = 0,
+        time_scale: float = 1.0,
+    ) -> None:
+        self.profiles = dict(profiles or {})
+        self.default = default or ModelProfile()
+        self.seed = seed
+        self.time_scale = time_scale
+        self.requests = 0
+        self.status_counts: Counter[int] = Counter()
+        self._seen: Counter[str] = Counter()
+        self._burst_until: dict[str, float] = {}
+
+    def profile_for(self, model: str) -> ModelProfile:
+        matches = [key for key in self.profiles if model.startswith(key)]
+        if not matches:
+            return self.default
+        return self.profiles[max(matches, key=len)]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "POST" or not request.url.path.endswith("/chat/completions"):
+            return self._respond(404, {"error": {"message": "Not found"}})
+        body = json.loads(await request.aread())
+        model = body.get("model", "")
+        profile = self.profile_for(model)
+        rng = self._rng(model, body.get("messages", []))
+        self.requests += 1
+
+        now = time.monotonic()
+        if now < self._burst_until.get(model, 0.0):
+            return self._rate_limited(self._burst_until[model] - now)
+        if rng.random() < profile.rate_limit_rate:
+            burst = profile.rate_limit_burst_ms / 1000 * self.time_scale
+            self._burst_until[model] = now + burst
+            return self._rate_limited(burst)
+
+        latency = profile.latency_ms / 1000 * self.time_scale
+        if profile.latency_sigma:
+            latency *= rng.lognormvariate(0.0, profile.latency_sigma)
+
+        if rng.random() < profile.error_rate:
+            await asyncio.sleep(latency / 2)
+            return self._respond(500, {"error": {"message": "Simulated server error"}})
+
+        text = self._reply(body, profile, rng)
+        prompt_chars = sum(len(_content_text(m.get("content"))) for m in body.get("messages", []))
+        usage = {
+            "prompt_tokens": prompt_chars // 4,
+            "completion_tokens": len(text) // 4,
+            "total_tokens": prompt_chars // 4 + len(text) // 4,
+        }
+        if body.get("stream"):
+            return self._stream(body, model, text, usage, latency)
+        await asyncio.sleep(latency)
+        return self._respond(200, {
+            "id": f"fake-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop" if text else "length",
+            }],
+            "usage": usage,
+        })
+
+    # ---- Internal ----
+
+    def _rng(self, model: str, messages: list[dict]) -> random.Random:
+        digest = hashlib.sha256(
+            json.dumps(messages, sort_keys=True, default=str).encode("utf-8"),
+        ).hexdigest()[:16]
+        key = f"{model}:{digest}"
+        self._seen[key] += 1
+        return random.Random(f"{self.seed}:{key}:{self._seen[key]}")
+
+    def _reply(self, body: dict, profile: ModelProfile, rng: random.Random) -> str:
+        if rng.random() < profile.empty_rate:
+            return ""
+        messages = body.get("messages", [])
+        prompt = _content_text(messages[-1].get("content")) if messages else ""
+        filler = " ".join(
+            rng.choice(("council", "evidence", "argument", "risk", "estimate", "claim"))
+            for _ in range(max(1, profile.output_chars // 8))
+        )
+        if prompt.rstrip().endswith(_JSON_SUFFIX) or prompt.startswith(_JSON_REPAIR_PREFIX):
+            if rng.random() < profile.malformed_rate:
+                return f'{{"summary": "{filler[:80]}", "score": '
+            return json.dumps({
+                "summary": filler,
+                "score": rng.randint(1, 10),
+                "model": body.get("model", ""),
+            })
+        if "FINAL RANKING" in prompt:
+            labels = sorted(set(_LABEL_RE.findall(prompt)))
+            rng.shuffle(labels)
+            ranking = "\n".join(f"{i}. {label}" for i, label in enumerate(labels, 1))
+            return f"{filler}\n\nFINAL RANKING:\n{ranking}"
+        return filler
+
+    def _stream(
+        self, body: dict, model: str, text: str, usage: dict, latency: float,
+    ) -> httpx.Response:
+        include_usage = (body.get("stream_options") or {}).get("include_usage")
+        chunks = [text[i:i + 40] for i in range(0, len(text), 40)] or [""]
+        delay = latency / (len(chunks) + 1)
+
+        async def _events():
+            await asyncio.sleep(delay)
+            for piece in chunks:
+                await asyncio.sleep(delay)
+                yield _sse({
+                    "id": f"fake-{self.requests}",
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+                })
+            if include_usage:
+                yield _sse({
+                    "id": f"fake-{self.requests}",
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [],
+                    "usage": usage,
+                })
+            yield b"data: [DONE]\n\n"
+
+        self.status_counts[200] += 1
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/event-stream"},
+            content=_events(),
+        )
+
+    def _rate_limited(self, retry_after: float) -> httpx.Response:
+        return self._respond(
+            429,
+            {"error": {"message": "Simulated rate limit"}},
+            headers={"retry-after-ms": str(int(retry_after * 1000))},
+        )
+
+    def _respond(
+        self, status: int, payload: dict, *, headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        self.status_counts[status] += 1
+        return httpx.Response(status, json=payload, headers=headers)
+
+
+def _content_text(content: object) -> str:
+    if isinstance(content, list):
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return str(content or "")
+
+
+def _sse(payload: dict) -> bytes:
+    return f"data: {json.dumps(payload)}\n\n".encode("utf-8")
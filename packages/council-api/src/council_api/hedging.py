@@ -0,0 +1,98 @@
+"""Latency tracking and hedged-request policy for council stages.
+
+A hedged request fires a duplicate call when the original has not returned
+within the model's recent p95 latency, then keeps whichever finishes first.
+The p95 estimates come from a ``LatencyTracker`` that records successful
+call latencies per model and stage and persists them between runs.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+from council_api.checkpoint import _atomic_write_json, _read_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LATENCY_PATH = Path.home() / ".cache" / "council-api" / "latency.json"
+
+
+@dataclass
+class HedgingPolicy:
+    """When and how to hedge a slow Stage 1/2 call.
+
+    Attributes
+    ----------
+    quantile:
+        Fire the hedge once the call has run longer than this latency
+        quantile of the model's recorded history.
+    min_samples:
+        History needed before the quantile is trusted; until then
+        ``default_delay`` is used (``None`` disables hedging for that model).
+    min_delay:
+        Never hedge sooner than this many seconds.
+    alternate_route:
+        Send the hedge through the model's native provider (as resolved by
+        ``_resolve_provider``) when that differs from the primary route.
+    stages:
+        Which stages may hedge.
+    """
+
+    quantile: float = 0.95
+    min_samples: int = 5
+    min_delay: float = 1.0
+    default_delay: float | None = None
+    alternate_route: bool = True
+    stages: tuple[str, ...] = ("stage1", "stage2")
+
+
+class LatencyTracker:
+    """Rolling window of call latencies (seconds) per model and stage."""
+
+    def __init__(self, path: str | Path | None = DEFAULT_LATENCY_PATH, *, window: int = 200) -> None:
+        self.path = Path(path) if path else None
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._dirty = False
+        if self.path:
+            data = _read_json(self.path) or {}
+            for key, values in data.get("samples", {}).items():
+                self._samples[key] = deque(values[-window:], maxlen=window)
+
+    @staticmethod
+    def _key(model: str, stage: str) -> str:
+        return f"{stage}:{model}"
+
+    def record(self, model: str, seconds: float, stage: str = "stage1") -> None:
+        key = self._key(model, stage)
+        samples = self._samples.setdefault(key, deque(maxlen=self.window))
+        samples.append(round(seconds, 4))
+        self._dirty = True
+
+    def count(self, model: str, stage: str = "stage1") -> int:
+        return len(self._samples.get(self._key(model, stage), ()))
+
+    def quantile(self, model: str, q: float, stage: str = "stage1") -> float | None:
+        """Nearest-rank quantile of the recorded latencies, or None if no history."""
+        samples = self._samples.get(self._key(model, stage))
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(q * len(ordered)))
+        return ordered[rank - 1]
+
+    def save(self) -> None:
+        """Persist the samples (no-op if nothing changed or no path is set)."""
+        if not self.path or not self._dirty:
+            return
+        try:
+            _atomic_write_json(
+                self.path, {"samples": {k: list(v) for k, v in self._samples.items()}},
+            )
+            self._dirty = False
+        except OSError as exc:
+            logger.warning("Could not save latency history to %s: %s", self.path, exc)
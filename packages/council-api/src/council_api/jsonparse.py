@@ -0,0 +1,263 @@
+"""Extracting the JSON object from an LLM response in one pass.
+
+Models wrap their JSON in markdown fences, reasoning preambles and
+trailing commentary. ``extract_json_object`` first tries the whole
+response, so the common, well-behaved case costs one parse. Otherwise it
+walks the text once. A compiled regex jumps to the next plausible object
+start (``{`` followed by ``"`` or ``}``), skipping prose such as ``{x}``
+without a Python-level loop. ``json.JSONDecoder.raw_decode`` then parses
+the object in place and reports where it ends, so no candidate slices
+are built. A span that fails to parse is skipped as a whole by a
+brace-balanced scan that ignores braces inside strings, so an object
+nested in a broken one is never returned.
+
+With a ``schema``, the first object that satisfies it wins, so an
+example object in a reasoning preamble does not shadow the answer.
+Without a match the first object is returned. ``schema_errors`` checks
+the JSON Schema subset that prompts typically describe: ``type``,
+``required``, ``properties``, ``items`` and ``enum``.
+
+The whole-response parse uses ``orjson`` or ``msgspec`` when installed
+(``pip install council-api[fastjson]``). Both reject ``NaN``/``Infinity``,
+in which case the stdlib scan still finds the object.
+
+``JsonObjectScanner`` applies the same rules incrementally to a streamed
+response, so ``chat_json(stream=True)`` can stop at the first object.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable
+
+# Characters that change scanner state inside an object / inside a string
+_OBJECT_TOKEN_RE = re.compile(r'[{}"]')
+_STRING_TOKEN_RE = re.compile(r'["\\]')
+# A ``{`` that can open a JSON object (as opposed to prose like ``{x}``)
+_OBJECT_OPEN_RE = re.compile(r'\{\s*["}]')
+
+_decoder = json.JSONDecoder()
+
+_JSON_TYPES: dict[str, type | tuple[type, ...]] = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "null": type(None),
+}
+
+_loads: Callable[[str], object] | None = None
+_backend = "json"
+
+
+def _select_backend() -> Callable[[str], object]:
+    global _loads, _backend
+    try:
+        import orjson
+
+        _loads, _backend = orjson.loads, "orjson"
+    except ImportError:
+        try:
+            import msgspec
+
+            _loads, _backend = msgspec.json.decode, "msgspec"
+        except ImportError:
+            _loads, _backend = json.loads, "json"
+    return _loads
+
+
+def json_backend() -> str:
+    """Name of the decoder used for candidate spans."""
+    if _loads is None:
+        _select_backend()
+    return _backend
+
+
+def loads(text: str) -> object:
+    """Decode JSON with the fastest available backend (raises ``ValueError``)."""
+    return (_loads or _select_backend())(text)
+
+
+def _error_text(exc: ValueError) -> str:
+    if isinstance(exc, json.JSONDecodeError):
+        return f"{exc.msg} (line {exc.lineno}, col {exc.colno})"
+    return str(exc)
+
+
+def schema_errors(value: object, schema: dict, path: str = "$") -> list[str]:
+    """Violations of ``schema`` by ``value`` (empty if it conforms)."""
+    errors: list[str] = []
+    expected = schema.get("type")
+    if expected is not None:
+        names = expected if isinstance(expected, list) else [expected]
+        matched = any(
+            isinstance(value, _JSON_TYPES.get(name, object))
+            and not (isinstance(value, bool) and name in ("integer", "number"))
+            for name in names
+        )
+        if not matched:
+            return [f"{path}: expected {'/'.join(names)}, got {type(value).__name__}"]
+    if "enum" in schema and value not in schema["enum"]:
+        errors.append(f"{path}: {value!r} not in enum")
+    if isinstance(value, dict):
+        for key in schema.get("required", ()):
+            if key not in value:
+                errors.append(f"{path}: missing required key {key!r}")
+        for key, subschema in schema.get("properties", {}).items():
+            if key in value and isinstance(subschema, dict):
+                errors.extend(schema_errors(value[key], subschema, f"{path}.{key}"))
+    elif isinstance(value, list) and isinstance(schema.get("items"), dict):
+        for i, item in enumerate(value):
+            errors.extend(schema_errors(item, schema["items"], f"{path}[{i}]"))
+    return errors
+
+
+def _span_end(text: str, start: int) -> int:
+    """Index just past the balanced ``{...}`` opening at ``start``, or -1."""
+    depth, pos, in_string = 0, start, False
+    while True:
+        if in_string:
+            match = _STRING_TOKEN_RE.search(text, pos)
+            if match is None:
+                return -1
+            pos = match.end()
+            if match.group() == "\\":
+                pos += 1
+            else:
+                in_string = False
+            continue
+        match = _OBJECT_TOKEN_RE.search(text, pos)
+        if match is None:
+            return -1
+        pos = match.end()
+        ch = match.group()
+        if ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return pos
+
+
+def _undecided_open(text: str, pos: int) -> int:
+    """Where to resume a stream: at a trailing ``{`` still awaiting its next token."""
+    tail = text.rfind("{", pos)
+    if tail != -1 and not text[tail + 1 :].strip():
+        return tail
+    return len(text)
+
+
+class JsonObjectScanner:
+    """Incrementally finds the first complete top-level JSON object in growing text.
+
+    Call with the accumulated text after each streamed chunk; only the new
+    suffix is scanned. Returns True once a balanced ``{...}`` that parses to
+    a dict (and satisfies ``schema``, if given) has been seen; it is stored
+    in ``self.result``. String and escape state is tracked only inside
+    braces, so quotes in surrounding prose do not confuse it.
+    """
+
+    def __init__(self, schema: dict | None = None) -> None:
+        self.schema = schema
+        self.result: dict | None = None
+        self._pos = 0
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+
+    def __call__(self, text: str) -> bool:
+        if self.result is not None:
+            return True
+        pos, end = self._pos, len(text)
+        while pos < end:
+            if self._depth == 0:
+                match = _OBJECT_OPEN_RE.search(text, pos)
+                if match is None:
+                    pos = _undecided_open(text, pos)
+                    break
+                self._start, self._depth, pos = match.start(), 1, match.start() + 1
+                continue
+            if self._in_string:
+                match = _STRING_TOKEN_RE.search(text, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.end()
+                if match.group() == "\\":
+                    pos += 1  # may pass ``end``; resumed from there next call
+                else:
+                    self._in_string = False
+                continue
+            match = _OBJECT_TOKEN_RE.search(text, pos)
+            if match is None:
+                pos = end
+                break
+            pos = match.end()
+            ch = match.group()
+            if ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0 and self._accept(text[self._start : pos]):
+                    self._pos = pos
+                    return True
+        self._pos = pos
+        return False
+
+    def _accept(self, span: str) -> bool:
+        try:
+            parsed = loads(span)
+        except ValueError:
+            return False
+        if self.schema is not None and schema_errors(parsed, self.schema):
+            return False
+        self.result = parsed
+        return True
+
+
+def extract_json_object(text: str, schema: dict | None = None) -> dict:
+    """The JSON object an LLM response carries.
+
+    Raises ``ValueError`` (with the first parse errors seen) if the text
+    contains no complete JSON object. With ``schema``, the first conforming
+    object is preferred and the first object of any shape is the fallback.
+    """
+    stripped = text.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        try:
+            # The whole response is one object: there is nothing else to prefer
+            return loads(stripped)
+        except ValueError:
+            pass  # the scan below reports the error
+
+    errors: list[str] = []
+    first: dict | None = None
+    pos = 0
+    while (match := _OBJECT_OPEN_RE.search(stripped, pos)) is not None:
+        start = match.start()
+        try:
+            parsed, pos = _decoder.raw_decode(stripped, start)
+        except json.JSONDecodeError as exc:
+            errors.append(_error_text(exc))
+            pos = _span_end(stripped, start)
+            if pos == -1:
+                break
+            continue
+        if schema is None:
+            return parsed
+        problems = schema_errors(parsed, schema)
+        if not problems:
+            return parsed
+        errors.append(f"Schema mismatch: {problems[0]}")
+        if first is None:
+            first = parsed
+    if first is not None:
+        return first
+    raise ValueError("; ".join(errors[:2]) or "no JSON object found")
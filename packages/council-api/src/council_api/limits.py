@@ -0,0 +1,74 @@
+"""Shared concurrency limits for LLM calls.
+
+A single ``CallLimiter`` caps the number of in-flight calls globally, per
+provider and per model. Every Stage 1/2/3 call made by a ``CouncilService``
+goes through its limiter, so many councils can share one event loop (see
+``CouncilService.run_council_batch``) without overloading any one endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+
+
+class CallLimiter:
+    """Global, per-provider and per-model caps on concurrent LLM calls.
+
+    ``None`` (or a missing key) means unlimited at that level. Semaphores are
+    acquired from the narrowest scope to the widest, so a call queued behind
+    a saturated model does not hold a global slot while it waits.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int | None = None,
+        *,
+        per_provider: dict[str, int] | None = None,
+        per_model: dict[str, int] | None = None,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.per_provider = dict(per_provider or {})
+        self.per_model = dict(per_model or {})
+        self._global = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        self._providers = {
+            name: asyncio.Semaphore(limit) for name, limit in self.per_provider.items()
+        }
+        self._models = {
+            name: asyncio.Semaphore(limit) for name, limit in self.per_model.items()
+        }
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    @asynccontextmanager
+    async def slot(self, provider: str, model: str) -> AsyncIterator[None]:
+        """Hold one call slot for ``model`` on ``provider``."""
+        semaphores = [
+            sem for sem in (
+                self._models.get(model),
+                self._providers.get(provider),
+                self._global,
+            )
+            if sem is not None
+        ]
+        async with AsyncExitStack() as stack:
+            for sem in semaphores:
+                await stack.enter_async_context(sem)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+
+def parse_limit_specs(specs: list[str] | None) -> dict[str, int]:
+    """Parse ``["name=N", ...]`` CLI values into a ``{name: N}`` dict."""
+    limits: dict[str, int] = {}
+    for spec in specs or []:
+        name, sep, value = spec.rpartition("=")
+        if not sep or not name:
+            raise ValueError(f"Invalid limit '{spec}' (expected NAME=N)")
+        limits[name.strip()] = int(value)
+    return limits
@@ -21,6 +21,29 @@ class CouncilPeerReview(BaseModel):
     model_name: str
     review_text: str    # free-form evaluation + disagreement analysis
     parsed_ranking: list[str] = Field(default_factory=list)
+    ranking_groups: list[list[str]] = Field(default_factory=list)  # set only when there are ties
+
+
+class CallRecord(BaseModel):
+    """Token, retry and timing accounting for one model call in a council run."""
+
+    stage: str  # "stage1", "stage2" or "stage3"
+    model: str
+    provider: str
+    status: str = "ok"  # "ok", "error" or "cancelled" (hedge loser / dropped straggler)
+    hedge: bool = False  # the duplicate request of a hedged call
+    cached: bool = False
+    requests: int = 0  # HTTP requests sent, including retries
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    reasoning_tokens: int = 0
+    retries: int = 0  # transient-error retries
+    empty_retries: int = 0  # empty-response re-attempts
+    json_repairs: int = 0
+    structured: bool = False  # provider-native structured output enforced the schema
+    wall_ms: int = 0
+    queue_ms: int = 0  # waiting on concurrency slots and rate limits
+    cost_usd: float | None = None
 
 
 class CouncilMeta(BaseModel):
@@ -35,6 +58,18 @@ class CouncilMeta(BaseModel):
     reused_model: str | None = None
     aggregate_rankings: list[dict] = Field(default_factory=list)
     stage3_fallback: bool = False
+    late_models: list[str] = Field(default_factory=list)     # folded in via follow-up review
+    dropped_models: list[str] = Field(default_factory=list)  # missed the straggler deadline
+    hedges: list[dict] = Field(default_factory=list)         # hedged calls and which request won
+    consensus: bool = False                  # Stages 2-3 skipped: Stage 1 already agreed
+    consensus_score: float | None = None     # weakest pairwise Stage 1 agreement
+    consensus_model: str | None = None       # assessment used as the final result
+    routed_models: list[str] = Field(default_factory=list)   # sub-council queried first (empty = all)
+    escalated: bool = False                  # sub-council disagreed, remaining models queried
+    calls: list[CallRecord] = Field(default_factory=list)
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float | None = None  # None when no call had a known price
 
 
 class CouncilResult(BaseModel):
@@ -44,3 +79,22 @@ class CouncilResult(BaseModel):
     assessments: list[CouncilAssessment]
     peer_reviews: list[CouncilPeerReview]
     meta: CouncilMeta
+
+
+class CouncilJob(BaseModel):
+    """One council run in a batch (see ``CouncilService.run_council_batch``)."""
+
+    id: str
+    system_prompt: str
+    user_msg: str
+    council_models: list[str]
+    chairman_model: str
+    options: dict = Field(default_factory=dict)  # extra run_council keyword arguments
+
+
+class CouncilBatchResult(BaseModel):
+    """Outcome of one batch job: a result, or the error that stopped it."""
+
+    job_id: str
+    result: CouncilResult | None = None
+    error: str | None = None
@@ -0,0 +1,156 @@
+"""Process-wide shared HTTP connection pools.
+
+Every ``LLMClient`` (and the OpenRouter pricing fetch) borrows its
+``httpx.AsyncClient`` from a registry keyed by origin (scheme, host, port of
+the base URL). Clients for the same endpoint therefore share keep-alive
+connections and TLS sessions instead of each opening their own. HTTP/2 is
+used when the optional ``h2`` package is installed.
+
+Pools are reference counted: ``acquire_http_client`` takes a reference,
+``release_http_client`` drops it, and the pool is closed when the last
+reference goes away (``LLMClient.close()`` releases its reference).
+
+Provides:
+- ``configure_http_pool``: limits for pools created afterwards
+- ``acquire_http_client`` / ``release_http_client``: the registry
+- ``pool_stats``: per-origin request and connection-reuse counters
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+from dataclasses import dataclass
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Same budget the OpenAI SDK uses for its own clients
+DEFAULT_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+
+@dataclass
+class PoolConfig:
+    """Connection limits for a pooled client.
+
+    ``http2=None`` enables HTTP/2 when ``h2`` is importable.
+    """
+
+    max_connections: int = 200
+    max_keepalive_connections: int = 50
+    keepalive_expiry: float = 30.0
+    http2: bool | None = None
+
+
+@dataclass
+class PoolStats:
+    requests: int = 0
+    connections_opened: int = 0
+    http2_requests: int = 0
+    references: int = 0
+
+    @property
+    def reused(self) -> int:
+        """Requests served on an already open connection."""
+        return max(0, self.requests - self.connections_opened)
+
+    @property
+    def reuse_rate(self) -> float:
+        return self.reused / self.requests if self.requests else 0.0
+
+
+class _Pool:
+    def __init__(self, origin: str, config: PoolConfig) -> None:
+        http2 = config.http2
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+        self.origin = origin
+        self.stats = PoolStats()
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            timeout=DEFAULT_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            event_hooks={"request": [self._attach_trace]},
+        )
+
+    async def _attach_trace(self, request: httpx.Request) -> None:
+        request.extensions["trace"] = self._trace
+
+    async def _trace(self, event: str, info: dict) -> None:
+        if event == "connection.connect_tcp.complete":
+            self.stats.connections_opened += 1
+        elif event == "http11.send_request_headers.started":
+            self.stats.requests += 1
+        elif event == "http2.send_request_headers.started":
+            self.stats.requests += 1
+            self.stats.http2_requests += 1
+
+
+_CONFIG = PoolConfig()
+_POOLS: dict[str, _Pool] = {}
+_STATS: dict[str, PoolStats] = {}
+
+
+def _origin(base_url: str) -> str:
+    url = httpx.URL(base_url)
+    port = f":{url.port}" if url.port else ""
+    return f"{url.scheme}://{url.host}{port}"
+
+
+def configure_http_pool(
+    *,
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+    http2: bool | None = None,
+) -> PoolConfig:
+    """Set connection limits for pools created from now on.
+
+    Pools that already exist keep their limits until they are closed.
+    """
+    global _CONFIG
+    _CONFIG = PoolConfig(
+        max_connections=max_connections or _CONFIG.max_connections,
+        max_keepalive_connections=(
+            max_keepalive_connections or _CONFIG.max_keepalive_connections
+        ),
+        keepalive_expiry=keepalive_expiry or _CONFIG.keepalive_expiry,
+        http2=http2 if http2 is not None else _CONFIG.http2,
+    )
+    return _CONFIG
+
+
+def acquire_http_client(base_url: str) -> httpx.AsyncClient:
+    """Return the shared client for ``base_url``'s origin, taking a reference."""
+    origin = _origin(base_url)
+    pool = _POOLS.get(origin)
+    if pool is None:
+        pool = _POOLS[origin] = _Pool(origin, _CONFIG)
+        # Stats outlive individual pools so reuse is visible across close/reopen
+        pool.stats = _STATS.setdefault(origin, pool.stats)
+        logger.debug("Opened HTTP pool for %s", origin)
+    pool.stats.references += 1
+    return pool.client
+
+
+async def release_http_client(client: httpx.AsyncClient) -> None:
+    """Drop a reference taken by ``acquire_http_client``; close the pool at zero."""
+    for origin, pool in list(_POOLS.items()):
+        if pool.client is client:
+            pool.stats.references -= 1
+            if pool.stats.references <= 0:
+                del _POOLS[origin]
+                await client.aclose()
+                logger.debug("Closed HTTP pool for %s", origin)
+            return
+
+
+def pool_stats() -> dict[str, PoolStats]:
+    """Request and connection counters per origin (including closed pools)."""
+    return dict(_STATS)
@@ -0,0 +1,98 @@
+"""Serialization of Stage 1 assessments into Stage 2/3 prompts.
+
+Every peer reviewer and the chairman receive all assessments, so their
+input grows with (council size x assessment size). ``PromptOptions``
+controls how much of each assessment is embedded: minified instead of
+indented JSON, a projection onto selected top-level fields, and a
+per-assessment character budget.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+
+TRUNCATION_MARKER = "…"
+
+
+@dataclass
+class PromptOptions:
+    """How assessments are embedded in Stage 2 and Stage 3 prompts.
+
+    Attributes
+    ----------
+    compact:
+        Minified JSON (no indentation, no spaces after separators) instead
+        of ``indent=2``.
+    fields:
+        Keep only these top-level keys of each assessment (``None`` keeps all).
+    max_chars:
+        Per-assessment budget for the serialized JSON. Long string values
+        are shortened until the assessment fits; the result stays valid JSON.
+    context_chars:
+        How much of the original user message is repeated in the prompt.
+    cache_prefix:
+        Send the Stage 2 context block (original context + assessments) as
+        a separately marked prefix on routes that support explicit cache
+        markers (Anthropic/Gemini via OpenRouter). The block always comes
+        first, so automatic prefix caching (OpenAI) applies regardless.
+        Cache writes are billed at a premium, so this pays off when a model
+        sees the same block again (follow-up reviews, hedges, re-runs).
+    """
+
+    compact: bool = False
+    fields: tuple[str, ...] | None = None
+    max_chars: int | None = None
+    context_chars: int = 3000
+    cache_prefix: bool = False
+
+
+def format_assessment(result_json: dict, options: PromptOptions) -> str:
+    """Serialize one assessment according to ``options``."""
+    data = result_json
+    if options.fields is not None and isinstance(data, dict):
+        data = {k: v for k, v in data.items() if k in options.fields}
+    text = _dumps(data, options.compact)
+    if options.max_chars is None or len(text) <= options.max_chars:
+        return text
+
+    # Binary-search the largest per-string cap that fits the budget
+    lo, hi = 0, max(_longest_string(data), 1)
+    best = None
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        candidate = _dumps(_cap_strings(data, mid), options.compact)
+        if len(candidate) <= options.max_chars:
+            best, lo = candidate, mid + 1
+        else:
+            hi = mid - 1
+    if best is not None:
+        return best
+    # Structure alone exceeds the budget (many keys / long lists)
+    return text[: options.max_chars] + TRUNCATION_MARKER
+
+
+def _dumps(data: object, compact: bool) -> str:
+    if compact:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return json.dumps(data, indent=2)
+
+
+def _longest_string(data: object) -> int:
+    if isinstance(data, str):
+        return len(data)
+    if isinstance(data, dict):
+        return max((_longest_string(v) for v in data.values()), default=0)
+    if isinstance(data, list):
+        return max((_longest_string(v) for v in data), default=0)
+    return 0
+
+
+def _cap_strings(data: object, limit: int) -> object:
+    if isinstance(data, str):
+        return data if len(data) <= limit else data[:limit] + TRUNCATION_MARKER
+    if isinstance(data, dict):
+        return {k: _cap_strings(v, limit) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_cap_strings(v, limit) for v in data]
+    return data
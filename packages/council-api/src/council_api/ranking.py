@@ -0,0 +1,506 @@
+"""Peer-review ranking parsing and aggregation.
+
+Stage 2 reviewers end with a ``FINAL RANKING:`` block. ``parse_ranking_groups``
+extracts it in one pass of a single compiled pattern; repeated numbers
+("1. Assessment A / 1. Assessment B") are read as ties.
+
+``aggregate_rankings`` combines the reviewers' ballots with one of:
+
+- ``"mean"``: average position (the original council behaviour)
+- ``"borda"``: normalised Borda count; a partial ballot puts the labels it
+  omits in a tie below the ones it ranks
+- ``"kemeny"``: the order that agrees with the most pairwise ballot
+  preferences (exact for up to ``KEMENY_EXACT_MAX`` labels, local search
+  seeded with Borda above that)
+- ``"bradley_terry"``: maximum-likelihood strengths from pairwise wins
+
+Reviews by the model that wrote an assessment can be left out of that
+assessment's ranking (``exclude_self``). With ``bootstrap`` > 0, reviewers
+are resampled to give a confidence interval for each label's aggregate
+rank. The bootstrap is vectorised with NumPy when it is installed and runs
+in pure Python otherwise (same estimator, different random draws).
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from council_api.config import model_display_name
+
+if TYPE_CHECKING:
+    from council_api.models import CouncilPeerReview, CouncilResult
+
+METHODS = ("mean", "borda", "kemeny", "bradley_terry")
+KEMENY_EXACT_MAX = 10
+
+_RANKING_TOKEN_RE = re.compile(
+    r"(?P<marker>FINAL RANKING:)|(?:(?P<num>\d+)\.\s*)?(?P<label>Assessment [A-Z])\b"
+)
+
+
+def parse_ranking_groups(text: str) -> list[list[str]]:
+    """Ranked groups of labels (best first); labels in one group are tied.
+
+    Reads the first ``FINAL RANKING:`` section, preferring its numbered
+    items; without a marker, every label mentioned in the text, in order.
+    """
+    section = 0  # 0: before the marker, 1: first ranking section, 2+: after it
+    mentioned: list[str] = []
+    listed: list[str] = []
+    numbered: list[tuple[str, str]] = []
+    for match in _RANKING_TOKEN_RE.finditer(text):
+        if match["marker"]:
+            section += 1
+            continue
+        label = match["label"]
+        if section == 0:
+            mentioned.append(label)
+        elif section == 1:
+            listed.append(label)
+            if match["num"]:
+                numbered.append((match["num"], label))
+
+    if not section:
+        return [[label] for label in mentioned]
+    if not numbered:
+        return [[label] for label in listed]
+    groups: list[list[str]] = []
+    previous = None
+    for num, label in numbered:
+        if num == previous:
+            groups[-1].append(label)
+        else:
+            groups.append([label])
+        previous = num
+    return groups
+
+
+def parse_ranking(text: str) -> list[str]:
+    """Flat ranking (best first), ties in the order they were written."""
+    return [label for group in parse_ranking_groups(text) for label in group]
+
+
+@dataclass
+class RankingPolicy:
+    """How Stage 2 ballots are combined into ``aggregate_rankings``.
+
+    Attributes
+    ----------
+    method:
+        One of ``METHODS``.
+    exclude_self:
+        Ignore each reviewer's placement of its own assessment.
+    bootstrap:
+        Number of reviewer resamples for rank confidence intervals
+        (0 disables them).
+    confidence:
+        Coverage of the bootstrap interval.
+    seed:
+        Seed for the bootstrap resampling.
+    bt_prior:
+        Pseudo-comparisons (split evenly) added to every Bradley-Terry pair
+        so that undefeated or winless labels keep finite strengths.
+    """
+
+    method: str = "mean"
+    exclude_self: bool = False
+    bootstrap: int = 0
+    confidence: float = 0.95
+    seed: int = 0
+    bt_prior: float = 0.5
+    bt_max_iter: int = 500
+    bt_tol: float = 1e-9
+
+    def __post_init__(self) -> None:
+        if self.method not in METHODS:
+            raise ValueError(
+                f"Unknown ranking method '{self.method}'. Available: {', '.join(METHODS)}"
+            )
+
+
+@dataclass
+class Ballot:
+    """One reviewer's ranking: ``groups`` of tied labels, best first."""
+
+    reviewer: str
+    groups: list[list[str]]
+
+
+def ballots_from_reviews(reviews: Iterable[CouncilPeerReview]) -> list[Ballot]:
+    return [
+        Ballot(
+            reviewer=r.model,
+            groups=r.ranking_groups or [[label] for label in r.parsed_ranking],
+        )
+        for r in reviews
+    ]
+
+
+class _Profile:
+    """Ballots turned into per-ballot position, Borda and pairwise tables.
+
+    ``position[b][i]`` is the tie-averaged position of label ``i`` among the
+    labels ballot ``b`` may rank (``None`` if it did not rank it or may
+    not); ``borda[b][i]`` its normalised Borda score; ``wins[b][i][j]`` how
+    much ballot ``b`` prefers ``i`` over ``j`` (1, 0.5 for a tie, 0).
+    """
+
+    def __init__(
+        self, ballots: list[Ballot], label_to_model: dict[str, str], exclude_self: bool,
+    ) -> None:
+        self.labels = sorted(label_to_model)
+        index = {label: i for i, label in enumerate(self.labels)}
+        n = len(self.labels)
+        self.position: list[list[float | None]] = []
+        self.borda: list[list[float | None]] = []
+        self.wins: list[list[list[float]]] = []
+
+        for ballot in ballots:
+            eligible = [
+                not (exclude_self and label_to_model[label] == ballot.reviewer)
+                for label in self.labels
+            ]
+            n_eligible = sum(eligible)
+            position: list[float | None] = [None] * n
+            seen: set[int] = set()
+            pos = 1
+            for group in ballot.groups:
+                members = []
+                for label in group:
+                    i = index.get(label)
+                    if i is not None and eligible[i] and i not in seen:
+                        seen.add(i)
+                        members.append(i)
+                if not members:
+                    continue
+                tied_at = pos + (len(members) - 1) / 2
+                for i in members:
+                    position[i] = tied_at
+                pos += len(members)
+            if not seen or n_eligible < 2:
+                continue
+
+            # Unranked eligible labels share the positions after the ranked ones
+            unranked_at = len(seen) + 1 + (n_eligible - len(seen) - 1) / 2
+            borda: list[float | None] = [None] * n
+            for i in range(n):
+                if eligible[i]:
+                    p = position[i] if position[i] is not None else unranked_at
+                    borda[i] = (n_eligible - p) / (n_eligible - 1)
+
+            wins = [[0.0] * n for _ in range(n)]
+            for i in range(n):
+                if position[i] is None:
+                    continue
+                for j in range(n):
+                    if i == j or not eligible[j]:
+                        continue
+                    pj = position[j]
+                    if pj is None or position[i] < pj:
+                        wins[i][j] = 1.0
+                    elif position[i] == pj:
+                        wins[i][j] = 0.5
+
+            self.position.append(position)
+            self.borda.append(borda)
+            self.wins.append(wins)
+
+    @property
+    def size(self) -> int:
+        return len(self.position)
+
+    def counts(self) -> list[int]:
+        return [
+            sum(1 for row in self.position if row[i] is not None)
+            for i in range(len(self.labels))
+        ]
+
+
+# ---- Aggregation on weighted ballots (weights = bootstrap multiplicities) ----
+
+
+def _weighted_mean(rows: list[list[float | None]], weights: list[float], n: int) -> list[float | None]:
+    out: list[float | None] = []
+    for i in range(n):
+        total = count = 0.0
+        for w, row in zip(weights, rows):
+            if w and row[i] is not None:
+                total += w * row[i]
+                count += w
+        out.append(total / count if count else None)
+    return out
+
+
+def _pairwise(profile: _Profile, weights: list[float]) -> list[list[float]]:
+    n = len(profile.labels)
+    matrix = [[0.0] * n for _ in range(n)]
+    for w, wins in zip(weights, profile.wins):
+        if not w:
+            continue
+        for i in range(n):
+            row, src = matrix[i], wins[i]
+            for j in range(n):
+                if src[j]:
+                    row[j] += w * src[j]
+    return matrix
+
+
+def _kemeny_order(wins: list[list[float]], seed_order: list[int]) -> list[int]:
+    """Order maximising the pairwise preferences it agrees with."""
+    n = len(wins)
+    if n <= KEMENY_EXACT_MAX:
+        # DP over subsets: best[S] = best agreement of an order placing S first
+        best = [-math.inf] * (1 << n)
+        choice = [0] * (1 << n)
+        best[0] = 0.0
+        for subset in range(1 << n):
+            if best[subset] == -math.inf:
+                continue
+            placed = [i for i in range(n) if subset >> i & 1]
+            for j in range(n):
+                if subset >> j & 1:
+                    continue
+                gain = best[subset] + sum(wins[i][j] for i in placed)
+                nxt = subset | 1 << j
+                if gain > best[nxt]:
+                    best[nxt] = gain
+                    choice[nxt] = j
+        order = []
+        subset = (1 << n) - 1
+        while subset:
+            j = choice[subset]
+            order.append(j)
+            subset &= ~(1 << j)
+        return order[::-1]
+
+    order = list(seed_order)
+    improved = True
+    while improved:
+        improved = False
+        for k in range(n):
+            item = order.pop(k)
+            # Agreement of ``item``'s pairs when inserted before order[slot]
+            gains = [sum(wins[item][other] for other in order)]
+            for other in order:
+                gains.append(gains[-1] + wins[other][item] - wins[item][other])
+            slot = max(range(len(gains)), key=lambda s: (gains[s], s == k))
+            order.insert(slot, item)
+            if slot != k:
+                improved = True
+    return order
+
+
+def _bradley_terry(wins: list[list[float]], policy: RankingPolicy) -> list[float]:
+    """MM estimate of Bradley-Terry strengths (normalised to sum to 1)."""
+    n = len(wins)
+    half = policy.bt_prior / 2
+    w = [[wins[i][j] + half if i != j else 0.0 for j in range(n)] for i in range(n)]
+    total_wins = [sum(row) for row in w]
+    games = [[w[i][j] + w[j][i] for j in range(n)] for i in range(n)]
+    p = [1.0 / n] * n
+    for _ in range(policy.bt_max_iter):
+        new = []
+        for i in range(n):
+            denom = sum(games[i][j] / (p[i] + p[j]) for j in range(n) if j != i)
+            new.append(total_wins[i] / denom if denom else p[i])
+        norm = sum(new)
+        new = [x / norm for x in new]
+        delta = max(abs(a - b) for a, b in zip(new, p))
+        p = new
+        if delta < policy.bt_tol:
+            break
+    return p
+
+
+def _aggregate(
+    profile: _Profile, weights: list[float], policy: RankingPolicy,
+) -> tuple[list[int], list[float | None]]:
+    """Order of label indices (best first) and each label's method score."""
+    n = len(profile.labels)
+    method = policy.method
+
+    if method == "mean":
+        scores = _weighted_mean(profile.position, weights, n)
+        key = lambda i: (scores[i] is None, scores[i] or 0.0, i)  # noqa: E731
+        return sorted(range(n), key=key), scores
+
+    borda = _weighted_mean(profile.borda, weights, n)
+    borda_order = sorted(range(n), key=lambda i: (borda[i] is None, -(borda[i] or 0.0), i))
+    if method == "borda":
+        return borda_order, borda
+
+    wins = _pairwise(profile, weights)
+    if method == "kemeny":
+        order = _kemeny_order(wins, borda_order)
+        scores: list[float | None] = [None] * n
+        for pos, i in enumerate(order, start=1):
+            scores[i] = float(pos)
+        return order, scores
+
+    strengths = _bradley_terry(wins, policy)
+    return sorted(range(n), key=lambda i: (-strengths[i], i)), list(strengths)
+
+
+def _ranks_of(order: list[int]) -> list[int]:
+    ranks = [0] * len(order)
+    for pos, i in enumerate(order, start=1):
+        ranks[i] = pos
+    return ranks
+
+
+# ---- Bootstrap ----
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _interval(samples: list[int], confidence: float) -> list[int]:
+    ordered = sorted(samples)
+    tail = (1 - confidence) / 2
+    lo = ordered[max(0, math.ceil(tail * len(ordered)) - 1)]
+    hi = ordered[max(0, math.ceil((1 - tail) * len(ordered)) - 1)]
+    return [lo, hi]
+
+
+def _bootstrap_python(profile: _Profile, policy: RankingPolicy) -> list[list[int]]:
+    rng = random.Random(policy.seed)
+    m, n = profile.size, len(profile.labels)
+    samples: list[list[int]] = [[] for _ in range(n)]
+    for _ in range(policy.bootstrap):
+        weights = [0.0] * m
+        for _ in range(m):
+            weights[rng.randrange(m)] += 1
+        ranks = _ranks_of(_aggregate(profile, weights, policy)[0])
+        for i in range(n):
+            samples[i].append(ranks[i])
+    return [_interval(s, policy.confidence) for s in samples]
+
+
+def _bootstrap_numpy(np, profile: _Profile, policy: RankingPolicy) -> list[list[int]]:
+    m, n = profile.size, len(profile.labels)
+    rng = np.random.default_rng(policy.seed)
+    # (B, m) multiplicity of each ballot in each resample
+    weights = rng.multinomial(m, np.full(m, 1.0 / m), size=policy.bootstrap).astype(float)
+
+    if policy.method in ("mean", "borda"):
+        rows = profile.position if policy.method == "mean" else profile.borda
+        values = np.array([[np.nan if v is None else v for v in row] for row in rows])
+        present = ~np.isnan(values)
+        totals = weights @ np.where(present, values, 0.0)
+        counts = weights @ present.astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scores = totals / counts
+        if policy.method == "borda":
+            scores = -scores
+        # Labels nobody ranked in a resample go last; ties break by label index
+        scores = np.where(np.isnan(scores), np.inf, scores)
+        order = np.lexsort((np.broadcast_to(np.arange(n), scores.shape), scores), axis=1)
+    else:
+        if policy.method == "kemeny":
+            # The search itself is sequential; only the resampling is shared
+            order = np.array([
+                _aggregate(profile, row.tolist(), policy)[0] for row in weights
+            ])
+        else:
+            pairwise = np.einsum("bm,mij->bij", weights, np.array(profile.wins))
+            w = pairwise + policy.bt_prior / 2 * (1 - np.eye(n))
+            total_wins = w.sum(axis=2)
+            games = w + w.transpose(0, 2, 1)
+            p = np.full((policy.bootstrap, n), 1.0 / n)
+            for _ in range(policy.bt_max_iter):
+                pair_sum = p[:, :, None] + p[:, None, :]
+                denom = (games / pair_sum).sum(axis=2)
+                new = total_wins / denom
+                new /= new.sum(axis=1, keepdims=True)
+                delta = np.abs(new - p).max()
+                p = new
+                if delta < policy.bt_tol:
+                    break
+            order = np.lexsort((np.broadcast_to(np.arange(n), p.shape), -p), axis=1)
+
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, n + 1)[None, :], axis=1)
+    tail = (1 - policy.confidence) / 2
+    lo = np.quantile(ranks, tail, axis=0, method="inverted_cdf")
+    hi = np.quantile(ranks, 1 - tail, axis=0, method="inverted_cdf")
+    return [[int(a), int(b)] for a, b in zip(lo, hi)]
+
+
+# ---- Public API ----
+
+
+def aggregate_rankings(
+    ballots: list[Ballot],
+    label_to_model: dict[str, str],
+    policy: RankingPolicy | None = None,
+) -> list[dict]:
+    """Combine ballots into ``meta.aggregate_rankings`` entries, best first.
+
+    Every entry has ``label``, ``model``, ``model_name``, ``average_rank``
+    (mean tie-averaged position) and ``rankings_count``, plus ``method``,
+    ``score`` (average rank for ``mean``, normalised Borda score for
+    ``borda``, consensus position for ``kemeny``, strength for
+    ``bradley_terry``) and, with bootstrapping, ``rank_ci`` as
+    ``[low, high]``. Labels no ballot ranked are omitted.
+    """
+    policy = policy or RankingPolicy()
+    profile = _Profile(ballots, label_to_model, policy.exclude_self)
+    if not profile.size:
+        return []
+
+    ones = [1.0] * profile.size
+    order, scores = _aggregate(profile, ones, policy)
+    average = _weighted_mean(profile.position, ones, len(profile.labels))
+    counts = profile.counts()
+
+    intervals = None
+    if policy.bootstrap > 0:
+        np = _numpy()
+        if np is not None:
+            intervals = _bootstrap_numpy(np, profile, policy)
+        else:
+            intervals = _bootstrap_python(profile, policy)
+
+    aggregate = []
+    for i in order:
+        if not counts[i]:
+            continue
+        label = profile.labels[i]
+        entry = {
+            "label": label,
+            "model": label_to_model.get(label, "unknown"),
+            "model_name": model_display_name(label_to_model.get(label, "")),
+            "average_rank": round(average[i], 2),
+            "rankings_count": counts[i],
+            "method": policy.method,
+            "score": round(scores[i], 4) if scores[i] is not None else None,
+        }
+        if intervals is not None:
+            entry["rank_ci"] = intervals[i]
+        aggregate.append(entry)
+    return aggregate
+
+
+def reaggregate(
+    results: Iterable[CouncilResult], policy: RankingPolicy | None = None,
+) -> list[list[dict]]:
+    """Recompute ``aggregate_rankings`` for archived council results."""
+    policy = policy or RankingPolicy()
+    return [
+        aggregate_rankings(
+            ballots_from_reviews(result.peer_reviews),
+            {a.label: a.model for a in result.assessments if a.label},
+            policy,
+        )
+        for result in results
+    ]
@@ -0,0 +1,209 @@
+"""Per-provider rate limiting and retry scheduling for LLM calls.
+
+Request budgets live in a process-wide registry keyed by provider, so every
+``LLMClient`` (and therefore every concurrent council) in the process draws
+from the same buckets. When a provider answers 429, the whole provider is
+paused for its ``Retry-After`` interval and the call is re-queued instead of
+being dropped.
+
+Provides:
+- ``TokenBucket``: continuous-refill token bucket
+- ``ProviderRateLimiter``: requests/min + tokens/min buckets with a shared pause
+- ``RetryPolicy``: jittered exponential backoff that honours ``Retry-After``
+- ``get_rate_limiter`` / ``configure_rate_limit``: the process-wide registry
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying (timeouts, conflicts, server errors, overload)
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class TokenBucket:
+    """Token bucket holding up to ``capacity`` tokens, refilled continuously.
+
+    The level may go negative when actual usage exceeds an earlier estimate;
+    later callers then wait until the debt has been refilled.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.level = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self.level = min(self.capacity, self.level + elapsed * self.refill_per_second)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if available now)."""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.refill_per_second
+
+    def consume(self, amount: float) -> None:
+        self.level -= amount
+
+    def refund(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+class ProviderRateLimiter:
+    """Requests-per-minute and tokens-per-minute budget for one provider.
+
+    ``None`` disables the corresponding bucket. Callers wait in
+    ``acquire`` until both buckets have room and any 429 pause has expired.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60)
+            if requests_per_minute else None
+        )
+        self._tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60)
+            if tokens_per_minute else None
+        )
+        self._paused_until = 0.0
+        self.total_wait = 0.0
+        self.throttled = 0
+
+    async def acquire(self, estimated_tokens: int = 0) -> float:
+        """Wait for room for one request of ``estimated_tokens``; return seconds waited.
+
+        Check-and-consume happens without an intervening ``await``, so it is
+        atomic with respect to other coroutines on the loop.
+        """
+        waited = 0.0
+        while True:
+            now = time.monotonic()
+            delay = max(0.0, self._paused_until - now)
+            if self._requests:
+                delay = max(delay, self._requests.wait_time(1, now))
+            if self._tokens and estimated_tokens:
+                delay = max(delay, self._tokens.wait_time(estimated_tokens, now))
+            if delay <= 0:
+                if self._requests:
+                    self._requests.consume(1)
+                if self._tokens and estimated_tokens:
+                    self._tokens.consume(estimated_tokens)
+                if waited:
+                    self.throttled += 1
+                    self.total_wait += waited
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once the real usage of a call is known."""
+        if not self._tokens:
+            return
+        if actual_tokens < estimated_tokens:
+            self._tokens.refund(estimated_tokens - actual_tokens)
+        else:
+            self._tokens.consume(actual_tokens - estimated_tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Block all callers for ``seconds`` (e.g. after a 429)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+_LIMITERS: dict[str, ProviderRateLimiter] = {}
+
+
+def get_rate_limiter(provider: str) -> ProviderRateLimiter:
+    """Return the process-wide limiter for ``provider`` (unlimited by default)."""
+    limiter = _LIMITERS.get(provider)
+    if limiter is None:
+        limiter = _LIMITERS[provider] = ProviderRateLimiter()
+    return limiter
+
+
+def configure_rate_limit(
+    provider: str,
+    *,
+    requests_per_minute: int | None = None,
+    tokens_per_minute: int | None = None,
+) -> ProviderRateLimiter:
+    """Install a new request/token budget for ``provider`` process-wide."""
+    limiter = ProviderRateLimiter(requests_per_minute, tokens_per_minute)
+    _LIMITERS[provider] = limiter
+    return limiter
+
+
+@dataclass
+class RetryPolicy:
+    """Jittered exponential backoff for transient provider errors.
+
+    The n-th retry waits a random time in ``[0, min(max_delay, base_delay * 2**n)]``
+    ("full jitter"). If the provider sent ``Retry-After``, that value is
+    used instead, plus up to ``base_delay`` of jitter so that queued callers
+    do not all fire at once. No wait exceeds ``max_delay``, however long the
+    ``Retry-After``.
+    """
+
+    max_retries: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        if retry_after is not None:
+            return min(self.max_delay, retry_after + random.uniform(0, self.base_delay))
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+def retry_after_seconds(exc: Exception) -> float | None:
+    """Extract ``Retry-After`` (or ``retry-after-ms``) from an SDK error, if any."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, parsed.timestamp() - time.time())
+
+
+def estimate_tokens(messages: list[dict], max_tokens: int) -> int:
+    """Rough token budget for a request: ~4 characters per prompt token + output cap."""
+    chars = 0
+    for m in messages:
+        content = m.get("content", "")
+        if isinstance(content, list):
+            chars += sum(len(part.get("text", "")) for part in content)
+        else:
+            chars += len(str(content))
+    return chars // 4 + max_tokens
@@ -0,0 +1,217 @@
+"""Cached OpenRouter model catalogue.
+
+``ModelRegistry`` keeps the last OpenRouter ``/models`` response on disk,
+like ``LatencyTracker``. The snapshot is trimmed to id, name, pricing and
+context length. Within ``ttl`` it is used as is. After that it is
+revalidated with ``If-None-Match`` / ``If-Modified-Since``, so an
+unchanged catalogue costs a 304 instead of a full download. If
+OpenRouter cannot be reached, the last snapshot is used however old it
+is, so listing models and pricing runs work offline.
+
+Lookups by model ID are dict lookups. ``prices`` is a plain dict updated
+in place on every refresh, so a ``CouncilService`` built with it always
+costs calls at current prices. Long-running processes (``council-api
+serve``) call ``start_background_refresh`` to revalidate every ``ttl``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+
+from council_api.checkpoint import _atomic_write_json, _read_json
+from council_api.config import OPENROUTER_MODELS_URL, _price_per_million
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY_PATH = Path.home() / ".cache" / "council-api" / "models.json"
+DEFAULT_REGISTRY_TTL = 24 * 3600.0
+
+# Download timeouts (s): without a snapshot there is nothing to fall back on
+FETCH_TIMEOUT = 15.0
+REVALIDATE_TIMEOUT = 5.0
+# Background refresh retry delay (s) after a failed revalidation
+RETRY_INTERVAL = 300.0
+
+
+def _trim(entry: dict) -> dict:
+    pricing = entry.get("pricing") or {}
+    return {
+        "id": entry.get("id", ""),
+        "name": entry.get("name", ""),
+        "pricing": {
+            "prompt": pricing.get("prompt", "0"),
+            "completion": pricing.get("completion", "0"),
+        },
+        "context_length": entry.get("context_length"),
+    }
+
+
+class ModelRegistry:
+    """OpenRouter model catalogue with an on-disk snapshot and HTTP revalidation."""
+
+    def __init__(
+        self,
+        path: str | Path | None = DEFAULT_REGISTRY_PATH,
+        *,
+        ttl: float = DEFAULT_REGISTRY_TTL,
+        url: str = OPENROUTER_MODELS_URL,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self.url = url
+        self.fetched_at = 0.0  # last successful download or revalidation
+        self.prices: dict[str, tuple[float, float]] = {}
+        self._entries: list[dict] = []
+        self._by_id: dict[str, dict] = {}
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._lock: asyncio.Lock | None = None
+        self._task: asyncio.Task | None = None
+        if self.path:
+            data = _read_json(self.path) or {}
+            self._etag = data.get("etag")
+            self._last_modified = data.get("last_modified")
+            self.fetched_at = data.get("fetched_at", 0.0)
+            self._load(data.get("data", []))
+
+    def _load(self, entries: list[dict]) -> None:
+        self._entries = entries
+        self._by_id = {e["id"]: e for e in entries if e.get("id")}
+        prices = {}
+        for entry in entries:
+            try:
+                prices[entry["id"]] = _price_per_million(entry)
+            except (KeyError, ValueError, TypeError):
+                continue
+        # In place, so holders of ``self.prices`` see the refresh
+        self.prices.clear()
+        self.prices.update(prices)
+
+    @property
+    def has_snapshot(self) -> bool:
+        return bool(self._entries)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the catalogue was last confirmed current."""
+        return time.time() - self.fetched_at
+
+    @property
+    def stale(self) -> bool:
+        return not self._entries or self.age >= self.ttl
+
+    def entries(self) -> list[dict]:
+        """Catalogue entries from the current snapshot (no network)."""
+        return list(self._entries)
+
+    def get(self, model_id: str) -> dict | None:
+        return self._by_id.get(model_id)
+
+    def price(self, model_id: str) -> tuple[float, float] | None:
+        """(input, output) USD per million tokens, or None if unknown."""
+        return self.prices.get(model_id)
+
+    async def refresh(self, *, force: bool = False) -> bool:
+        """Revalidate the catalogue if stale (or ``force``).
+
+        Returns True if the snapshot is current afterwards, and False if
+        OpenRouter could not be reached (the old snapshot stays in use).
+        Concurrent callers share one request.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not force and not self.stale:
+                return True
+            return await self._revalidate()
+
+    async def _revalidate(self) -> bool:
+        # Deferred: httpx is only needed when the catalogue is downloaded
+        from council_api.pool import acquire_http_client, release_http_client
+
+        headers = {}
+        if self._entries:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+        timeout = REVALIDATE_TIMEOUT if self._entries else FETCH_TIMEOUT
+        client = acquire_http_client(self.url)
+        try:
+            resp = await client.get(self.url, headers=headers, timeout=timeout)
+            if resp.status_code != 304:
+                resp.raise_for_status()
+                self._load([_trim(e) for e in resp.json().get("data", [])])
+                self._etag = resp.headers.get("ETag")
+                self._last_modified = resp.headers.get("Last-Modified")
+        except Exception as exc:
+            if self._entries:
+                logger.warning(
+                    "Could not refresh OpenRouter models (%s); using snapshot from %.1f h ago",
+                    exc, self.age / 3600,
+                )
+            else:
+                logger.warning("Could not reach OpenRouter API: %s", exc)
+            return False
+        finally:
+            await release_http_client(client)
+        self.fetched_at = time.time()
+        self.save()
+        return True
+
+    async def ensure(self) -> list[dict]:
+        """Catalogue entries, revalidated first if the snapshot is stale."""
+        if self.stale:
+            await self.refresh()
+        return self.entries()
+
+    def save(self) -> None:
+        """Persist the snapshot and its validators (no-op without a path)."""
+        if not self.path:
+            return
+        try:
+            _atomic_write_json(self.path, {
+                "fetched_at": self.fetched_at,
+                "etag": self._etag,
+                "last_modified": self._last_modified,
+                "data": self._entries,
+            })
+        except OSError as exc:
+            logger.warning("Could not save model registry to %s: %s", self.path, exc)
+
+    def start_background_refresh(self, interval: float | None = None) -> asyncio.Task:
+        """Revalidate every ``interval`` seconds (default ``ttl``) until stopped."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop(interval or self.ttl))
+        return self._task
+
+    async def _refresh_loop(self, interval: float) -> None:
+        while True:
+            wait = interval - self.age
+            if wait <= 0:
+                current = await self.refresh(force=True)
+                wait = interval if current else min(interval, RETRY_INTERVAL)
+            await asyncio.sleep(wait)
+
+    async def stop_background_refresh(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_default_registry: ModelRegistry | None = None
+
+
+def get_model_registry() -> ModelRegistry:
+    """The process-wide registry backed by ``DEFAULT_REGISTRY_PATH``."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = ModelRegistry()
+    return _default_registry
@@ -0,0 +1,224 @@
+"""Per-model performance history and adaptive council selection.
+
+``ModelPerformanceStore`` records, per prompt category and model, how each
+council member fared: its normalised peer-review rank (from
+``meta.aggregate_rankings``), Stage 1 latency, failures and token cost.
+History is persisted between runs, like ``LatencyTracker``.
+
+``RoutingPolicy`` uses that history to query a cheaper sub-council first:
+models are ordered by smoothed quality (then cost, then latency) and the
+smallest prefix whose expected best quality reaches ``quality_target`` is
+selected. If the sub-council's Stage 1 assessments disagree,
+``run_council`` escalates by querying the remaining models as well.
+
+Quality is ``1 - (average_rank - 1) / (n - 1)`` for a council of ``n``
+assessments: 1 for the top-ranked model, 0 for the last. When Stage 1
+reaches consensus every participant scores 1.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from council_api.checkpoint import _atomic_write_json, _read_json
+from council_api.consensus import ConsensusPolicy
+from council_api.models import CouncilResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PERFORMANCE_PATH = Path.home() / ".cache" / "council-api" / "performance.json"
+
+
+@dataclass
+class ModelStats:
+    """Accumulated outcomes of one model in one prompt category."""
+
+    runs: int = 0
+    failures: int = 0
+    ranked: int = 0
+    quality_sum: float = 0.0
+    latency_ms_sum: float = 0.0
+    latency_n: int = 0
+    tokens: int = 0
+    cost_usd: float = 0.0
+
+    def quality(self, prior: float, prior_weight: float) -> float:
+        """Mean quality shrunk towards ``prior`` while history is short."""
+        return (self.quality_sum + prior * prior_weight) / (self.ranked + prior_weight)
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.runs if self.runs else 0.0
+
+    @property
+    def mean_latency_ms(self) -> float | None:
+        return self.latency_ms_sum / self.latency_n if self.latency_n else None
+
+    @property
+    def mean_cost_usd(self) -> float:
+        succeeded = self.runs - self.failures
+        return self.cost_usd / succeeded if succeeded > 0 else 0.0
+
+
+class ModelPerformanceStore:
+    """Per-category, per-model council outcomes, optionally persisted to JSON."""
+
+    def __init__(self, path: str | Path | None = DEFAULT_PERFORMANCE_PATH) -> None:
+        self.path = Path(path) if path else None
+        self._stats: dict[str, dict[str, ModelStats]] = {}
+        self._dirty = False
+        if self.path:
+            data = _read_json(self.path) or {}
+            for category, models in data.get("categories", {}).items():
+                self._stats[category] = {
+                    model: ModelStats(**values) for model, values in models.items()
+                }
+
+    def stats(self, model: str, category: str = "default") -> ModelStats:
+        return self._stats.get(category, {}).get(model) or ModelStats()
+
+    def categories(self) -> list[str]:
+        return sorted(self._stats)
+
+    def record(self, result: CouncilResult, category: str = "default") -> None:
+        """Fold one council run's outcome into the history."""
+        meta = result.meta
+        table = self._stats.setdefault(category, {})
+        # An escalated run queried the reserve models too, i.e. the whole council.
+        if meta.routed_models and not meta.escalated:
+            queried = meta.routed_models
+        else:
+            queried = meta.council_models
+        answered = {a.model for a in result.assessments}
+
+        n = len(result.assessments)
+        quality: dict[str, float] = {}
+        if meta.consensus:
+            quality = {model: 1.0 for model in answered}
+        elif n > 1:
+            for entry in meta.aggregate_rankings:
+                quality[entry["model"]] = 1.0 - (entry["average_rank"] - 1) / (n - 1)
+
+        for model in queried:
+            if model == meta.reused_model:
+                continue
+            stats = table.setdefault(model, ModelStats())
+            stats.runs += 1
+            if model not in answered:
+                stats.failures += 1
+            if model in quality:
+                stats.ranked += 1
+                stats.quality_sum += max(0.0, min(1.0, quality[model]))
+
+        for call in meta.calls:
+            stats = table.get(call.model)
+            if stats is None or call.status != "ok":
+                continue
+            if call.stage == "stage1":
+                stats.latency_ms_sum += call.wall_ms
+                stats.latency_n += 1
+            if call.stage in ("stage1", "stage2"):
+                stats.tokens += call.prompt_tokens + call.completion_tokens
+                stats.cost_usd += call.cost_usd or 0.0
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist the history (no-op if nothing changed or no path is set)."""
+        if not self.path or not self._dirty:
+            return
+        try:
+            _atomic_write_json(self.path, {
+                "categories": {
+                    category: {model: asdict(stats) for model, stats in models.items()}
+                    for category, models in self._stats.items()
+                },
+            })
+            self._dirty = False
+        except OSError as exc:
+            logger.warning("Could not save model performance to %s: %s", self.path, exc)
+
+
+@dataclass
+class RoutingPolicy:
+    """How to pick a sub-council from history and when to escalate.
+
+    Attributes
+    ----------
+    quality_target:
+        Required expected quality of the best assessment that arrives,
+        accounting for each model's failure rate.
+    min_models:
+        Smallest sub-council to query.
+    min_runs:
+        History needed per model (in the category) before routing; until
+        every candidate has it, the full council is queried.
+    prior, prior_weight:
+        Quality assumed for a model without rankings, and how many ranked
+        runs that assumption is worth.
+    escalate_on_disagreement:
+        Query the remaining models when the sub-council's assessments do
+        not meet ``agreement``.
+    agreement:
+        Agreement required among sub-council assessments to skip escalation.
+    """
+
+    quality_target: float = 0.8
+    min_models: int = 3
+    min_runs: int = 5
+    prior: float = 0.5
+    prior_weight: float = 2.0
+    escalate_on_disagreement: bool = True
+    agreement: ConsensusPolicy = field(
+        default_factory=lambda: ConsensusPolicy(threshold=0.75),
+    )
+
+    def rank_models(
+        self, models: list[str], store: ModelPerformanceStore, category: str = "default",
+    ) -> list[str]:
+        """Order models best first: quality, then cost, then latency."""
+        def _key(model: str) -> tuple[float, float, float]:
+            stats = store.stats(model, category)
+            latency = stats.mean_latency_ms
+            return (
+                -stats.quality(self.prior, self.prior_weight),
+                stats.mean_cost_usd,
+                latency if latency is not None else float("inf"),
+            )
+        return sorted(models, key=_key)
+
+    def expected_quality(
+        self, models: list[str], store: ModelPerformanceStore, category: str = "default",
+    ) -> float:
+        """Expected quality of the best assessment from ``models`` (best first)."""
+        expected = 0.0
+        all_failed_so_far = 1.0
+        for model in models:
+            stats = store.stats(model, category)
+            success = 1.0 - stats.failure_rate
+            expected += (
+                all_failed_so_far * success * stats.quality(self.prior, self.prior_weight)
+            )
+            all_failed_so_far *= stats.failure_rate
+        return expected
+
+    def select(
+        self, models: list[str], store: ModelPerformanceStore, category: str = "default",
+    ) -> list[str]:
+        """Smallest best-first sub-council expected to reach ``quality_target``.
+
+        Returns ``models`` unchanged while history is insufficient or no
+        smaller council reaches the target.
+        """
+        if len(models) <= self.min_models:
+            return list(models)
+        if any(store.stats(m, category).runs < self.min_runs for m in models):
+            return list(models)
+        ranked = self.rank_models(models, store, category)
+        for size in range(self.min_models, len(ranked)):
+            if self.expected_quality(ranked[:size], store, category) >= self.quality_target:
+                # Keep the caller's order so assessment labels stay stable
+                chosen = set(ranked[:size])
+                return [m for m in models if m in chosen]
+        return list(models)
@@ -0,0 +1,420 @@
+"""Long-lived council daemon with a local HTTP/JSON API.
+
+``CouncilServer`` keeps one ``CouncilService`` (and with it the LLM client,
+connection pools, response cache, rate-limit buckets and latency history)
+warm across requests, so callers that trigger many small councils pay for
+imports and connection setup once. It listens on a TCP port or a Unix
+socket and speaks just enough HTTP/1.1 for ``curl`` and ``httpx``:
+
+    POST   /jobs                submit a job; ``?wait=1`` blocks until it finishes
+    GET    /jobs                list jobs
+    GET    /jobs/{id}           status, plus the result once finished
+    DELETE /jobs/{id}           cancel a queued or running job
+    GET    /jobs/{id}/events    progress events as NDJSON, streamed until the job ends
+    GET    /health              liveness and job counts
+
+A job body has the fields of ``CouncilJob`` (``user_msg`` or
+``user_message``; everything else falls back to the server's defaults).
+
+Every job spends the operator's provider API keys, so the server refuses
+anything a web page could send from the user's browser: requests with an
+``Origin`` header, a ``Host`` other than the bound address (DNS rebinding)
+and job bodies not sent as ``application/json`` (which a cross-site
+``fetch`` cannot do without a preflight the server never answers).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import ValidationError
+
+from council_api.council import CouncilService
+from council_api.models import CouncilJob
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+_REASONS = {
+    200: "OK", 202: "Accepted", 400: "Bad Request", 401: "Unauthorized",
+    403: "Forbidden", 404: "Not Found", 405: "Method Not Allowed", 409: "Conflict",
+    413: "Payload Too Large", 415: "Unsupported Media Type",
+    500: "Internal Server Error",
+}
+_LOOPBACK_NAMES = ("localhost", "127.0.0.1", "[::1]")
+_WILDCARD_HOSTS = ("", "0.0.0.0", "::")
+_FINISHED = ("succeeded", "failed", "cancelled")
+# ``run_council`` options a client may set in a job's ``options``. Filesystem,
+# checkpoint-store and callback settings come only from the server's defaults.
+CLIENT_OPTIONS = frozenset({
+    "existing_result", "existing_model", "stage2_system", "stage2_quorum",
+    "straggler_timeout", "late_policy", "consensus", "category", "schema",
+})
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class _Job:
+    job: CouncilJob
+    status: str = "queued"  # queued | running | succeeded | failed | cancelled
+    created: float = field(default_factory=time.time)
+    started: float | None = None
+    finished: float | None = None
+    error: str | None = None
+    result: dict | None = None
+    events: list[dict] = field(default_factory=list)
+    task: asyncio.Task | None = None
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def push(self, event: dict) -> None:
+        self.events.append(event)
+        # Wake every streaming reader; each re-arms by awaiting a fresh Event
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+    def summary(self, *, with_result: bool = False) -> dict:
+        data = {
+            "id": self.job.id,
+            "status": self.status,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "error": self.error,
+            "events": len(self.events),
+        }
+        if with_result:
+            data["result"] = self.result
+        return data
+
+
+class CouncilServer:
+    """Queue of council jobs served over a local socket.
+
+    Parameters
+    ----------
+    council:
+        Service that runs every job; it stays open between jobs.
+    defaults:
+        Field defaults for submitted jobs (``system_prompt``,
+        ``council_models``, ``chairman_model``, ``options``). Default
+        ``options`` may hold any ``run_council`` argument; clients may only
+        set those in ``CLIENT_OPTIONS``.
+    max_councils:
+        Councils in progress at once; further jobs wait as ``queued``.
+    token:
+        If set, requests must send ``Authorization: Bearer <token>``
+        (``council-api serve`` generates one for TCP if none is given).
+    keep_finished:
+        Finished jobs retained for status queries (oldest dropped first).
+    """
+
+    def __init__(
+        self,
+        council: CouncilService,
+        *,
+        defaults: dict | None = None,
+        max_councils: int = 8,
+        token: str | None = None,
+        keep_finished: int = 1000,
+    ) -> None:
+        self.council = council
+        self.defaults = defaults or {}
+        self.token = token
+        self.keep_finished = keep_finished
+        self._gate = asyncio.Semaphore(max(1, max_councils))
+        self._jobs: OrderedDict[str, _Job] = OrderedDict()
+        self._server: asyncio.AbstractServer | None = None
+        # Accepted Host header values; None accepts any (Unix socket, wildcard bind)
+        self._allowed_hosts: set[str] | None = None
+        self._connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    # ---- Lifecycle ----
+
+    async def start(
+        self, *, host: str = "127.0.0.1", port: int = 8765, socket_path: str | Path | None = None,
+    ) -> None:
+        if socket_path:
+            path = Path(socket_path)
+            if path.exists():
+                path.unlink()
+            self._server = await asyncio.start_unix_server(self._handle, path=str(path))
+            path.chmod(0o600)
+            logger.info("Council server listening on %s", path)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+            logger.info("Council server listening on http://%s:%d", host, port)
+            if host not in _WILDCARD_HOSTS:
+                bound_port = self._server.sockets[0].getsockname()[1]
+                names = {f"[{host}]" if ":" in host else host}
+                if host in ("localhost", "127.0.0.1", "::1"):
+                    names.update(_LOOPBACK_NAMES)
+                self._allowed_hosts = names | {f"{n}:{bound_port}" for n in names}
+
+    @property
+    def address(self) -> str:
+        sock = self._server.sockets[0].getsockname() if self._server else None
+        if isinstance(sock, tuple):
+            return f"http://{sock[0]}:{sock[1]}"
+        return str(sock)
+
+    async def serve_forever(self) -> None:
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections, cancel unfinished jobs, drop idle clients."""
+        if self._server:
+            self._server.close()
+        tasks = [j.task for j in self._jobs.values() if j.task and not j.task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        # Event streams end with their jobs; idle keep-alive readers see EOF
+        for writer in self._connections.values():
+            writer.close()
+        if self._connections:
+            await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._server:
+            await self._server.wait_closed()
+
+    # ---- Jobs ----
+
+    def submit(self, data: dict) -> _Job:
+        """Validate a job body, apply defaults and schedule it."""
+        data = dict(data)
+        options = data.get("options", {})
+        if not isinstance(options, dict):
+            raise _HTTPError(400, "Job options must be a JSON object")
+        rejected = sorted(set(options) - CLIENT_OPTIONS)
+        if rejected:
+            raise _HTTPError(400, f"Options not accepted over the API: {', '.join(rejected)}")
+        if "user_message" in data:
+            data.setdefault("user_msg", data.pop("user_message"))
+        data.setdefault("id", uuid.uuid4().hex[:12])
+        for key, value in self.defaults.items():
+            if key == "options":
+                data["options"] = {**value, **data.get("options", {})}
+            else:
+                data.setdefault(key, value)
+        data.setdefault("system_prompt", "You are a helpful expert assistant.")
+        try:
+            job = CouncilJob(**data)
+        except ValidationError as exc:
+            raise _HTTPError(400, f"Invalid job: {exc}") from exc
+        if job.id in self._jobs:
+            raise _HTTPError(409, f"Job '{job.id}' already exists")
+
+        entry = _Job(job=job)
+        self._jobs[job.id] = entry
+        entry.task = asyncio.create_task(self._run(entry))
+        self._prune()
+        return entry
+
+    async def _run(self, entry: _Job) -> None:
+        job = entry.job
+        try:
+            async with self._gate:
+                entry.status = "running"
+                entry.started = time.time()
+                entry.push({"type": "started"})
+                result = await self.council.run_council(
+                    job.system_prompt, job.user_msg,
+                    job.council_models, job.chairman_model,
+                    on_event=entry.push,
+                    **job.options,
+                )
+            entry.result = result.model_dump()
+            entry.status = "succeeded"
+            entry.push({"type": "result", "result": entry.result})
+        except asyncio.CancelledError:
+            entry.status = "cancelled"
+            entry.push({"type": "cancelled"})
+        except Exception as exc:
+            logger.exception("Council server: job %s failed", job.id)
+            entry.status = "failed"
+            entry.error = str(exc)
+            entry.push({"type": "error", "error": entry.error})
+        finally:
+            entry.finished = time.time()
+
+    def _prune(self) -> None:
+        finished = [k for k, j in self._jobs.items() if j.status in _FINISHED]
+        for key in finished[: max(0, len(finished) - self.keep_finished)]:
+            del self._jobs[key]
+
+    def _get(self, job_id: str) -> _Job:
+        entry = self._jobs.get(job_id)
+        if entry is None:
+            raise _HTTPError(404, f"Unknown job '{job_id}'")
+        return entry
+
+    # ---- HTTP ----
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections[asyncio.current_task()] = writer
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, target, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    streamed = await self._dispatch(method, target, headers, body, writer)
+                except _HTTPError as exc:
+                    await self._send_json(writer, exc.status, {"error": str(exc)}, keep_alive)
+                    streamed = False
+                except Exception as exc:
+                    logger.exception("Council server: error handling %s %s", method, target)
+                    await self._send_json(writer, 500, {"error": str(exc)}, keep_alive)
+                    streamed = False
+                if streamed or not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except _HTTPError as exc:
+            await self._send_json(writer, exc.status, {"error": str(exc)}, False)
+        finally:
+            del self._connections[asyncio.current_task()]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader):
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, _ = line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            raise _HTTPError(400, "Malformed request line") from None
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            raise _HTTPError(400, "Invalid Content-Length") from None
+        if length < 0:
+            raise _HTTPError(400, "Invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise _HTTPError(413, "Request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target, headers, body
+
+    async def _dispatch(
+        self, method: str, target: str, headers: dict[str, str], body: bytes,
+        writer: asyncio.StreamWriter,
+    ) -> bool:
+        """Handle one request; returns True if the response was streamed."""
+        if "origin" in headers:
+            raise _HTTPError(403, "Cross-origin requests are not accepted")
+        if (
+            self._allowed_hosts is not None
+            and headers.get("host", "").lower() not in self._allowed_hosts
+        ):
+            raise _HTTPError(403, "Unexpected Host header")
+        if self.token and headers.get("authorization") != f"Bearer {self.token}":
+            raise _HTTPError(401, "Missing or invalid bearer token")
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        parts = [p for p in url.path.split("/") if p]
+        keep_alive = headers.get("connection", "").lower() != "close"
+
+        if parts == ["health"] and method == "GET":
+            counts: dict[str, int] = {}
+            for entry in self._jobs.values():
+                counts[entry.status] = counts.get(entry.status, 0) + 1
+            await self._send_json(writer, 200, {"status": "ok", "jobs": counts}, keep_alive)
+        elif parts == ["jobs"] and method == "GET":
+            jobs = [j.summary() for j in self._jobs.values()]
+            await self._send_json(writer, 200, {"jobs": jobs}, keep_alive)
+        elif parts == ["jobs"] and method == "POST":
+            content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+            if content_type != "application/json":
+                raise _HTTPError(415, "Job body must be sent as Content-Type: application/json")
+            try:
+                data = json.loads(body or b"{}")
+            except json.JSONDecodeError as exc:
+                raise _HTTPError(400, f"Invalid JSON body: {exc}") from exc
+            if not isinstance(data, dict):
+                raise _HTTPError(400, "Job body must be a JSON object")
+            entry = self.submit(data)
+            if query.get("wait", ["0"])[0] not in ("0", "false", ""):
+                await asyncio.shield(entry.task)
+                await self._send_json(writer, 200, entry.summary(with_result=True), keep_alive)
+            else:
+                await self._send_json(writer, 202, entry.summary(), keep_alive)
+        elif len(parts) == 2 and parts[0] == "jobs" and method == "GET":
+            entry = self._get(parts[1])
+            await self._send_json(writer, 200, entry.summary(with_result=True), keep_alive)
+        elif len(parts) == 2 and parts[0] == "jobs" and method == "DELETE":
+            entry = self._get(parts[1])
+            if entry.task and not entry.task.done():
+                entry.task.cancel()
+                await asyncio.gather(entry.task, return_exceptions=True)
+            await self._send_json(writer, 200, entry.summary(), keep_alive)
+        elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "events" and method == "GET":
+            await self._stream_events(writer, self._get(parts[1]))
+            return True
+        elif parts and parts[0] in ("health", "jobs"):
+            raise _HTTPError(405, f"{method} not allowed on {url.path}")
+        else:
+            raise _HTTPError(404, f"No route for {url.path}")
+        return False
+
+    async def _stream_events(self, writer: asyncio.StreamWriter, entry: _Job) -> None:
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: application/x-ndjson\r\n"
+            b"Transfer-Encoding: chunked\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        sent = 0
+        while True:
+            changed = entry.changed
+            while sent < len(entry.events):
+                line = json.dumps(entry.events[sent], default=str).encode("utf-8") + b"\n"
+                writer.write(b"%x\r\n%s\r\n" % (len(line), line))
+                sent += 1
+            await writer.drain()
+            if entry.status in _FINISHED and sent >= len(entry.events):
+                break
+            await changed.wait()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    @staticmethod
+    async def _send_json(
+        writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool,
+    ) -> None:
+        body = json.dumps(payload, default=str).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+            + body
+        )
+        await writer.drain()
@@ -0,0 +1,58 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from council_api import CouncilService, LLMClient
+from council_api.routing import ModelPerformanceStore, RoutingPolicy
+
+MODELS = ["p/m1", "p/m2", "p/m3", "p/m4", "p/m5"]
+
+
+class FakeCompletions:
+    """Chat completions stub: every Stage 1 answer differs, so routing escalates."""
+
+    def __init__(self):
+        self.stage1_calls = []
+
+    async def create(self, **kwargs):
+        prompt = str(kwargs["messages"][-1]["content"])
+        if "FINAL RANKING" in prompt:
+            text = "FINAL RANKING:\n" + "\n".join(
+                f"{i}. Assessment {label}" for i, label in enumerate("ABCDE", 1)
+            )
+        elif "Assessment A" in prompt:
+            text = json.dumps({"final": 1})
+        else:
+            self.stage1_calls.append(kwargs["model"])
+            text = json.dumps({"answer": kwargs["model"]})
+        message = SimpleNamespace(content=text, tool_calls=None)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message, finish_reason="stop")],
+            usage=SimpleNamespace(
+                prompt_tokens=10, completion_tokens=5, completion_tokens_details=None,
+            ),
+        )
+
+
+def test_escalation_does_not_requery_reused_model():
+    llm = LLMClient(api_key="x", provider="openrouter")
+    completions = FakeCompletions()
+    llm.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    policy = RoutingPolicy(min_models=2)
+    policy.select = lambda models, store, category="default": models[:3]
+    service = CouncilService(
+        llm, routing=policy, performance=ModelPerformanceStore(path=None),
+    )
+
+    result = asyncio.run(service.run_council(
+        "system", "question", MODELS, "p/m1",
+        existing_result={"answer": "reused"},
+        existing_model="p/m4",
+    ))
+
+    assert result.meta.escalated
+    assert "p/m4" not in completions.stage1_calls
+    assert sorted(completions.stage1_calls) == ["p/m1", "p/m2", "p/m3", "p/m5"]
+    models = [a.model for a in result.assessments]
+    assert sorted(models) == sorted(MODELS)
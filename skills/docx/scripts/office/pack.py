@@ -3,7 +3,7 @@
 Validates with auto-repair, condenses XML formatting, and creates the Office file.
 
 Usage:
-    uv run python pack.py <input_directory> <output_file> [--original <file>] [--validate true|false]
+    uv run python pack.py <input_directory> <output_file> [--original <file>] [--validate true|false] [--jobs N] [--no-cache]
 
 Examples:
     uv run python pack.py unpacked/ output.docx --original input.docx
@@ -20,6 +20,7 @@ from pathlib import Path
 import defusedxml.minidom
 
 from validators import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validators.cache import CACHE_NAME
 
 def pack(
     input_directory: str,
@@ -27,6 +28,8 @@ def pack(
     original_file: str | None = None,
     validate: bool = True,
     infer_author_func=None,
+    jobs: int = 1,
+    cache: bool = True,
 ) -> tuple[None, str]:
     input_dir = Path(input_directory)
     output_path = Path(output_file)
@@ -42,7 +45,7 @@ def pack(
         original_path = Path(original_file)
         if original_path.exists():
             success, output = _run_validation(
-                input_dir, original_path, suffix, infer_author_func
+                input_dir, original_path, suffix, infer_author_func, jobs, cache
             )
             if output:
                 print(output)
@@ -51,7 +54,9 @@ def pack(
 
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
+        shutil.copytree(
+            input_dir, temp_content_dir, ignore=shutil.ignore_patterns(f"{CACHE_NAME}*")
+        )
 
         for pattern in ["*.xml", "*.rels"]:
             for xml_file in temp_content_dir.rglob(pattern):
@@ -71,6 +76,8 @@ def _run_validation(
     original_file: Path,
     suffix: str,
     infer_author_func=None,
+    jobs: int = 1,
+    cache: bool = True,
 ) -> tuple[bool, str | None]:
     output_lines = []
     validators = []
@@ -84,11 +91,25 @@ def _run_validation(
                 print(f"Warning: {e} Using default author 'Claude'.", file=sys.stderr)
 
         validators = [
-            DOCXSchemaValidator(unpacked_dir, original_file),
+            DOCXSchemaValidator(
+                unpacked_dir,
+                original_file,
+                jobs=jobs,
+                cache=cache,
+                baseline_cache=cache,
+            ),
             RedliningValidator(unpacked_dir, original_file, author=author),
         ]
     elif suffix == ".pptx":
-        validators = [PPTXSchemaValidator(unpacked_dir, original_file)]
+        validators = [
+            PPTXSchemaValidator(
+                unpacked_dir,
+                original_file,
+                jobs=jobs,
+                cache=cache,
+                baseline_cache=cache,
+            )
+        ]
 
     if not validators:
         return True, None
@@ -145,6 +166,19 @@ if __name__ == "__main__":
         metavar="true|false",
         help="Run validation with auto-repair (default: true)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for XSD validation (default: 1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-validate every part instead of reusing cached per-part results "
+        "or the original file's cached XSD errors",
+    )
     args = parser.parse_args()
 
     _, message = pack(
@@ -152,6 +186,8 @@ if __name__ == "__main__":
         args.output_file,
         original_file=args.original,
         validate=args.validate,
+        jobs=args.jobs,
+        cache=not args.no_cache,
     )
     print(message)
 
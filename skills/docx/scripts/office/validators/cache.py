@@ -0,0 +1,140 @@
+"""
+Per-part validation results of an unpacked document, reused while a part is unchanged.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+CACHE_NAME = ".validation-cache.json"
+
+CACHE_VERSION = 1
+
+_fingerprint = None
+
+
+def code_fingerprint():
+    """SHA-256 of the XSD schemas and validator code that cached results depend on.
+
+    Cached error sets are only valid for the schemas and checks that
+    produced them; an updated schema or validator changes the fingerprint
+    and so retires every result computed before it.
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        here = Path(__file__).parent
+        files = sorted((here.parent / "schemas").rglob("*.xsd")) + sorted(
+            here.glob("*.py")
+        )
+        sha = hashlib.sha256()
+        for path in files:
+            sha.update(path.relative_to(here.parent).as_posix().encode())
+            sha.update(b"\0")
+            sha.update(path.read_bytes())
+        _fingerprint = sha.hexdigest()
+    return _fingerprint
+
+
+class ValidationCache:
+    """Check results stored in the unpacked directory, keyed by part content.
+
+    Each check stores a JSON value per part together with the SHA-256 of
+    the part (and of any part it depends on, such as its ``.rels``). A
+    part whose content is unchanged since the last run is not parsed
+    again. Checks that span parts combine these cached per-part indexes.
+    ``key`` identifies everything else a result depends on (validator
+    class, original file, ``code_fingerprint()``); a different key
+    discards the cache.
+    """
+
+    def __init__(self, unpacked_dir, key):
+        self.unpacked_dir = Path(unpacked_dir)
+        self.path = self.unpacked_dir / CACHE_NAME
+        self.key = key
+        self._results = {}
+        self._digests = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CACHE_VERSION and data.get("key") == key:
+            self._results = data.get("results", {})
+
+    def _digest(self, path):
+        path = Path(path)
+        if path not in self._digests:
+            try:
+                self._digests[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                self._digests[path] = "-"
+        return self._digests[path]
+
+    def invalidate(self, path=None):
+        """Forget content hashes of this run (after a part is rewritten)."""
+        if path is None:
+            self._digests.clear()
+        else:
+            self._digests.pop(Path(path), None)
+
+    def _fingerprint(self, xml_file, deps):
+        return "/".join(self._digest(p) for p in (xml_file, *deps))
+
+    def _member(self, xml_file):
+        return Path(xml_file).relative_to(self.unpacked_dir).as_posix()
+
+    def lookup(self, check, xml_file, *deps):
+        """(True, value) if ``check`` has a result for the unchanged part, else (False, None)."""
+        hit = self._results.get(check, {}).get(self._member(xml_file))
+        if hit is not None and hit[0] == self._fingerprint(xml_file, deps):
+            return True, hit[1]
+        return False, None
+
+    def store(self, check, xml_file, value, *deps):
+        entries = self._results.setdefault(check, {})
+        entries[self._member(xml_file)] = [self._fingerprint(xml_file, deps), value]
+        self._dirty = True
+
+    def get(self, check, xml_file, compute, *deps):
+        """Cached ``compute(xml_file)``, recomputed if the part or ``deps`` changed."""
+        found, value = self.lookup(check, xml_file, *deps)
+        if not found:
+            value = compute(xml_file)
+            self.store(check, xml_file, value, *deps)
+        return value
+
+    def save(self):
+        """Write results back, dropping parts that no longer exist."""
+        if not self._dirty:
+            return
+        results = {
+            check: {
+                member: entry
+                for member, entry in sorted(entries.items())
+                if (self.unpacked_dir / member).exists()
+            }
+            for check, entries in sorted(self._results.items())
+        }
+        data = {"version": CACHE_VERSION, "key": self.key, "results": results}
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.unpacked_dir, prefix=CACHE_NAME)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+
+
+def is_cache_file(path):
+    """Whether ``path`` is the validation cache (or its temp file), never part of the document."""
+    return Path(path).name.startswith(CACHE_NAME)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -2,12 +2,15 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    uv run python validate.py <path> [--original <original_file>] [--auto-repair] [--author NAME]
+    uv run python validate.py <path> [--original <original_file>] [--auto-repair] [--author NAME] [--jobs N] [--no-cache]
 
 The first argument can be either:
 - An unpacked directory containing the Office document XML files
 - A packed Office file (.docx/.pptx/.xlsx) which will be unpacked to a temp directory
 
+When validating an unpacked directory, per-part results are cached in
+<dir>/.validation-cache.json, so later runs only re-check changed parts.
+
 Auto-repair fixes:
 - paraId/durableId values that exceed OOXML limits
 - Missing xml:space="preserve" on w:t elements with whitespace
@@ -50,6 +53,19 @@ def main():
         default="Claude",
         help="Author name for redlining validation (default: Claude)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Validate parts against the XSD schemas in N worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-check every part instead of reusing results cached in the unpacked "
+        "directory or the original file's XSD errors cached across runs",
+    )
     args = parser.parse_args()
 
     path = Path(args.path)
@@ -73,14 +89,23 @@ def main():
         with zipfile.ZipFile(path, "r") as zf:
             zf.extractall(temp_dir)
         unpacked_dir = Path(temp_dir)
+        cache = False
     else:
         assert path.is_dir(), f"Error: {path} is not a directory or Office file"
         unpacked_dir = path
+        cache = not args.no_cache
 
     match file_extension:
         case ".docx":
             validators = [
-                DOCXSchemaValidator(unpacked_dir, original_file, verbose=args.verbose),
+                DOCXSchemaValidator(
+                    unpacked_dir,
+                    original_file,
+                    verbose=args.verbose,
+                    jobs=args.jobs,
+                    cache=cache,
+                    baseline_cache=not args.no_cache,
+                ),
             ]
             if original_file:
                 validators.append(
@@ -88,7 +113,14 @@ def main():
                 )
         case ".pptx":
             validators = [
-                PPTXSchemaValidator(unpacked_dir, original_file, verbose=args.verbose),
+                PPTXSchemaValidator(
+                    unpacked_dir,
+                    original_file,
+                    verbose=args.verbose,
+                    jobs=args.jobs,
+                    cache=cache,
+                    baseline_cache=not args.no_cache,
+                ),
             ]
         case _:
             print(f"Error: Validation not supported for file type {file_extension}")
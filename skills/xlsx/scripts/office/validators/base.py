@@ -2,12 +2,63 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
 import re
 from pathlib import Path
 
 import defusedxml.minidom
 import lxml.etree
 
+from .baseline import CACHE_DIR, _baselines, get_baseline
+from .cache import ValidationCache, code_fingerprint, is_cache_file
+
+_compiled_schemas = {}
+
+
+def compiled_schema(schema_path):
+    """Compiled XMLSchema for an XSD file, memoized for the life of the process.
+
+    Compiling the OOXML schema set dominates XSD validation, so every part,
+    the original file's parts and later documents validated by the same
+    process share one compilation per schema file.
+    """
+    key = str(Path(schema_path).resolve())
+    schema = _compiled_schemas.get(key)
+    if schema is None:
+        with open(key, "rb") as xsd_file:
+            parser = lxml.etree.XMLParser()
+            xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=key)
+        schema = lxml.etree.XMLSchema(xsd_doc)
+        _compiled_schemas[key] = schema
+    return schema
+
+
+_worker_validator = None
+
+
+def _init_xsd_worker(
+    validator_class, unpacked_dir, original_file, baseline_cache, schema_paths
+):
+    global _worker_validator
+    # A forked worker must not share the parent's open original archive
+    _baselines.clear()
+    _worker_validator = validator_class(
+        unpacked_dir, original_file, baseline_cache=baseline_cache
+    )
+    # Already compiled when the worker was forked; compiled here when spawned
+    for schema_path in schema_paths:
+        compiled_schema(schema_path)
+
+
+def _xsd_worker_task(xml_file):
+    validator = _worker_validator
+    is_valid, new_errors = validator.validate_file_against_xsd(xml_file)
+    original_errors = None
+    if validator.original is not None:
+        member = xml_file.relative_to(validator.unpacked_dir).as_posix()
+        original_errors = validator.original.xsd_errors(member)
+    return is_valid, new_errors, original_errors
+
 
 class BaseSchemaValidator:
 
@@ -91,27 +142,97 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file=None, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file=None,
+        verbose=False,
+        jobs=1,
+        cache=False,
+        baseline_cache=True,
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file) if original_file else None
         self.verbose = verbose
+        self.jobs = max(1, jobs)
+        self.use_cache = cache
+        self.baseline_cache = baseline_cache
 
         self.schemas_dir = Path(__file__).parent.parent / "schemas"
 
         patterns = ["*.xml", "*.rels"]
-        self.xml_files = [
+        self.xml_files = sorted(
             f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
-        ]
+        )
 
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        self._trees = {}
+        self._cache = None
+
     def validate(self):
         raise NotImplementedError("Subclasses must implement the validate method")
 
     def repair(self) -> int:
         return self.repair_whitespace_preservation()
 
+    def _parse(self, xml_file):
+        """Parsed tree of a part, shared by all checks.
+
+        Each part is parsed once per validator. The tree is shared, so a
+        check that mutates it must work on ``copy.deepcopy`` of it. Parse
+        errors are cached too and re-raised on every call.
+        """
+        xml_file = Path(xml_file)
+        tree = self._trees.get(xml_file)
+        if tree is None:
+            try:
+                tree = lxml.etree.parse(str(xml_file))
+            except lxml.etree.XMLSyntaxError as e:
+                tree = e
+            self._trees[xml_file] = tree
+        if isinstance(tree, Exception):
+            raise tree
+        return tree
+
+    def _invalidate(self, xml_file=None):
+        if xml_file is None:
+            self._trees.clear()
+        else:
+            self._trees.pop(Path(xml_file), None)
+        if self._cache is not None:
+            self._cache.invalidate(xml_file)
+
+    @property
+    def cache(self):
+        """``ValidationCache`` of the unpacked directory, or None when disabled."""
+        if not self.use_cache:
+            return None
+        if self._cache is None:
+            original = self.original
+            key = ":".join((
+                type(self).__name__,
+                original.digest if original else "",
+                code_fingerprint(),
+            ))
+            self._cache = ValidationCache(self.unpacked_dir, key)
+        return self._cache
+
+    def _cached(self, check, xml_file, compute, *deps):
+        """``compute(xml_file)``, reused from the cache while the part is unchanged.
+
+        ``compute`` must return plain JSON data (lists, not tuples or sets)
+        so that cached and fresh results are interchangeable.
+        """
+        if self.cache is None:
+            return compute(xml_file)
+        return self.cache.get(check, xml_file, compute, *deps)
+
+    def save_cache(self):
+        if self._cache is not None:
+            self._cache.save()
+
     def repair_whitespace_preservation(self) -> int:
         repairs = 0
 
@@ -134,6 +255,7 @@ class BaseSchemaValidator:
 
                 if modified:
                     xml_file.write_bytes(dom.toxml(encoding="UTF-8"))
+                    self._invalidate(xml_file)
 
             except Exception:
                 pass
@@ -144,18 +266,7 @@ class BaseSchemaValidator:
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
-            except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
-                )
+            errors.extend(self._cached("xml", xml_file, self._xml_errors))
 
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
@@ -167,25 +278,28 @@ class BaseSchemaValidator:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    def _xml_errors(self, xml_file):
+        try:
+            self._parse(xml_file)
+        except lxml.etree.XMLSyntaxError as e:
+            return [
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Line {e.lineno}: {e.msg}"
+            ]
+        except Exception as e:
+            return [
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Unexpected error: {str(e)}"
+            ]
+        return []
+
     def validate_namespaces(self):
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}
-
-                for attr_val in [
-                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
-                ]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+            errors.extend(
+                self._cached("namespaces", xml_file, self._namespace_errors)
+            )
 
         if errors:
             print(f"FAILED - {len(errors)} namespace issues:")
@@ -196,85 +310,49 @@ class BaseSchemaValidator:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
+    def _namespace_errors(self, xml_file):
+        errors = []
+        try:
+            root = self._parse(xml_file).getroot()
+        except lxml.etree.XMLSyntaxError:
+            return errors
+        declared = set(root.nsmap.keys()) - {None}
+
+        for attr_val in [v for k, v in root.attrib.items() if k.endswith("Ignorable")]:
+            undeclared = set(attr_val.split()) - declared
+            errors.extend(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Namespace '{ns}' in Ignorable but not declared"
+                for ns in sorted(undeclared)
+            )
+        return errors
+
     def validate_unique_ids(self):
         errors = []
         global_ids = {}
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}
+            # File-scoped duplicates are complete per part; globally scoped
+            # IDs are indexed per part and checked across parts here
+            for entry in self._cached("unique_ids", xml_file, self._id_index):
+                if isinstance(entry, str):
+                    errors.append(entry)
+                    continue
 
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                for elem in root.iter():
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+                id_value, line, tag = entry
+                if id_value in global_ids:
+                    prev_file, prev_line, prev_tag = global_ids[id_value]
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                    )
+                else:
+                    global_ids[id_value] = (
+                        xml_file.relative_to(self.unpacked_dir),
+                        line,
+                        tag,
                     )
-
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        in_excluded_container = any(
-                            ancestor.tag.split("}")[-1].lower() in self.EXCLUDED_ID_CONTAINERS
-                            for ancestor in elem.iterancestors()
-                        )
-                        if in_excluded_container:
-                            continue
-
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -286,10 +364,76 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _id_index(self, xml_file):
+        """Errors (str) and global ID occurrences ([id, line, tag]) in document order."""
+        entries = []
+
+        try:
+            # Copy: AlternateContent is stripped before the scan
+            root = copy.deepcopy(self._parse(xml_file).getroot())
+            file_ids = {}
+
+            mc_elements = root.xpath(
+                ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
+            )
+            for elem in mc_elements:
+                elem.getparent().remove(elem)
+
+            for elem in root.iter():
+                tag = (
+                    elem.tag.split("}")[-1].lower()
+                    if "}" in elem.tag
+                    else elem.tag.lower()
+                )
+
+                if tag in self.UNIQUE_ID_REQUIREMENTS:
+                    in_excluded_container = any(
+                        ancestor.tag.split("}")[-1].lower() in self.EXCLUDED_ID_CONTAINERS
+                        for ancestor in elem.iterancestors()
+                    )
+                    if in_excluded_container:
+                        continue
+
+                    attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+
+                    id_value = None
+                    for attr, value in elem.attrib.items():
+                        attr_local = (
+                            attr.split("}")[-1].lower()
+                            if "}" in attr
+                            else attr.lower()
+                        )
+                        if attr_local == attr_name:
+                            id_value = value
+                            break
+
+                    if id_value is not None:
+                        if scope == "global":
+                            entries.append([id_value, elem.sourceline, tag])
+                        elif scope == "file":
+                            key = (tag, attr_name)
+                            if key not in file_ids:
+                                file_ids[key] = {}
+
+                            if id_value in file_ids[key]:
+                                prev_line = file_ids[key][id_value]
+                                entries.append(
+                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                    f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                    f"(first occurrence at line {prev_line})"
+                                )
+                            else:
+                                file_ids[key][id_value] = elem.sourceline
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            entries.append(f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}")
+
+        return entries
+
     def validate_file_references(self):
         errors = []
 
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+        rels_files = sorted(self.unpacked_dir.rglob("*.rels"))
 
         if not rels_files:
             if self.verbose:
@@ -302,6 +446,7 @@ class BaseSchemaValidator:
                 file_path.is_file()
                 and file_path.name != "[Content_Types].xml"
                 and not file_path.name.endswith(".rels")
+                and not is_cache_file(file_path)
             ):
                 all_files.append(file_path.resolve())
 
@@ -313,50 +458,39 @@ class BaseSchemaValidator:
             )
 
         for rels_file in rels_files:
-            try:
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                rels_dir = rels_file.parent
-
-                referenced_files = set()
-                broken_refs = []
+            rels_index = self._cached("rels", rels_file, self._rels_index)
+            if "error" in rels_index:
+                rel_path = rels_file.relative_to(self.unpacked_dir)
+                errors.append(f"  Error parsing {rel_path}: {rels_index['error']}")
+                continue
 
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):
-                        if target.startswith("/"):
-                            target_path = self.unpacked_dir / target.lstrip("/")
-                        elif rels_file.name == ".rels":
-                            target_path = self.unpacked_dir / target
-                        else:
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
+            rels_dir = rels_file.parent
+            broken_refs = []
 
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
+            for target, line_num in rels_index["targets"]:
+                if target.startswith("/"):
+                    target_path = self.unpacked_dir / target.lstrip("/")
+                elif rels_file.name == ".rels":
+                    target_path = self.unpacked_dir / target
+                else:
+                    base_dir = rels_dir.parent
+                    target_path = base_dir / target
 
-            except Exception as e:
+                try:
+                    target_path = target_path.resolve()
+                    if target_path.exists() and target_path.is_file():
+                        all_referenced_files.add(target_path)
+                    else:
+                        broken_refs.append((target, line_num))
+                except (OSError, ValueError):
+                    broken_refs.append((target, line_num))
+
+            if broken_refs:
                 rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+                for broken_ref, line_num in broken_refs:
+                    errors.append(
+                        f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
+                    )
 
         unreferenced_files = set(all_files) - all_referenced_files
 
@@ -382,9 +516,37 @@ class BaseSchemaValidator:
                 )
             return True
 
-    def validate_all_relationship_ids(self):
-        import lxml.etree
+    def _rels_index(self, rels_file):
+        """Internal targets, relationship types and duplicate-ID errors of a .rels part."""
+        try:
+            rels_root = self._parse(rels_file).getroot()
+        except Exception as e:
+            return {"error": str(e)}
+
+        targets = []
+        types = {}
+        duplicates = []
+        for rel in rels_root.findall(
+            f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+        ):
+            target = rel.get("Target")
+            if target and not target.startswith(("http", "mailto:")):
+                targets.append([target, rel.sourceline])
+
+            rid = rel.get("Id")
+            rel_type = rel.get("Type", "")
+            if rid:
+                if rid in types:
+                    rels_rel_path = rels_file.relative_to(self.unpacked_dir)
+                    duplicates.append(
+                        f"  {rels_rel_path}: Line {rel.sourceline}: "
+                        f"Duplicate relationship ID '{rid}' (IDs must be unique)"
+                    )
+                types[rid] = rel_type.split("/")[-1] if "/" in rel_type else rel_type
+
+        return {"targets": targets, "types": types, "duplicates": duplicates}
 
+    def validate_all_relationship_ids(self):
         errors = []
 
         for xml_file in self.xml_files:
@@ -397,63 +559,37 @@ class BaseSchemaValidator:
             if not rels_file.exists():
                 continue
 
-            try:
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
+            xml_rel_path = xml_file.relative_to(self.unpacked_dir)
 
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
-                            )
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
-
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                r_ns = self.OFFICE_RELATIONSHIPS_NAMESPACE
-                rid_attrs_to_check = ["id", "embed", "link"]
-                for elem in xml_root.iter():
-                    for attr_name in rid_attrs_to_check:
-                        rid_attr = elem.get(f"{{{r_ns}}}{attr_name}")
-                        if not rid_attr:
-                            continue
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        )
+            rels_index = self._cached("rels", rels_file, self._rels_index)
+            if "error" in rels_index:
+                errors.append(f"  Error processing {xml_rel_path}: {rels_index['error']}")
+                continue
+            rid_to_type = rels_index["types"]
+            errors.extend(rels_index["duplicates"])
+
+            refs = self._cached("relationship_refs", xml_file, self._relationship_refs)
+            if "error" in refs:
+                errors.append(f"  Error processing {xml_rel_path}: {refs['error']}")
+                continue
 
-                        if rid_attr not in rid_to_type:
+            for attr_name, rid_attr, elem_name, line in refs["refs"]:
+                if rid_attr not in rid_to_type:
+                    errors.append(
+                        f"  {xml_rel_path}: Line {line}: "
+                        f"<{elem_name}> r:{attr_name} references non-existent relationship '{rid_attr}' "
+                        f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+                    )
+                elif attr_name == "id" and self.ELEMENT_RELATIONSHIP_TYPES:
+                    expected_type = self._get_expected_relationship_type(elem_name)
+                    if expected_type:
+                        actual_type = rid_to_type[rid_attr]
+                        if expected_type not in actual_type.lower():
                             errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> r:{attr_name} references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        elif attr_name == "id" and self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
+                                f"  {xml_rel_path}: Line {line}: "
+                                f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                                f"but should point to a '{expected_type}' relationship"
                             )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
-
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
@@ -466,6 +602,25 @@ class BaseSchemaValidator:
                 print("PASSED - All relationship ID references are valid")
             return True
 
+    def _relationship_refs(self, xml_file):
+        """r:id / r:embed / r:link references of a part: [attr, rId, element, line]."""
+        try:
+            xml_root = self._parse(xml_file).getroot()
+        except Exception as e:
+            return {"error": str(e)}
+
+        refs = []
+        r_ns = self.OFFICE_RELATIONSHIPS_NAMESPACE
+        rid_attrs_to_check = ["id", "embed", "link"]
+        for elem in xml_root.iter():
+            for attr_name in rid_attrs_to_check:
+                rid_attr = elem.get(f"{{{r_ns}}}{attr_name}")
+                if not rid_attr:
+                    continue
+                elem_name = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+                refs.append([attr_name, rid_attr, elem_name, elem.sourceline])
+        return {"refs": refs}
+
     def _get_expected_relationship_type(self, element_name):
         elem_lower = element_name.lower()
 
@@ -498,7 +653,7 @@ class BaseSchemaValidator:
             return False
 
         try:
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -538,8 +693,8 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
+            all_files = sorted(self.unpacked_dir.rglob("*"))
+            all_files = [f for f in all_files if f.is_file() and not is_cache_file(f)]
 
             for xml_file in self.xml_files:
                 path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
@@ -552,17 +707,11 @@ class BaseSchemaValidator:
                 ):
                     continue
 
-                try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
-
-                    if root_name in declarable_roots and path_str not in declared_parts:
-                        errors.append(
-                            f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
-                        )
-
-                except Exception:
-                    continue
+                root_name = self._cached("root", xml_file, self._root_name)
+                if root_name in declarable_roots and path_str not in declared_parts:
+                    errors.append(
+                        f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
+                    )
 
             for file_path in all_files:
                 if file_path.suffix.lower() in {".xml", ".rels"}:
@@ -595,6 +744,13 @@ class BaseSchemaValidator:
                 )
             return True
 
+    def _root_name(self, xml_file):
+        try:
+            root_tag = self._parse(xml_file).getroot().tag
+        except Exception:
+            return None
+        return root_tag.split("}")[-1] if "}" in root_tag else root_tag
+
     def validate_file_against_xsd(self, xml_file, verbose=False):
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
@@ -639,11 +795,10 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        for xml_file, (is_valid, new_file_errors) in zip(
+            self.xml_files, self._xsd_results()
+        ):
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
             if is_valid is None:
                 skipped_count += 1
@@ -657,7 +812,7 @@ class BaseSchemaValidator:
                 continue
 
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:
+            for error in sorted(new_file_errors)[:3]:
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
@@ -672,6 +827,9 @@ class BaseSchemaValidator:
                 f"  - With NEW errors: {len(new_errors) > 0 and len([e for e in new_errors if not e.startswith('    ')]) or 0}"
             )
 
+        if self.original is not None:
+            self.original.save()
+
         if new_errors:
             print("\nFAILED - Found NEW validation errors:")
             for error in new_errors:
@@ -682,6 +840,82 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _xsd_results(self):
+        """(is_valid, new_errors) per part, in ``xml_files`` order.
+
+        Parts unchanged since a cached run are not validated again. With
+        ``jobs`` > 1 the rest are validated in a process pool. Schemas are
+        compiled in this process first, so forked workers start warm.
+        Results come back in submission order, so the report is identical
+        to a sequential run.
+        """
+        results = {}
+        pending = []
+        for xml_file in self.xml_files:
+            found, value = False, None
+            if self.cache is not None:
+                found, value = self.cache.lookup("xsd", xml_file)
+            if found:
+                results[xml_file] = (value[0], set(value[1]))
+            else:
+                pending.append(xml_file)
+
+        if self.jobs == 1 or len(pending) < 2:
+            for xml_file in pending:
+                results[xml_file] = self.validate_file_against_xsd(
+                    xml_file, verbose=False
+                )
+        else:
+            for xml_file, result in zip(pending, self._xsd_pool_results(pending)):
+                results[xml_file] = result
+
+        if self.cache is not None:
+            for xml_file in pending:
+                is_valid, new_errors = results[xml_file]
+                self.cache.store("xsd", xml_file, [is_valid, sorted(new_errors)])
+
+        return [results[xml_file] for xml_file in self.xml_files]
+
+    def _xsd_pool_results(self, xml_files):
+        from concurrent.futures import ProcessPoolExecutor
+
+        schema_paths = sorted(
+            {
+                str(schema_path)
+                for xml_file in xml_files
+                if (schema_path := self._get_schema_path(
+                    xml_file.relative_to(self.unpacked_dir)
+                ))
+            }
+        )
+        for schema_path in schema_paths:
+            compiled_schema(schema_path)
+
+        jobs = min(self.jobs, len(xml_files))
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_xsd_worker,
+            initargs=(
+                type(self),
+                self.unpacked_dir,
+                self.original_file,
+                self.baseline_cache,
+                schema_paths,
+            ),
+        ) as pool:
+            chunksize = max(1, len(xml_files) // (jobs * 4))
+            results = list(pool.map(_xsd_worker_task, xml_files, chunksize=chunksize))
+
+        merged = []
+        for xml_file, (is_valid, new_errors, original_errors) in zip(
+            xml_files, results
+        ):
+            if original_errors is not None:
+                member = xml_file.relative_to(self.unpacked_dir).as_posix()
+                self.original.store_xsd_errors(member, original_errors)
+            merged.append((is_valid, new_errors))
+        return merged
+
     def _get_schema_path(self, xml_file):
         if xml_file.name in self.SCHEMA_MAPPINGS:
             return self.schemas_dir / self.SCHEMA_MAPPINGS[xml_file.name]
@@ -748,25 +982,21 @@ class BaseSchemaValidator:
         return xml_doc
 
     def _validate_single_file_xsd(self, xml_file, base_path):
-        schema_path = self._get_schema_path(xml_file)
+        relative_path = Path(xml_file).relative_to(base_path)
+        return self._validate_xsd(relative_path, lambda: self._parse(xml_file))
+
+    def _validate_xsd(self, relative_path, load):
+        schema_path = self._get_schema_path(relative_path)
         if not schema_path:
             return None, None
 
         try:
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
-
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            schema = compiled_schema(schema_path)
+            xml_doc = load()
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
-            relative_path = xml_file.relative_to(base_path)
             if (
                 relative_path.parts
                 and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
@@ -784,32 +1014,39 @@ class BaseSchemaValidator:
         except Exception as e:
             return False, {str(e)}
 
-    def _get_original_file_errors(self, xml_file):
+    @property
+    def original(self):
+        """``OriginalBaseline`` of ``original_file``, or None without one.
+
+        Its XSD error sets are persisted across runs unless the validator
+        was created with ``baseline_cache=False``.
+        """
         if self.original_file is None:
-            return set()
+            return None
+        return get_baseline(
+            self.original_file, CACHE_DIR if self.baseline_cache else None
+        )
 
-        import tempfile
-        import zipfile
+    def _get_original_file_errors(self, xml_file):
+        original = self.original
+        if original is None:
+            return set()
 
         xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
+        relative_path = xml_file.relative_to(self.unpacked_dir)
+        member = relative_path.as_posix()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            original_xml_file = temp_path / relative_path
-
-            if not original_xml_file.exists():
-                return set()
-
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        errors = original.xsd_errors(member)
+        if errors is None:
+            if original.read(member) is None:
+                errors = set()
+            else:
+                _, errors = self._validate_xsd(
+                    relative_path, lambda: original.parse(member)
+                )
+                errors = errors or set()
+            original.store_xsd_errors(member, errors)
+        return errors
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         warnings = []
@@ -0,0 +1,140 @@
+"""
+Read-only view of the original Office file that edits are validated against.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+import lxml.etree
+
+from .cache import code_fingerprint
+
+CACHE_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+) / "office-validate"
+
+CACHE_VERSION = 1
+
+
+class OriginalBaseline:
+    """Members of the original archive, read straight from the zip on demand.
+
+    Nothing is extracted to disk. Member bytes are read once. The XSD error
+    set of each original part is computed once. Error sets are persisted
+    under ``cache_dir``, keyed by the SHA-256 of the original file and by
+    ``code_fingerprint()``, so repeated validations against an unchanged
+    original reuse them until the schemas or validators change. Without a
+    ``cache_dir`` nothing is read from or written to disk.
+    """
+
+    def __init__(self, original_file, cache_dir=CACHE_DIR):
+        self.path = Path(original_file).resolve()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._zip = None
+        self._members = {}
+        self._digest = None
+        self._errors = None
+        self._dirty = False
+
+    def _archive(self):
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.path, "r")
+        return self._zip
+
+    def read(self, member):
+        """Bytes of ``member`` (posix path inside the archive), or None if absent."""
+        if member not in self._members:
+            try:
+                self._members[member] = self._archive().read(member)
+            except KeyError:
+                self._members[member] = None
+        return self._members[member]
+
+    def parse(self, member):
+        """Fresh lxml tree of ``member`` (safe to mutate), or None if absent."""
+        data = self.read(member)
+        if data is None:
+            return None
+        return lxml.etree.ElementTree(lxml.etree.fromstring(data))
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    @property
+    def digest(self):
+        if self._digest is None:
+            sha = hashlib.sha256()
+            with open(self.path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    sha.update(chunk)
+            self._digest = sha.hexdigest()
+        return self._digest
+
+    def _cache_file(self):
+        return self.cache_dir / f"{self.digest}-{code_fingerprint()[:16]}.json"
+
+    def _load_errors(self):
+        self._errors = {}
+        if not self.cache_dir:
+            return
+        try:
+            data = json.loads(self._cache_file().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CACHE_VERSION:
+            self._errors = {k: set(v) for k, v in data.get("errors", {}).items()}
+
+    def xsd_errors(self, member):
+        """Cached XSD error set of an original part, or None if not computed yet."""
+        if self._errors is None:
+            self._load_errors()
+        errors = self._errors.get(member)
+        return set(errors) if errors is not None else None
+
+    def store_xsd_errors(self, member, errors):
+        if self._errors is None:
+            self._load_errors()
+        self._errors[member] = set(errors)
+        self._dirty = True
+
+    def save(self):
+        """Persist computed error sets (no-op if nothing new or no cache dir)."""
+        if not self._dirty or not self.cache_dir:
+            return
+        data = {
+            "version": CACHE_VERSION,
+            "errors": {k: sorted(v) for k, v in sorted(self._errors.items())},
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self._cache_file())
+            self._dirty = False
+        except OSError:
+            pass
+
+
+_baselines = {}
+
+
+def get_baseline(original_file, cache_dir=CACHE_DIR):
+    """Shared baseline for ``original_file``, so validators of one run read it once."""
+    path = Path(original_file).resolve()
+    stat = path.stat()
+    key = (path, stat.st_mtime_ns, stat.st_size, cache_dir)
+    baseline = _baselines.get(key)
+    if baseline is None:
+        baseline = _baselines[key] = OriginalBaseline(path, cache_dir)
+    return baseline
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -4,8 +4,6 @@ Validator for Word document XML files against XSD schemas.
 
 import random
 import re
-import tempfile
-import zipfile
 
 import defusedxml.minidom
 import lxml.etree
@@ -23,6 +21,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
     def validate(self):
         if not self.validate_xml():
+            self.save_cache()
             return False
 
         all_valid = True
@@ -61,6 +60,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         self.compare_paragraph_counts()
 
+        self.save_cache()
         return all_valid
 
     def validate_whitespace_preservation(self):
@@ -70,34 +70,9 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        if re.search(r"^[ \t\n\r]", text) or re.search(
-                            r"[ \t\n\r]$", text
-                        ):
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            errors.extend(
+                self._cached("whitespace", xml_file, self._whitespace_errors)
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
@@ -109,6 +84,40 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All whitespace is properly preserved")
             return True
 
+    def _whitespace_errors(self, xml_file):
+        errors = []
+
+        try:
+            root = self._parse(xml_file).getroot()
+
+            for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
+                if elem.text:
+                    text = elem.text
+                    if re.search(r"^[ \t\n\r]", text) or re.search(
+                        r"[ \t\n\r]$", text
+                    ):
+                        xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
+                        if (
+                            xml_space_attr not in elem.attrib
+                            or elem.attrib[xml_space_attr] != "preserve"
+                        ):
+                            text_preview = (
+                                repr(text)[:50] + "..."
+                                if len(repr(text)) > 50
+                                else repr(text)
+                            )
+                            errors.append(
+                                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
+                            )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+
+        return errors
+
     def validate_deletions(self):
         errors = []
 
@@ -116,39 +125,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                for t_elem in root.xpath(".//w:del//w:t", namespaces=namespaces):
-                    if t_elem.text:
-                        text_preview = (
-                            repr(t_elem.text)[:50] + "..."
-                            if len(repr(t_elem.text)) > 50
-                            else repr(t_elem.text)
-                        )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
-                        )
-
-                for instr_elem in root.xpath(
-                    ".//w:del//w:instrText", namespaces=namespaces
-                ):
-                    text_preview = (
-                        repr(instr_elem.text or "")[:50] + "..."
-                        if len(repr(instr_elem.text or "")) > 50
-                        else repr(instr_elem.text or "")
-                    )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {instr_elem.sourceline}: <w:instrText> found within <w:del> (use <w:delInstrText>): {text_preview}"
-                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            errors.extend(self._cached("deletions", xml_file, self._deletion_errors))
 
         if errors:
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
@@ -160,6 +137,45 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - No w:t elements found within w:del elements")
             return True
 
+    def _deletion_errors(self, xml_file):
+        errors = []
+
+        try:
+            root = self._parse(xml_file).getroot()
+            namespaces = {"w": self.WORD_2006_NAMESPACE}
+
+            for t_elem in root.xpath(".//w:del//w:t", namespaces=namespaces):
+                if t_elem.text:
+                    text_preview = (
+                        repr(t_elem.text)[:50] + "..."
+                        if len(repr(t_elem.text)) > 50
+                        else repr(t_elem.text)
+                    )
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
+                    )
+
+            for instr_elem in root.xpath(
+                ".//w:del//w:instrText", namespaces=namespaces
+            ):
+                text_preview = (
+                    repr(instr_elem.text or "")[:50] + "..."
+                    if len(repr(instr_elem.text or "")) > 50
+                    else repr(instr_elem.text or "")
+                )
+                errors.append(
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                    f"Line {instr_elem.sourceline}: <w:instrText> found within <w:del> (use <w:delInstrText>): {text_preview}"
+                )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+
+        return errors
+
     def count_paragraphs_in_unpacked(self):
         count = 0
 
@@ -167,32 +183,39 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
-            except Exception as e:
-                print(f"Error counting paragraphs in unpacked document: {e}")
+            result = self._cached("paragraphs", xml_file, self._count_paragraphs)
+            if "error" in result:
+                print(f"Error counting paragraphs in unpacked document: {result['error']}")
+                count = 0
+            else:
+                count = result["count"]
 
         return count
 
+    def _count_paragraphs(self, xml_file):
+        """Number of paragraphs in a part, or the error that prevented counting."""
+        try:
+            root = self._parse(xml_file).getroot()
+        except Exception as e:
+            return {"error": str(e)}
+        paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+        return {"count": len(paragraphs)}
+
     def count_paragraphs_in_original(self):
-        original = self.original_file
+        original = self.original
         if original is None:
             return 0
 
         count = 0
 
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with zipfile.ZipFile(original, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
+            data = original.read("word/document.xml")
+            if data is None:
+                raise FileNotFoundError("word/document.xml not found")
+            root = lxml.etree.fromstring(data)
 
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            count = len(paragraphs)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -206,29 +229,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]", namespaces=namespaces
-                )
-
-                for elem in invalid_elements:
-                    text_preview = (
-                        repr(elem.text or "")[:50] + "..."
-                        if len(repr(elem.text or "")) > 50
-                        else repr(elem.text or "")
-                    )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
-                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            errors.extend(self._cached("insertions", xml_file, self._insertion_errors))
 
         if errors:
             print(f"FAILED - Found {len(errors)} insertion validation violations:")
@@ -240,6 +241,35 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - No w:delText elements within w:ins elements")
             return True
 
+    def _insertion_errors(self, xml_file):
+        errors = []
+
+        try:
+            root = self._parse(xml_file).getroot()
+            namespaces = {"w": self.WORD_2006_NAMESPACE}
+
+            invalid_elements = root.xpath(
+                ".//w:ins//w:delText[not(ancestor::w:del)]", namespaces=namespaces
+            )
+
+            for elem in invalid_elements:
+                text_preview = (
+                    repr(elem.text or "")[:50] + "..."
+                    if len(repr(elem.text or "")) > 50
+                    else repr(elem.text or "")
+                )
+                errors.append(
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                    f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
+                )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+
+        return errors
+
     def compare_paragraph_counts(self):
         original_count = self.count_paragraphs_in_original()
         new_count = self.count_paragraphs_in_unpacked()
@@ -253,39 +283,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
     def validate_id_constraints(self):
         errors = []
-        para_id_attr = f"{{{self.W14_NAMESPACE}}}paraId"
-        durable_id_attr = f"{{{self.W16CID_NAMESPACE}}}durableId"
 
         for xml_file in self.xml_files:
-            try:
-                for elem in lxml.etree.parse(str(xml_file)).iter():
-                    if val := elem.get(para_id_attr):
-                        if self._parse_id_value(val, base=16) >= 0x80000000:
-                            errors.append(
-                                f"  {xml_file.name}:{elem.sourceline}: paraId={val} >= 0x80000000"
-                            )
-
-                    if val := elem.get(durable_id_attr):
-                        if xml_file.name == "numbering.xml":
-                            try:
-                                if self._parse_id_value(val, base=10) >= 0x7FFFFFFF:
-                                    errors.append(
-                                        f"  {xml_file.name}:{elem.sourceline}: "
-                                        f"durableId={val} >= 0x7FFFFFFF"
-                                    )
-                            except ValueError:
-                                errors.append(
-                                    f"  {xml_file.name}:{elem.sourceline}: "
-                                    f"durableId={val} must be decimal in numbering.xml"
-                                )
-                        else:
-                            if self._parse_id_value(val, base=16) >= 0x7FFFFFFF:
-                                errors.append(
-                                    f"  {xml_file.name}:{elem.sourceline}: "
-                                    f"durableId={val} >= 0x7FFFFFFF"
-                                )
-            except Exception:
-                pass
+            errors.extend(
+                self._cached("id_constraints", xml_file, self._id_constraint_errors)
+            )
 
         if errors:
             print(f"FAILED - {len(errors)} ID constraint violations:")
@@ -295,6 +297,43 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             print("PASSED - All paraId/durableId values within constraints")
         return not errors
 
+    def _id_constraint_errors(self, xml_file):
+        errors = []
+        para_id_attr = f"{{{self.W14_NAMESPACE}}}paraId"
+        durable_id_attr = f"{{{self.W16CID_NAMESPACE}}}durableId"
+
+        try:
+            for elem in self._parse(xml_file).iter():
+                if val := elem.get(para_id_attr):
+                    if self._parse_id_value(val, base=16) >= 0x80000000:
+                        errors.append(
+                            f"  {xml_file.name}:{elem.sourceline}: paraId={val} >= 0x80000000"
+                        )
+
+                if val := elem.get(durable_id_attr):
+                    if xml_file.name == "numbering.xml":
+                        try:
+                            if self._parse_id_value(val, base=10) >= 0x7FFFFFFF:
+                                errors.append(
+                                    f"  {xml_file.name}:{elem.sourceline}: "
+                                    f"durableId={val} >= 0x7FFFFFFF"
+                                )
+                        except ValueError:
+                            errors.append(
+                                f"  {xml_file.name}:{elem.sourceline}: "
+                                f"durableId={val} must be decimal in numbering.xml"
+                            )
+                    else:
+                        if self._parse_id_value(val, base=16) >= 0x7FFFFFFF:
+                            errors.append(
+                                f"  {xml_file.name}:{elem.sourceline}: "
+                                f"durableId={val} >= 0x7FFFFFFF"
+                            )
+        except Exception:
+            pass
+
+        return errors
+
     def validate_comment_markers(self):
         errors = []
 
@@ -312,27 +351,12 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             return True
 
         try:
-            doc_root = lxml.etree.parse(str(document_xml)).getroot()
-            namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-            range_starts = {
-                elem.get(f"{{{self.WORD_2006_NAMESPACE}}}id")
-                for elem in doc_root.xpath(
-                    ".//w:commentRangeStart", namespaces=namespaces
-                )
-            }
-            range_ends = {
-                elem.get(f"{{{self.WORD_2006_NAMESPACE}}}id")
-                for elem in doc_root.xpath(
-                    ".//w:commentRangeEnd", namespaces=namespaces
-                )
-            }
-            references = {
-                elem.get(f"{{{self.WORD_2006_NAMESPACE}}}id")
-                for elem in doc_root.xpath(
-                    ".//w:commentReference", namespaces=namespaces
-                )
-            }
+            markers = self._cached("comment_markers", document_xml, self._comment_markers)
+            if "error" in markers:
+                raise ValueError(markers["error"])
+            range_starts = set(markers["commentRangeStart"])
+            range_ends = set(markers["commentRangeEnd"])
+            references = set(markers["commentReference"])
 
             orphaned_ends = range_ends - range_starts
             for comment_id in sorted(
@@ -352,13 +376,10 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
             comment_ids = set()
             if comments_xml and comments_xml.exists():
-                comments_root = lxml.etree.parse(str(comments_xml)).getroot()
-                comment_ids = {
-                    elem.get(f"{{{self.WORD_2006_NAMESPACE}}}id")
-                    for elem in comments_root.xpath(
-                        ".//w:comment", namespaces=namespaces
-                    )
-                }
+                comments = self._cached("comments", comments_xml, self._comment_markers)
+                if "error" in comments:
+                    raise ValueError(comments["error"])
+                comment_ids = set(comments["comment"])
 
                 marker_ids = range_starts | range_ends | references
                 invalid_refs = marker_ids - comment_ids
@@ -383,6 +404,25 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All comment markers properly paired")
             return True
 
+    def _comment_markers(self, xml_file):
+        """IDs of the comment elements and markers in a part, by element name."""
+        try:
+            root = self._parse(xml_file).getroot()
+        except Exception as e:
+            return {"error": str(e)}
+
+        id_attr = f"{{{self.WORD_2006_NAMESPACE}}}id"
+        markers = {}
+        for name in (
+            "comment",
+            "commentRangeStart",
+            "commentRangeEnd",
+            "commentReference",
+        ):
+            elements = root.iter(f"{{{self.WORD_2006_NAMESPACE}}}{name}")
+            markers[name] = list(dict.fromkeys(elem.get(id_attr) for elem in elements))
+        return markers
+
     def repair(self) -> int:
         repairs = super().repair()
         repairs += self.repair_durableId()
@@ -435,6 +475,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
                 if modified:
                     xml_file.write_bytes(dom.toxml(encoding="UTF-8"))
+                    self._invalidate(xml_file)
 
             except Exception:
                 pass